@@ -1,8 +1,9 @@
 # file: add_customdata_structure.py
-import json
 from pathlib import Path
 from datetime import date
 
+import json_codec
+
 DATA_FILE = Path("data/bills_119.json")
 
 # Default structure for new customData fields
@@ -55,16 +56,14 @@ def main():
         print(f"ERROR: {DATA_FILE} not found.")
         return
     
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        bills = json.load(f)
+    bills = json_codec.load_file(DATA_FILE)
 
     updated_count = 0
     for bill_id, bill_data in bills.items():
         bill_data["customData"] = merge_customdata(bill_data.get("customData", {}))
         updated_count += 1
 
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(bills, f, indent=2)
+    json_codec.write_file_atomic(bills, DATA_FILE)
 
     print(f"Updated {updated_count} bills with new customData structure.")
 
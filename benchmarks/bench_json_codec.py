@@ -0,0 +1,71 @@
+# benchmarks/bench_json_codec.py
+# Load/save timings for each installed JSON backend on a synthetic DB.
+#
+#   python -m benchmarks.bench_json_codec --bills 8000 --repeat 5
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import json_codec
+from benchmarks.synthetic_db import make_synthetic_db
+
+
+def _best_of(fn, repeat: int) -> tuple[float, float]:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), statistics.median(times)
+
+
+def bench_backend(name: str, db: dict, path: Path, repeat: int) -> dict:
+    loads, dumps = json_codec.get_backend(name)
+
+    def save():
+        with open(path, "wb") as f:
+            f.write(dumps(db, True))
+
+    def load():
+        with open(path, "rb") as f:
+            return loads(f.read())
+
+    save_min, save_med = _best_of(save, repeat)
+    load_min, load_med = _best_of(load, repeat)
+    if load() != db:
+        raise AssertionError(f"{name}: round-trip mismatch")
+    return {
+        "backend": name,
+        "bytes": path.stat().st_size,
+        "save_min": save_min, "save_med": save_med,
+        "load_min": load_min, "load_med": load_med,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON backends on a synthetic bills DB")
+    parser.add_argument("--bills", type=int, default=8000, help="Synthetic DB size (default 8000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (default 5)")
+    args = parser.parse_args()
+
+    db = make_synthetic_db(args.bills)
+    backends = json_codec.available_backends()
+    print(f"Synthetic DB: {len(db)} bills | backends: {', '.join(backends)} | active: {json_codec.BACKEND}")
+
+    header = f"{'Backend':9} {'Size MB':>8}  {'save min':>9} {'save med':>9}  {'load min':>9} {'load med':>9}"
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bills_bench.json"
+        for name in backends:
+            r = bench_backend(name, db, path, args.repeat)
+            print(f"{name:9} {r['bytes'] / 1e6:8.2f}  "
+                  f"{r['save_min'] * 1000:7.1f}ms {r['save_med'] * 1000:7.1f}ms  "
+                  f"{r['load_min'] * 1000:7.1f}ms {r['load_med'] * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_updater_load.py
+# Load-test updater.py against the local simulator: sweep --workers x --qps and
+# report bills/s, p50/p99 request latency and wasted retries for each phase.
+# Every phase runs as a real `updater.py` subprocess against a fresh temp DB.
+#
+#   python -m benchmarks.bench_updater_load --bills 600 --workers 2,6,12 --qps 5,20
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import json_codec
+from benchmarks.congress_sim import SimConfig, start_server
+from benchmarks.synthetic_db import make_synthetic_db
+
+ROOT = Path(__file__).resolve().parents[1]
+PHASES = ("list", "detail", "committees")
+
+
+def _csv(text: str, cast):
+    return [cast(x) for x in text.split(",") if x.strip()]
+
+
+def run_phase(phase: str, workers: int, qps: float, api_base: str, data_dir: Path) -> dict:
+    report = data_dir / f"report_{phase}.json"
+    env = dict(os.environ, CONGRESS_API_BASE=api_base, HILLWATCH_DATA_DIR=str(data_dir))
+    cmd = [sys.executable, str(ROOT / "updater.py"), "--phase", phase,
+           "--workers", str(workers), "--qps", str(qps), "--metrics-json", str(report)]
+    proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0 or not report.exists():
+        raise RuntimeError(f"{phase} failed (exit {proc.returncode}):\n{proc.stdout[-2000:]}\n{proc.stderr[-2000:]}")
+    return json_codec.load_file(report)
+
+
+def summarize(phase: str, report: dict) -> dict:
+    ph = next((p for p in report["phases"] if p["phase"] == phase), {"bills": 0, "seconds": 0.0})
+    ep = report["endpoints"].get(phase, {})
+    lat = ep.get("latency", {})
+    status = ep.get("status_codes", {})
+    ok = status.get("200", 0)
+    return {
+        "bills": ph["bills"],
+        "seconds": ph["seconds"],
+        "bills_per_s": ph["bills"] / ph["seconds"] if ph["seconds"] else 0.0,
+        "p50_ms": (lat.get("p50_seconds") or 0.0) * 1000,
+        "p99_ms": (lat.get("p99_seconds") or 0.0) * 1000,
+        "requests": ep.get("requests", 0),
+        # every attempt that didn't produce a usable 200 was wasted quota
+        "wasted": ep.get("requests", 0) - ok,
+        "limiter_wait_s": report["totals"]["limiter_wait_seconds"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep updater workers x qps against the local simulator")
+    parser.add_argument("--bills", type=int, default=600, help="Synthetic bills served (default 600)")
+    parser.add_argument("--workers", default="2,6,12", help="Comma-separated worker counts")
+    parser.add_argument("--qps", default="5,20", help="Comma-separated QPS caps")
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--rate-429", type=float, default=0.02)
+    parser.add_argument("--rate-5xx", type=float, default=0.01)
+    parser.add_argument("--phases", default=",".join(PHASES), help="Subset of list,detail,committees")
+    parser.add_argument("--json-out", default=None, help="Also write all results to this JSON file")
+    args = parser.parse_args()
+
+    db = make_synthetic_db(args.bills)
+    cfg = SimConfig(args.latency_ms, args.latency_sigma, args.rate_429, args.rate_5xx)
+    srv, api_base = start_server(db, cfg)
+    phases = [p for p in PHASES if p in _csv(args.phases, str)]
+    print(f"Simulator: {len(db)} bills at {api_base} | latency {args.latency_ms:.0f}ms "
+          f"(sigma {args.latency_sigma}) | 429 {args.rate_429:.1%} | 5xx {args.rate_5xx:.1%}")
+
+    header = (f"{'workers':>7} {'qps':>6} {'phase':10} {'bills':>6} {'bills/s':>8} "
+              f"{'p50 ms':>8} {'p99 ms':>8} {'reqs':>6} {'wasted':>6} {'lim wait s':>10}")
+    print(header)
+    print("-" * len(header))
+
+    results = []
+    try:
+        for workers in _csv(args.workers, int):
+            for qps in _csv(args.qps, float):
+                with tempfile.TemporaryDirectory() as tmp:
+                    data_dir = Path(tmp)
+                    # list must populate the DB even when only later phases are measured
+                    for phase in PHASES:
+                        if phase not in phases and phase != "list":
+                            continue
+                        r = summarize(phase, run_phase(phase, workers, qps, api_base, data_dir))
+                        if phase not in phases:
+                            continue
+                        results.append({"workers": workers, "qps": qps, "phase": phase, **r})
+                        print(f"{workers:7} {qps:6.1f} {phase:10} {r['bills']:6} {r['bills_per_s']:8.2f} "
+                              f"{r['p50_ms']:8.1f} {r['p99_ms']:8.1f} {r['requests']:6} {r['wasted']:6} "
+                              f"{r['limiter_wait_s']:10.1f}")
+    finally:
+        srv.shutdown()
+
+    print(f"\nSimulator served: {srv.counts}")
+    if args.json_out:
+        json_codec.write_file({"config": vars(args), "results": results}, args.json_out)
+
+
+if __name__ == "__main__":
+    main()
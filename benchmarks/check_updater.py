@@ -0,0 +1,92 @@
+# benchmarks/check_updater.py
+# Regression checks for updater.py against the local simulator (no API quota).
+# Each check runs real `updater.py` subprocesses on a fresh temp DB and exits
+# non-zero on the first failure.
+#
+#   python -m benchmarks.check_updater            # all checks
+#   python -m benchmarks.check_updater --only daemon
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import json_codec
+from benchmarks.congress_sim import SimConfig, start_server
+from benchmarks.synthetic_db import make_synthetic_db
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_updater(args: list[str], api_base: str, data_dir: Path) -> dict:
+    """One updater.py run; returns its JSON run report."""
+    report = data_dir / "report.json"
+    if report.exists():
+        report.unlink()
+    env = dict(os.environ, CONGRESS_API_BASE=api_base, HILLWATCH_DATA_DIR=str(data_dir))
+    cmd = [sys.executable, str(ROOT / "updater.py"), *args, "--metrics-json", str(report)]
+    proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0 or not report.exists():
+        raise RuntimeError(f"{' '.join(args)} failed (exit {proc.returncode}):\n"
+                           f"{proc.stdout[-2000:]}\n{proc.stderr[-2000:]}")
+    return json_codec.load_file(report)
+
+
+def check_daemon_unchanged(api_base: str, data_dir: Path, bills: int):
+    """A list poll over fully enriched, unchanged bills must not flag (or reschedule) any of them."""
+    for phase in ("list", "detail", "committees"):
+        run_updater(["--phase", phase, "--workers", "8", "--qps", "200"], api_base, data_dir)
+    report = run_updater(["--daemon", "--daemon-minutes", "0.1", "--workers", "8", "--qps", "200"],
+                         api_base, data_dir)
+    daemon = next(p for p in report["phases"] if p["phase"] == "daemon")
+    assert daemon["list_polls"] > 0, f"daemon never polled the list: {daemon}"
+    assert daemon["new"] == 0 and daemon["changed"] == 0, \
+        f"unchanged bills were flagged by the list poll: {daemon}"
+    print(f"  daemon: {daemon['list_polls']} list polls over {bills} enriched bills, 0 new, 0 changed")
+
+
+def check_plan_list_requests(api_base: str, data_dir: Path, bills: int):
+    """--dry-run's list request estimate equals what a list run then sends (DB already populated)."""
+    import updater_plan
+    from config import BILL_TYPES, DB_PATH
+
+    run_updater(["--phase", "list", "--qps", "200"], api_base, data_dir)
+    db = json_codec.load_file(data_dir / DB_PATH.name)
+    plan = updater_plan.plan_run(db, list(BILL_TYPES), ["list"], workers=1, qps=200)
+    planned = plan["phases"][0]["requests"]
+    report = run_updater(["--phase", "list", "--qps", "200"], api_base, data_dir)
+    sent = report["endpoints"]["list"]["requests"]
+    assert planned == sent, f"dry run planned {planned} list requests, the run sent {sent}"
+    print(f"  plan: {planned} list requests planned, {sent} sent")
+
+
+CHECKS = {
+    "daemon": check_daemon_unchanged,
+    "plan": check_plan_list_requests,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Updater regression checks against the local simulator")
+    parser.add_argument("--bills", type=int, default=900, help="Synthetic bills served (default 900)")
+    parser.add_argument("--only", choices=sorted(CHECKS), default=None, help="Run a single check")
+    args = parser.parse_args()
+
+    db = make_synthetic_db(args.bills)
+    srv, api_base = start_server(db, SimConfig(latency_ms=2.0, latency_sigma=0.0))
+    try:
+        for name, check in CHECKS.items():
+            if args.only and name != args.only:
+                continue
+            print(f"[check] {name}")
+            with tempfile.TemporaryDirectory() as tmp:
+                check(api_base, Path(tmp), len(db))
+    finally:
+        srv.shutdown()
+    print("All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
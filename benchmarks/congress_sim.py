@@ -0,0 +1,213 @@
+# benchmarks/congress_sim.py
+# Local stand-in for the Congress.gov endpoints updater.py hits:
+#   GET /v3/bill/{congress}/{type}?limit=&offset=        (paginated list)
+#   GET /v3/bill/{congress}/{type}/{number}              (detail)
+#   GET /v3/bill/{congress}/{type}/{number}/committees   (committees)
+# Data comes from the synthetic generator or a fixture DB (data/bills_119.json shape).
+# Latency is lognormal around a median; 429/5xx are injected at configurable rates.
+#
+#   python -m benchmarks.congress_sim --bills 2000 --latency-ms 120 --rate-429 0.02
+#   CONGRESS_API_BASE=http://127.0.0.1:8765/v3 python updater.py --phase list
+
+import argparse
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import json_codec
+from benchmarks.synthetic_db import make_synthetic_db
+
+MAX_PAGE = 250
+
+
+class SimConfig:
+    def __init__(self, latency_ms: float = 80.0, latency_sigma: float = 0.5,
+                 rate_429: float = 0.0, rate_5xx: float = 0.0, retry_after: float | None = None,
+                 seed: int = 7):
+        self.latency_ms = latency_ms          # median latency
+        self.latency_sigma = latency_sigma    # lognormal shape; 0 = fixed latency
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after        # seconds sent in Retry-After on 429s
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def draw(self) -> tuple[float, int | None]:
+        """(latency seconds, injected status or None)."""
+        with self.rng_lock:
+            if self.latency_sigma > 0:
+                lat = self.latency_ms / 1000.0 * math.exp(self.rng.gauss(0.0, self.latency_sigma))
+            else:
+                lat = self.latency_ms / 1000.0
+            r = self.rng.random()
+        if r < self.rate_429:
+            return lat, 429
+        if r < self.rate_429 + self.rate_5xx:
+            return lat, 503
+        return lat, None
+
+
+class SimData:
+    """API-shaped payloads built once from a {billId: record} DB."""
+    def __init__(self, db: dict, base_url: str):
+        self.by_type: dict[str, list[dict]] = {}
+        self.detail: dict[tuple[str, str], dict] = {}
+        self.committees: dict[tuple[str, str], dict] = {}
+        self.base_url = base_url
+        for rec in db.values():
+            cg = rec.get("congressGovData") or {}
+            bt = (cg.get("billType") or "").lower()
+            num = str(cg.get("billNumber") or "")
+            if not bt or not num:
+                continue
+            congress = cg.get("congress")
+            self.by_type.setdefault(bt, []).append({
+                "congress": congress,
+                "type": bt.upper(),
+                "number": num,
+                "title": cg.get("title"),
+                "originChamber": cg.get("originChamber"),
+                "latestAction": {"actionDate": cg.get("latestActionDate"), "text": cg.get("latestActionText")},
+                "updateDate": cg.get("updateDate"),
+                "updateDateIncludingText": cg.get("updateDateIncludingText"),
+                "url": f"{base_url}/bill/{congress}/{bt}/{num}?format=json",
+            })
+            self.detail[(bt, num)] = {"bill": {
+                "congress": congress, "type": bt.upper(), "number": num,
+                "title": cg.get("title"),
+                "introducedDate": cg.get("introducedDate"),
+                "sponsors": [{
+                    "fullName": cg.get("sponsorFullName"),
+                    "party": cg.get("sponsorParty"),
+                    "state": cg.get("sponsorState"),
+                    "district": cg.get("sponsorDistrict"),
+                }],
+            }}
+            committees = []
+            if cg.get("currentCommitteeName"):
+                c = {"name": cg["currentCommitteeName"], "chamber": cg.get("originChamber"),
+                     "currentReferrals": True}
+                if cg.get("currentSubcommitteeName"):
+                    c["subcommittee"] = [{"name": cg["currentSubcommitteeName"]}]
+                committees.append(c)
+            self.committees[(bt, num)] = {"committees": committees}
+        for items in self.by_type.values():
+            # API lists newest updates first
+            items.sort(key=lambda it: it.get("updateDate") or "", reverse=True)
+
+    def route(self, path: str, query: dict) -> tuple[int, dict]:
+        segs = [p for p in path.split("/") if p]
+        if segs and segs[0] == "v3":
+            segs = segs[1:]
+        if len(segs) < 3 or segs[0] != "bill":
+            return 404, {"error": "Unknown route"}
+        bt = segs[2].lower()
+        if len(segs) == 3:
+            items = self.by_type.get(bt, [])
+            limit = min(int((query.get("limit") or ["20"])[0]), MAX_PAGE)
+            offset = int((query.get("offset") or ["0"])[0])
+            page = items[offset: offset + limit]
+            pagination = {"count": len(items)}
+            if offset + limit < len(items):
+                pagination["next"] = f"{self.base_url}/bill/{segs[1]}/{bt}?offset={offset + limit}&limit={limit}"
+            return 200, {"bills": page, "pagination": pagination}
+        key = (bt, segs[3])
+        if len(segs) == 4 and key in self.detail:
+            return 200, self.detail[key]
+        if len(segs) == 5 and segs[4] == "committees" and key in self.committees:
+            return 200, self.committees[key]
+        return 404, {"error": f"No bill matches {path}"}
+
+
+class SimServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, addr, data: SimData, cfg: SimConfig):
+        super().__init__(addr, SimHandler)
+        self.data = data
+        self.cfg = cfg
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "injected_429": 0, "injected_5xx": 0}
+
+
+class SimHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like the real API behind requests.Session
+    disable_nagle_algorithm = True  # otherwise header/body writes stall ~40ms on delayed ACKs
+
+    def do_GET(self):
+        srv: SimServer = self.server
+        parts = urlsplit(self.path)
+        latency, injected = srv.cfg.draw()
+        time.sleep(latency)
+        with srv.lock:
+            srv.counts["requests"] += 1
+            if injected == 429:
+                srv.counts["injected_429"] += 1
+            elif injected:
+                srv.counts["injected_5xx"] += 1
+
+        headers = {}
+        if injected:
+            status, payload = injected, {"error": "injected"}
+            if injected == 429 and srv.cfg.retry_after is not None:
+                headers["Retry-After"] = str(srv.cfg.retry_after)
+        else:
+            status, payload = srv.data.route(parts.path, parse_qs(parts.query))
+
+        body = json_codec.dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def start_server(db: dict, cfg: SimConfig, host: str = "127.0.0.1", port: int = 0) -> tuple[SimServer, str]:
+    """Start in a background thread. Returns (server, api_base like http://host:port/v3)."""
+    # bind first so the real port is known for pagination/next URLs
+    srv = SimServer((host, port), SimData({}, ""), cfg)
+    base = f"http://{host}:{srv.server_address[1]}/v3"
+    srv.data = SimData(db, base)
+    threading.Thread(target=srv.serve_forever, name="congress-sim", daemon=True).start()
+    return srv, base
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Congress.gov API simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--bills", type=int, default=2000, help="Synthetic bill count (ignored with --fixture)")
+    parser.add_argument("--fixture", default=None, help="Serve bills from a DB JSON file instead")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Lognormal sigma (0 = fixed)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After seconds on 429")
+    args = parser.parse_args()
+
+    db = json_codec.load_file(args.fixture) if args.fixture else make_synthetic_db(args.bills)
+    cfg = SimConfig(args.latency_ms, args.latency_sigma, args.rate_429, args.rate_5xx, args.retry_after)
+    srv, base = start_server(db, cfg, args.host, args.port)
+    print(f"Serving {len(db)} bills at {base}  (Ctrl+C to stop)")
+    print(f"  CONGRESS_API_BASE={base} python updater.py --phase list")
+    try:
+        while True:
+            time.sleep(5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.shutdown()
+        print(f"Served: {srv.counts}")
+
+
+if __name__ == "__main__":
+    main()
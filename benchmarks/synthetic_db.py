@@ -0,0 +1,94 @@
+# benchmarks/synthetic_db.py
+# Deterministic synthetic bills DB shaped like data/bills_119.json.
+
+import copy
+import random
+from datetime import date, timedelta
+
+from config import CONGRESS_NUMBER, API_BASE, BILL_TYPES
+from bill_utils import build_congress_gov_url, compute_content_hash, DEFAULT_CUSTOMDATA
+
+WORDS = (
+    "energy water health tax reform veterans medical center act security border "
+    "education housing small business innovation trade tariff climate farm food "
+    "defense cyber privacy broadband rural transit highway safety labor pension "
+    "financial services banking insurance drug pricing research grant nuclear oil"
+).split()
+
+COMMITTEES = [
+    "Energy and Natural Resources Committee",
+    "Finance Committee",
+    "Judiciary Committee",
+    "Ways and Means Committee",
+    "Energy and Commerce Committee",
+    "Armed Services Committee",
+    "Veterans' Affairs Committee",
+    "Agriculture Committee",
+    "Education and Workforce Committee",
+    "Homeland Security Committee",
+]
+
+STATES = ["CA", "TX", "NY", "FL", "CT", "OH", "PA", "WA", "GA", "AZ", "MI", "UT"]
+LAST_NAMES = ["Smith", "Blumenthal", "Lee", "Garcia", "Johnson", "Murphy", "Cruz",
+              "Warren", "Scott", "Kim", "Young", "Baldwin", "Hawley", "Padilla"]
+
+ORIGIN = {"hr": "House", "hjres": "House", "hconres": "House",
+          "s": "Senate", "sjres": "Senate", "sconres": "Senate"}
+
+
+def _day(rng: random.Random, start: date, span_days: int) -> str:
+    return (start + timedelta(days=rng.randrange(span_days))).isoformat()
+
+
+def make_congress_data(rng: random.Random, bill_type: str, number: int) -> dict:
+    """One congressGovData block with every field the updater fills in."""
+    bt = bill_type.upper()
+    introduced = _day(rng, date(2025, 1, 3), 300)
+    latest = max(introduced, _day(rng, date(2025, 1, 3), 320))
+    chamber = ORIGIN[bill_type]
+    title_words = rng.sample(WORDS, rng.randint(4, 10))
+    party = rng.choice("DRI")
+    state = rng.choice(STATES)
+    committee = rng.choice(COMMITTEES) if rng.random() < 0.9 else None
+    cg = {
+        "billId": f"{bt}_{number}",
+        "congress": CONGRESS_NUMBER,
+        "billType": bt,
+        "billNumber": str(number),
+        "title": " ".join(title_words).capitalize() + " Act of 2025",
+        "originChamber": chamber,
+        "introducedDate": introduced,
+        "sponsorFullName": f"{'Rep.' if chamber == 'House' else 'Sen.'} {rng.choice(LAST_NAMES)}, "
+                           f"{rng.choice(WORDS).capitalize()} [{party}-{state}]",
+        "sponsorParty": party,
+        "sponsorState": state,
+        "sponsorDistrict": rng.randint(1, 30) if chamber == "House" else None,
+        "currentCommitteeName": committee,
+        "currentSubcommitteeName": None,
+        "latestActionText": f"Referred to the {committee or 'Committee on ' + rng.choice(WORDS)}.",
+        "latestActionDate": latest,
+        "updateDate": latest,
+        "updateDateIncludingText": latest,
+        "sourceUrl": f"{API_BASE}/bill/{CONGRESS_NUMBER}/{bill_type}/{number}?format=json",
+        "congressGovUrl": build_congress_gov_url(CONGRESS_NUMBER, bill_type, number),
+    }
+    cg["contentHash"] = compute_content_hash(cg)
+    cg["committeeLastActionSeen"] = latest
+    return cg
+
+
+def make_synthetic_db(n_bills: int = 8000, seed: int = 119, watch_ratio: float = 0.02) -> dict:
+    """Build a {billId: record} dict of n_bills, spread across BILL_TYPES."""
+    rng = random.Random(seed)
+    db = {}
+    counters = {bt: 0 for bt in BILL_TYPES}
+    weights = [0.55, 0.35, 0.03, 0.03, 0.02, 0.02][: len(BILL_TYPES)]
+    for _ in range(n_bills):
+        bt = rng.choices(BILL_TYPES, weights=weights)[0]
+        counters[bt] += 1
+        cg = make_congress_data(rng, bt, counters[bt])
+        cd = copy.deepcopy(DEFAULT_CUSTOMDATA)
+        if rng.random() < watch_ratio:
+            cd["Review"]["WatchList"] = True
+        db[cg["billId"]] = {"congressGovData": cg, "customData": cd}
+    return db
@@ -1,12 +1,10 @@
 import requests
-import json
 import hashlib
-import os
 import copy
-from pathlib import Path
 from config import (
     CONGRESS_API_KEY, API_BASE, SLUG_MAP, DB_PATH, CEI_EXPERT_OPTIONS
 )
+import json_codec
 
 
 # =============================
@@ -22,7 +20,7 @@ def get_json(url, params=None):
 
     r = requests.get(url, params=params, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return json_codec.loads(r.content)
 
 # =============================
 # URL HELPERS
@@ -40,16 +38,12 @@ def build_congress_gov_url(congress, bill_type, bill_number):
 def load_db():
     """Load the JSON database or return an empty dict."""
     if DB_PATH.exists():
-        with open(DB_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_codec.load_file(DB_PATH)
     return {}
 
 def save_db(db):
     """Save the JSON database atomically."""
-    temp_file = DB_PATH.with_suffix(".tmp")
-    with open(temp_file, "w", encoding="utf-8") as f:
-        json.dump(db, f, indent=2)
-    os.replace(temp_file, DB_PATH)
+    json_codec.write_file_atomic(db, DB_PATH)
 
 # =============================
 # CUSTOM DATA SCHEMA
@@ -122,9 +116,14 @@ def ensure_customdata_schema(custom_data: dict | None) -> dict:
 # MERGE & HASH HELPERS
 # =============================
 
+# updater bookkeeping stored alongside the data; never part of the hash, so a record
+# hashes the same whether it comes fresh from a list item or from an enriched entry
+HASH_EXCLUDED_KEYS = ("contentHash", "committeeLastActionSeen")
+
 def compute_content_hash(data_fields):
     """Compute SHA-256 hash from key Congress.gov data fields."""
-    payload = "|".join(str(data_fields.get(k, "")) for k in sorted(data_fields.keys()))
+    keys = sorted(k for k in data_fields.keys() if k not in HASH_EXCLUDED_KEYS)
+    payload = "|".join(str(data_fields.get(k, "")) for k in keys)
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 def merge_bill_data(existing_bill, new_congress_data):
@@ -0,0 +1,166 @@
+# cassette.py
+# Record/replay of whole updater runs.
+#
+# A cassette is gzip-compressed NDJSON:
+#   line 1: {"cassette": 1, "recordedAt": ..., "apiBase": ..., "snapshot": bool}
+#   line 2: starting DB snapshot (only when snapshot is true)
+#   then one line per HTTP attempt:
+#     {"t": offset_s, "dur": latency_s, "path": ..., "params": {...},
+#      "status": 200, "headers": {...}, "body": "..."}   or   {..., "error": "ConnectionError", "message": ...}
+#
+# Requests are keyed by URL path + params (api_key/format dropped), so a cassette
+# recorded against api.congress.gov replays against any API_BASE. Repeated keys
+# (e.g. a 429 followed by a 200) are served back in recorded order.
+
+import gzip
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import json_codec
+
+FORMAT_VERSION = 1
+IGNORED_PARAMS = {"api_key", "format"}
+KEPT_HEADERS = ("Retry-After", "Content-Type")
+
+
+def request_key(url: str, params: dict | None) -> str:
+    path = urlsplit(url).path.rstrip("/")
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k not in IGNORED_PARAMS)
+    return path + ("?" + "&".join(f"{k}={v}" for k, v in items) if items else "")
+
+
+# =========================
+# Recording
+# =========================
+
+class RecordingSession:
+    """Wraps a requests.Session; every get() is forwarded and appended to the cassette."""
+    def __init__(self, inner, path, api_base: str = "", db_snapshot: dict | None = None):
+        self.inner = inner
+        self.path = path
+        self.lock = threading.Lock()
+        self.t0 = time.perf_counter()
+        self.count = 0
+        self.fh = gzip.open(path, "wb", compresslevel=6)
+        header = {
+            "cassette": FORMAT_VERSION,
+            "recordedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "apiBase": api_base,
+            "snapshot": db_snapshot is not None,
+        }
+        self._write(header)
+        if db_snapshot is not None:
+            self._write(db_snapshot)
+
+    def _write(self, obj):
+        self.fh.write(json_codec.dumps(obj) + b"\n")
+
+    def get(self, url, params=None, timeout=None, **kw):
+        started = time.perf_counter()
+        entry = {
+            "t": round(started - self.t0, 4),
+            "path": urlsplit(url).path,
+            "params": {k: v for k, v in (params or {}).items() if k not in IGNORED_PARAMS},
+        }
+        try:
+            resp = self.inner.get(url, params=params, timeout=timeout, **kw)
+        except Exception as e:
+            entry.update(dur=round(time.perf_counter() - started, 4), error=type(e).__name__, message=str(e))
+            self._append(entry)
+            raise
+        entry.update(
+            dur=round(time.perf_counter() - started, 4),
+            status=resp.status_code,
+            headers={h: resp.headers[h] for h in KEPT_HEADERS if h in resp.headers},
+            body=resp.content.decode("utf-8", errors="replace"),
+        )
+        self._append(entry)
+        return resp
+
+    def _append(self, entry):
+        with self.lock:
+            self._write(entry)
+            self.count += 1
+
+    def close(self):
+        with self.lock:
+            self.fh.close()
+
+
+# =========================
+# Replay
+# =========================
+
+class ReplayResponse:
+    """Just enough of requests.Response for updater_http.session_get_json."""
+    def __init__(self, status_code: int, body: str, headers: dict | None = None):
+        self.status_code = status_code
+        self.content = body.encode("utf-8")
+        self.headers = CaseInsensitiveDict(headers or {})
+
+
+class ReplaySession:
+    """
+    Serves recorded responses instead of hitting the network.
+    timing="fast" returns immediately; timing="original" sleeps each recorded latency.
+    Unrecorded requests get a 404 and are counted in `misses`.
+    """
+    def __init__(self, path, timing: str = "fast"):
+        if timing not in ("fast", "original"):
+            raise ValueError(f"Unknown replay timing: {timing}")
+        self.timing = timing
+        self.lock = threading.Lock()
+        self.queues: dict[str, deque] = defaultdict(deque)
+        self.last: dict[str, dict] = {}
+        self.header: dict = {}
+        self.snapshot: dict | None = None
+        self.served = 0
+        self.misses = 0
+        self._load(path)
+
+    def _load(self, path):
+        with gzip.open(path, "rb") as fh:
+            self.header = json_codec.loads(fh.readline())
+            if self.header.get("cassette") != FORMAT_VERSION:
+                raise ValueError(f"{path}: not a v{FORMAT_VERSION} cassette")
+            if self.header.get("snapshot"):
+                self.snapshot = json_codec.loads(fh.readline())
+            n = 0
+            for line in fh:
+                e = json_codec.loads(line)
+                self.queues[request_key(e["path"], e.get("params"))].append(e)
+                n += 1
+        self.total = n
+
+    def get(self, url, params=None, timeout=None, **kw):
+        key = request_key(url, params)
+        with self.lock:
+            q = self.queues.get(key)
+            if q:
+                entry = q.popleft()
+                self.last[key] = entry
+            else:
+                # more calls than recorded (e.g. a retry that didn't happen at record time):
+                # repeat the final outcome for that key
+                entry = self.last.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.served += 1
+        if entry is None:
+            return ReplayResponse(404, '{"error": "not in cassette"}')
+        if self.timing == "original":
+            time.sleep(entry.get("dur", 0.0))
+        if "error" in entry:
+            raise requests.ConnectionError(f"[replay] {entry['error']}: {entry.get('message', '')}")
+        return ReplayResponse(entry["status"], entry.get("body", ""), entry.get("headers"))
+
+    def remaining(self) -> int:
+        with self.lock:
+            return sum(len(q) for q in self.queues.values())
@@ -8,7 +8,7 @@ CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY")
 
 # Base folder paths
 BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.getenv("HILLWATCH_DATA_DIR") or BASE_DIR / "data")
 DB_PATH = DATA_DIR / "bills_119.json"
 
 # Congress session to track
@@ -17,8 +17,42 @@ CONGRESS_NUMBER = 119
 # Bill types to track
 BILL_TYPES = ["hr", "s", "hjres", "sjres", "hconres", "sconres"]
 
-# API base
-API_BASE = "https://api.congress.gov/v3"
+# API base (override to point the updater at a local simulator, see benchmarks/congress_sim.py)
+API_BASE = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3").rstrip("/")
+
+# Congress.gov API key limit (requests per rolling hour); used by updater.py --dry-run
+API_HOURLY_QUOTA = 5000
+
+# Updater HTTP resilience
+HTTP_RETRIES = 4                  # attempts per request (first try included)
+RETRY_BASE_SECONDS = 1.0          # full-jitter backoff: sleep ~ U(0, min(cap, base * 2^n))
+RETRY_CAP_SECONDS = 16.0
+RETRY_BUDGET_RATIO = 0.2          # run-wide: retries may not exceed 20% of first attempts...
+RETRY_BUDGET_MIN = 20             # ...plus this many, so an outage can't multiply load
+BREAKER_THRESHOLD = 8             # consecutive failures (any worker) before all workers pause
+BREAKER_COOLDOWN_SECONDS = 30.0   # first pause; doubles on each failed probe (max 8x)
+
+# Enrichment order for detail/committees: WatchList bills, then bills acted on
+# within this many days (newest first), then everything else
+RECENT_ACTION_DAYS = 30
+
+# Daemon mode (updater.py --daemon): activity-aware polling schedule
+DAEMON_LIST_POLL_MINUTES = 15         # how often each bill type's list is checked for new/updated bills
+DAEMON_MIN_INTERVAL_HOURS = 2.0       # re-poll interval for a bill acted on today...
+DAEMON_DOUBLING_DAYS = 14.0           # ...doubling for every 14 days without action...
+DAEMON_MAX_INTERVAL_DAYS = 14.0       # ...up to this cap for dormant bills
+DAEMON_SAVE_MINUTES = 5               # flush DB + schedule at most this often when dirty
+DAEMON_SCHEDULE_PATH = DATA_DIR / "daemon_schedule.json"
+
+# Bills that still failed after retries (replay with: updater.py --retry-failed)
+FAILED_BILLS_PATH = DATA_DIR / "failed_bills.json"
+
+# Desktop GUI: saved smart views (extra tabs)
+SAVED_VIEWS_PATH = DATA_DIR / "saved_views.json"
+
+# Desktop GUI: latency tracer (opt-in: HILLWATCH_TRACE=1 or Debug menu); trace written on exit
+GUI_TRACE_ENABLED = os.getenv("HILLWATCH_TRACE", "") not in ("", "0")
+GUI_TRACE_PATH = DATA_DIR / "logs" / "gui_latency.json"
 
 # Congress.gov slug mapping for URLs
 SLUG_MAP = {
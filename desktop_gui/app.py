@@ -1,56 +1,69 @@
 # desktop_gui/app.py
 # HillWatch v3 desktop GUI: tabs + tables on the left, detail pane on the right.
-# Dynamic routing across WatchList / Rejected / Complete. Search, filters, load-more.
+# Dynamic routing across WatchList / Rejected / Complete. Search, filters, virtual-scrolling tables.
 
+import heapq
+import os
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 
 from desktop_gui.table_view import TableView
 from desktop_gui.detail_panel import DetailPanel
+from desktop_gui.bulk_panel import BulkPanel, expert_options
+from desktop_gui.export_dialog import ExportDialog
+from desktop_gui.facet_index import FacetIndex
 from desktop_gui.filter_dialog import FilterDialog
+from desktop_gui.latency import TRACER, traced
+from desktop_gui.query import Indexes, parse_query
+from desktop_gui.rank_index import TOP_K, RankIndex
+from desktop_gui.saved_views import content_key, load_saved_views, make_spec, save_saved_views, spec_filters
+from desktop_gui.search_index import SearchIndex
+from desktop_gui.tab_views import (
+    SortIndex,
+    SortedView,
+    TabMembership,
+    classify_watch_tab,
+    filter_predicate,
+    sort_key_fn,
+)
 
+from desktop_gui import data_access
 from desktop_gui.data_access import (
     load_db,
+    save_db_atomic,
     set_watchlist_and_save,
     set_custom_field_and_save,
+    set_custom_fields_bulk_and_save,
 )
+from export_bills import export_bills
 
 APP_TITLE = "HillWatch v3"
-START_LIMIT = 200
-LOAD_STEP = 200
-
-
-# ---------- Routing predicates ----------
-def classify_watch_tab(rec):
-    """
-    Returns: "complete" | "reject" | "watch" | None
-    Only bills with Review.WatchList == True get classified; others return None.
-    Rules (mutually exclusive):
-      - Complete: CEIExpertAcceptOrReject == True AND Final_Tracking_Done == True
-      - Rejected: CEIExpertAcceptOrReject == False AND Review_Done == True
-      - Watch:    all other watchlisted bills
-    """
-    cd = (rec or {}).get("customData", {}) or {}
-    r  = cd.get("Review", {}) or {}
-    f  = cd.get("FinalTracking", {}) or {}
-
-    if not bool(r.get("WatchList")):
-        return None
+TAB_KEYS = ("feed", "watch", "reject", "complete")
+SAVED_TAB_PREFIX = "view:"  # tab key of a saved view = prefix + its name
+SEARCH_DEBOUNCE_MS = 200   # wait for a pause in typing before searching
+SEARCH_POLL_MS = 25        # how often the Tk thread checks for finished searches
+LOAD_POLL_MS = 50          # how often the Tk thread checks on the background DB load
+FIRST_PAGE_ROWS = 200      # feed rows shown while the indexes are still being built
+DB_WATCH_MS = 2000         # how often to check whether the updater rewrote the DB file
+TRACE_READOUT_MS = 1000    # status-bar refresh while the latency tracer is on
+# direction a column header sorts by when first clicked (a second click flips it)
+HEADER_SORT_DEFAULT_DIR = {"title": "asc", "latestActionDate": "desc"}
 
-    cei_accept = r.get("CEIExpertAcceptOrReject")
-    review_done = bool(r.get("Review_Done"))
-    final_done = bool(f.get("Final_Tracking_Done"))
 
-    # Complete
-    if cei_accept is True and final_done is True:
-        return "complete"
+def db_file_stat():
+    """(mtime_ns, size) of the DB file, or None when it is missing."""
+    try:
+        st = os.stat(data_access.DB_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-    # Rejected (must be explicitly False AND review finished)
-    if cei_accept is False and review_done is True:
-        return "reject"
 
-    # Otherwise still in WatchList
-    return "watch"
+def _content_hash(rec):
+    cg = (rec or {}).get("congressGovData") or {}
+    return cg.get("contentHash") or cg
 
 
 # ---------- App ----------
@@ -60,25 +73,67 @@ class HillWatchApp(tk.Tk):
         self.title(APP_TITLE)
         self.geometry("1200x720")
 
-        # Data
-        self.db = load_db()  # dict: bill_id -> record
+        # Data (loaded + indexed on a background thread; see _start_load)
+        self.db = {}  # dict: bill_id -> record
+        self.search_index = SearchIndex()
+        self.sort_index = SortIndex()          # whole-DB order per sort field
+        self.facets = FacetIndex()             # Filters dialog options + counts
+        self.rank_index = RankIndex()          # BM25 term stats for "Rank by relevance"
+        self._hits_key = None
+        self._hits = None
+        self._loading = False
+        self._exporting = False
+        self._load_results = queue.Queue()
+        self._load_announce = False
+
+        # Watching the DB file for rewrites by the updater (merged in place, see _merge_db)
+        self._db_stat = None           # file stat as of our last load/merge/save
+        self._refreshing = False
+        self._watching = False
+        self._edited_ids = set()       # bills whose customData was edited here (never overwritten)
+
+        # Tab membership (watch/reject/complete) + lazily built per-tab views
+        self.membership = TabMembership(self.db, classify_watch_tab)
+        self.views = {t: None for t in TAB_KEYS}   # None = stale, rebuilt on first view
+        self._edit_version = 0         # bumped on any DB change (edits included)
+        self._cg_version = 0           # bumped only when congressGovData changes (load / merge)
+
+        # Saved smart views: extra tabs, each memoized as ((data version, content key), view)
+        self.saved_specs = {}          # tab key -> spec (see saved_views.py)
+        self.saved_cache = {}
+
+        # Background search (debounced; results come back through a queue polled with after())
+        self._pending_text = ""
+        self._search_after = None
+        self._search_gen = 0
+        self._search_started_gen = 0
+        self._search_results = queue.Queue()
+        self._search_polling = False
 
         # UI state
-        self.current_tab = "feed"      # "feed" | "watch" | "reject" | "complete"
-        self.current_limit = START_LIMIT
+        self.current_tab = "feed"      # "feed" | "watch" | "reject" | "complete" | "view:<name>"
         self.filters = {
             "text": "",
             "committees": set(),
             "sponsors": set(),
             "types": set(),            # HR,S,HJRES,SJRES,HCONRES,SCONRES
             "chambers": set(),         # House, Senate
+            "parties": set(),          # sponsorParty (D, R, I, ...)
+            "states": set(),           # sponsorState
             "date_field": "latestActionDate",  # or "introducedDate"
             "date_from": None,         # YYYY-MM-DD or None
             "date_to": None,           # YYYY-MM-DD or None
             "sort_field": "latestActionDate",  # or "introducedDate"
             "sort_dir": "desc",        # "desc" | "asc"
+            "rank": False,             # order search hits by relevance (top TOP_K) instead
         }
 
+        # Debug menu + latency status bar (shown only while tracing)
+        self._build_menu()
+        self.status_var = tk.StringVar(value="")
+        self.status_bar = ttk.Label(self, textvariable=self.status_var, anchor="w", padding=(8, 2))
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Main layout: left/right
         self.pw = ttk.Panedwindow(self, orient="horizontal")
         self.left = ttk.Frame(self.pw)
@@ -100,9 +155,128 @@ class HillWatchApp(tk.Tk):
             on_set_custom_field=self.on_set_custom_field,
         )
         self.detail.pack(fill="both", expand=True)
+        # takes the detail pane's place while several rows are selected
+        self.bulk = BulkPanel(self.right, on_apply=self.on_bulk_apply, on_clear=self._clear_multi)
+        self._bulk_shown = False
 
-        # Initial data fill
-        self.recompute_views()
+        if TRACER.enabled:
+            self._show_trace_bar()
+
+        # Window is up; the DB arrives in the background
+        self._start_load()
+
+    # ---------- Menu + latency tracer ----------
+    def _build_menu(self):
+        menubar = tk.Menu(self)
+        file_menu = tk.Menu(menubar, tearoff=False)
+        file_menu.add_command(label="Export…", command=self.on_export)
+        menubar.add_cascade(label="File", menu=file_menu)
+        debug = tk.Menu(menubar, tearoff=False)
+        self.trace_var = tk.BooleanVar(value=TRACER.enabled)
+        debug.add_checkbutton(label="Trace latency", variable=self.trace_var, command=self._on_trace_toggled)
+        debug.add_command(label="Save latency trace now", command=self._dump_trace)
+        debug.add_command(label="Reset latency trace", command=TRACER.reset)
+        menubar.add_cascade(label="Debug", menu=debug)
+        self.config(menu=menubar)
+
+    def _on_trace_toggled(self):
+        TRACER.enabled = bool(self.trace_var.get())
+        if TRACER.enabled:
+            self._show_trace_bar()
+        else:
+            self.status_bar.pack_forget()
+
+    def _show_trace_bar(self):
+        self.status_bar.pack(side="bottom", fill="x", before=self.pw)
+        self._update_trace_readout()
+
+    def _update_trace_readout(self):
+        if not TRACER.enabled:
+            return
+        self.status_var.set(TRACER.readout())
+        self.after(TRACE_READOUT_MS, self._update_trace_readout)
+
+    def _dump_trace(self, announce=True):
+        TRACER.meta.update(db=len(self.db), saved_views=len(self.saved_specs))
+        try:
+            path = TRACER.dump()
+        except Exception as e:
+            if announce:
+                messagebox.showerror("Latency trace", f"Could not write the trace:\n{e}")
+            return
+        if announce:
+            messagebox.showinfo("Latency trace", f"Wrote {path}")
+
+    def _on_close(self):
+        # the JSON trace is written on exit whenever anything was traced
+        if TRACER.last is not None:
+            self._dump_trace(announce=False)
+        self.destroy()
+
+    # ---------- Export (File menu) ----------
+    def on_export(self):
+        """Export the current tab as shown (or the whole DB) on a worker thread; see export_bills.py."""
+        if self._loading or self._exporting:
+            return
+        tab = self.current_tab
+        if tab in self.saved_specs:
+            view, _source = self._saved_view(tab)
+        else:
+            view = self.views.get(tab)
+            if view is None:
+                view = self.views[tab] = self._apply_search_and_filters(
+                    self._tab_source(tab), self.filters, self._search_hits())
+        title = self.nb.tab(self.nb.select(), "text")
+        stem = tab.split(":", 1)[-1].replace(" ", "_")
+        opts = ExportDialog(self, title, len(view), len(self.db), file_stem=stem).show()
+        if not opts:
+            return
+
+        # Row order is fixed here on the Tk thread; the worker only reads records.
+        # A shallow copy of the DB keeps a concurrent merge from swapping records under it.
+        if opts["scope"] == "tab":
+            bill_ids = view.ids()
+        else:
+            bill_ids = SortedView(self.db, list(self.db), self.filters, order=self.sort_index).ids()
+        db = dict(self.db)
+        progress = queue.Queue()
+
+        def work():
+            try:
+                n = export_bills(opts["path"], db, bill_ids, opts["columns"], fmt=opts["fmt"],
+                                 progress=lambda done, total: progress.put((done, total)))
+                progress.put(("done", n))
+            except Exception as e:
+                progress.put(("error", e))
+
+        self._exporting = True
+        self.progress["value"] = 0
+        self.progress.pack(side="left", padx=(8, 0), after=self.count_label)
+        threading.Thread(target=work, name="hillwatch-export", daemon=True).start()
+
+        def poll():
+            result = None
+            try:
+                while True:
+                    done, total = progress.get_nowait()
+                    if done in ("done", "error"):
+                        result = (done, total)
+                        break
+                    self.progress["value"] = 100 * done / max(total, 1)
+            except queue.Empty:
+                pass
+            if result is None:
+                self.after(LOAD_POLL_MS, poll)
+                return
+            self._exporting = False
+            self.progress.pack_forget()
+            kind, value = result
+            if kind == "error":
+                messagebox.showerror("Export failed", str(value))
+            else:
+                messagebox.showinfo("Export", f"Exported {value:,} bills to\n{opts['path']}")
+
+        self.after(LOAD_POLL_MS, poll)
 
     # ---------- Left: toolbar ----------
     def _build_left_toolbar(self):
@@ -110,7 +284,9 @@ class HillWatchApp(tk.Tk):
         top.pack(fill="x", padx=8, pady=(8, 4))
 
         self.count_var = tk.StringVar(value="Showing 0 of 0")
-        ttk.Label(top, textvariable=self.count_var).pack(side="left")
+        self.count_label = ttk.Label(top, textvariable=self.count_var)
+        self.count_label.pack(side="left")
+        self.progress = ttk.Progressbar(top, mode="determinate", maximum=100, length=120)  # shown while loading
 
         # spacer
         ttk.Label(top, text="  ").pack(side="left")
@@ -121,18 +297,34 @@ class HillWatchApp(tk.Tk):
         self.search_entry = ttk.Entry(top, textvariable=self.search_var, width=36)
         self.search_entry.pack(side="left")
         self.search_entry.bind("<KeyRelease>", self._on_search_changed)
+        self.rank_var = tk.BooleanVar(value=False)
+        self.rank_check = ttk.Checkbutton(top, text="Rank by relevance", variable=self.rank_var,
+                                          command=self._on_rank_toggled)
+        self.rank_check.pack(side="left", padx=(6, 0))
 
         # spacer
         ttk.Label(top, text="  ").pack(side="left")
 
         # Filter dialog
-        ttk.Button(top, text="Filters…", command=self.open_filters).pack(side="left", padx=(0, 8))
-
-        # Load more
-        ttk.Button(top, text="+200", command=self.on_load_more).pack(side="left")
+        self.filters_btn = ttk.Button(top, text="Filters…", command=self.open_filters)
+        self.filters_btn.pack(side="left", padx=(0, 8))
 
         # Reload updater (placeholder: we just pop a message; wire to your CLI if desired)
-        ttk.Button(top, text="Reload DB", command=self.on_reload_db).pack(side="right")
+        self.reload_btn = ttk.Button(top, text="Reload DB", command=self.on_reload_db)
+        self.reload_btn.pack(side="right")
+
+        # Saved views menu
+        self.views_btn = ttk.Menubutton(top, text="Views ▾")
+        self.views_menu = tk.Menu(self.views_btn, tearoff=False)
+        self.views_menu.add_command(label="Save current as view…", command=self.on_save_view)
+        self.views_menu.add_command(label="Delete current view", command=self.on_delete_view)
+        self.views_btn["menu"] = self.views_menu
+        self.views_btn.pack(side="right", padx=(0, 8))
+
+        # need the whole DB + indexes: disabled while loading
+        self._db_controls = (self.search_entry, self.rank_check, self.filters_btn, self.reload_btn, self.views_btn)
+        # edit the main tabs' query; a saved view's query is fixed (disabled on its tab)
+        self._query_controls = (self.search_entry, self.rank_check, self.filters_btn)
 
     # ---------- Left: tabs + tables ----------
     def _build_tabs_and_tables(self):
@@ -141,6 +333,7 @@ class HillWatchApp(tk.Tk):
 
         self.tabs = {}
         self.tables = {}
+        self.tab_order = list(TAB_KEYS)    # notebook index -> tab key
 
         for key, title in [
             ("feed", "Bills Feed"),
@@ -152,50 +345,445 @@ class HillWatchApp(tk.Tk):
             self.nb.add(frame, text=title)
             self.tabs[key] = frame
 
-            table = TableView(frame, on_select=self.on_select_row)
+            table = TableView(frame, on_select=self.on_select_row, on_sort=self.on_sort_column,
+                              on_selection=lambda ids, tab=key: self.on_selection_changed(tab, ids))
             table.pack(fill="both", expand=True)
             self.tables[key] = table
 
+        for spec in load_saved_views():
+            self._add_saved_tab(spec)
+
         self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
+    def _add_saved_tab(self, spec):
+        tab = SAVED_TAB_PREFIX + spec["name"]
+        frame = ttk.Frame(self.nb)
+        self.nb.add(frame, text=spec["name"])
+        self.tabs[tab] = frame
+        table = TableView(frame, on_select=self.on_select_row, on_sort=self.on_sort_column,
+                          on_selection=lambda ids: self.on_selection_changed(tab, ids))
+        table.pack(fill="both", expand=True)
+        self.tables[tab] = table
+        self.tab_order.append(tab)
+        self.saved_specs[tab] = spec
+        return tab
+
     # ---------- Events ----------
     def _on_tab_changed(self, _evt):
         idx = self.nb.index(self.nb.select())
-        self.current_tab = ["feed", "watch", "reject", "complete"][idx]
-        # reset limit when switching tabs (optional; comment if you prefer to keep)
-        self.current_limit = START_LIMIT
-        self.recompute_views()
+        self.current_tab = self.tab_order[idx]
+        self._sync_controls()
+        # views are kept between tab switches; a stale one is rebuilt here on first view
+        self._render_current()
+        self.on_selection_changed(self.current_tab, self.tables[self.current_tab].selected_ids())
 
-    def _on_search_changed(self, _evt):
-        self.filters["text"] = self.search_var.get().strip()
-        # when searching, reset limit to show the newest 200 matches
-        self.current_limit = START_LIMIT
-        self.recompute_views()
+    def _sync_controls(self):
+        """Enable/disable the toolbar for the loading state and the kind of tab shown."""
+        saved = self.current_tab in self.saved_specs
+        for w in self._db_controls:
+            off = self._loading or (saved and w in self._query_controls)
+            w.configure(state="disabled" if off else "normal")
+        self.views_menu.entryconfigure(1, state="normal" if saved else "disabled")
 
-    def on_load_more(self):
-        self.current_limit += LOAD_STEP
-        self.recompute_views()
+    def _on_search_changed(self, _evt):
+        text = self.search_var.get().strip()
+        if text == self._pending_text:
+            return  # arrows, shift, etc. — nothing to search
+        self._pending_text = text
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(SEARCH_DEBOUNCE_MS, self._start_search)
 
     def on_reload_db(self):
+        self._start_refresh(announce=True)
+
+    # ---------- Background DB load ----------
+    def _start_load(self, announce=False):
+        """Read + index the DB on a worker thread; the feed's first page shows as soon as it is parsed."""
+        if self._loading:
+            return
+        self._loading = True
+        self._load_announce = announce
+        self._sync_controls()
+        self.progress["value"] = 0
+        self.progress.pack(side="left", padx=(8, 0), after=self.count_label)
+        self.count_var.set("Loading…")
+        threading.Thread(target=self._load_worker, args=(self._load_results,),
+                         name="hillwatch-load", daemon=True).start()
+        self.after(LOAD_POLL_MS, self._poll_load)
+
+    @staticmethod
+    def _load_worker(out):
+        """No Tk calls here: progress and results go through `out`."""
         try:
-            self.db = load_db()
-            self.current_limit = START_LIMIT
-            self.recompute_views()
-            messagebox.showinfo("Reloaded", "Reloaded local JSON database.")
+            out.put(("progress", 0.0, "Reading"))
+            stat = db_file_stat()      # before reading: a write during the read shows up as a change
+            db = load_db(progress=lambda f: out.put(("progress", 40 * f, "Reading")))
+            out.put(("db", db))
+            steps = (
+                ("search", "Indexing search", SearchIndex),
+                ("sort_index", "Sorting", SortIndex),
+                ("facets", "Indexing filters", FacetIndex),
+                ("rank_index", "Indexing relevance", RankIndex),
+                ("membership", "Sorting tabs", lambda d: TabMembership(d, classify_watch_tab)),
+            )
+            built = {}
+            for i, (name, label, build) in enumerate(steps):
+                out.put(("progress", 40 + 60 * i / len(steps), label))
+                built[name] = build(db)
+            # the default sort's order is needed for the first render anyway
+            built["sort_index"].select("latestActionDate", ())
+            out.put(("ready", db, built, stat))
         except Exception as e:
-            messagebox.showerror("Reload failed", str(e))
+            out.put(("error", e))
+
+    def _poll_load(self):
+        progress = None
+        while True:
+            try:
+                item = self._load_results.get_nowait()
+            except queue.Empty:
+                break
+            kind = item[0]
+            if kind == "progress":
+                progress = item
+            elif kind == "db":
+                self.db = item[1]
+                self._render_first_page()
+            elif kind == "ready":
+                self._finish_load(*item[1:])
+                return
+            elif kind == "error":
+                self._loading = False
+                self.progress.pack_forget()
+                self._sync_controls()
+                self.count_var.set("Load failed")
+                messagebox.showerror("Load failed", str(item[1]))
+                return
+        if progress is not None:
+            _kind, pct, label = progress
+            self.progress["value"] = pct
+            if not self.db:
+                self.count_var.set(f"{label}…")
+            else:
+                self.count_var.set(f"{label}… first {min(FIRST_PAGE_ROWS, len(self.db)):,} of {len(self.db):,}")
+        self.after(LOAD_POLL_MS, self._poll_load)
+
+    def _render_first_page(self):
+        """Top FIRST_PAGE_ROWS of the feed by the current sort, without any index (one heap pass)."""
+        key = sort_key_fn(self.filters)
+        pick = heapq.nlargest if self.filters.get("sort_dir", "desc") == "desc" else heapq.nsmallest
+        rows = pick(FIRST_PAGE_ROWS, self.db.items(), key=lambda kv: key(*kv))
+        for tab, table in self.tables.items():
+            table.set_rows(rows if tab == "feed" else [], reset_position=True)
+
+    def _finish_load(self, db, built, stat=None):
+        self.db = db
+        self._db_stat = stat
+        self.search_index = built["search"]
+        self.sort_index = built["sort_index"]
+        self.facets = built["facets"]
+        self.rank_index = built["rank_index"]
+        self.membership = built["membership"]
+        self._hits_key = None
+        self._edit_version += 1
+        self._cg_version += 1
+        self._loading = False
+        self.progress.pack_forget()
+        self._sync_controls()
+        self.recompute_views()
+        if self._load_announce:
+            messagebox.showinfo("Reloaded", "Reloaded local JSON database.")
+        if not self._watching:
+            self._watching = True
+            self.after(DB_WATCH_MS, self._watch_db)
+
+    # ---------- Live refresh when the updater rewrites the DB ----------
+    def _watch_db(self):
+        self.after(DB_WATCH_MS, self._watch_db)
+        if self._loading or self._refreshing:
+            return
+        stat = db_file_stat()
+        if stat is not None and stat != self._db_stat:
+            self._start_refresh()
+
+    def _start_refresh(self, announce=False):
+        """Re-read the DB file off the Tk thread, then merge it in place (_merge_db)."""
+        if self._loading or self._refreshing:
+            return
+        self._refreshing = True
+        results = queue.Queue()
+
+        def work():
+            try:
+                stat = db_file_stat()
+                results.put((load_db(), stat))
+            except Exception as e:
+                results.put((e, None))
+
+        threading.Thread(target=work, name="hillwatch-refresh", daemon=True).start()
+
+        def poll():
+            try:
+                new_db, stat = results.get_nowait()
+            except queue.Empty:
+                self.after(LOAD_POLL_MS, poll)
+                return
+            self._refreshing = False
+            if isinstance(new_db, Exception):
+                if announce:
+                    messagebox.showerror("Reload failed", str(new_db))
+                return
+            counts = self._merge_db(new_db)
+            self._db_stat = stat if not counts["restored"] else db_file_stat()
+            if announce:
+                messagebox.showinfo("Reloaded", "Reloaded local JSON database: "
+                                    f"{counts['changed']:,} changed, {counts['added']:,} new, "
+                                    f"{counts['removed']:,} removed.")
+
+        self.after(LOAD_POLL_MS, poll)
+
+    def _merge_db(self, new_db):
+        """
+        Fold a freshly read DB into the live one: only bills whose contentHash differs
+        (or that are new / gone) touch the indexes and views. customData edited in this
+        session always wins; if the file lost such an edit, the merged DB is written back.
+        Selection and scroll survive (the tables diff their rows).
+        """
+        live = self.db
+        touched, added, changed = [], 0, 0
+        for bid, rec in new_db.items():
+            cur = live.get(bid)
+            if cur is None:
+                live[bid] = rec
+                touched.append(bid)
+                added += 1
+                continue
+            moved = False
+            if _content_hash(rec) != _content_hash(cur):
+                for k, v in rec.items():
+                    if k != "customData":
+                        cur[k] = v
+                moved = True
+                changed += 1
+            if bid not in self._edited_ids and rec.get("customData") != cur.get("customData"):
+                cur["customData"] = rec.get("customData")   # edited elsewhere (or schema filled in)
+                moved = True
+            if moved:
+                touched.append(bid)
+        removed = [bid for bid in live if bid not in new_db]
+        for bid in removed:
+            del live[bid]
+        restored = any(bid in new_db and new_db[bid].get("customData") != live[bid].get("customData")
+                       for bid in self._edited_ids)
+        if not touched and not removed and not restored:
+            return {"changed": 0, "added": 0, "removed": 0, "restored": False}
+
+        # indexes first (one search-hits recompute below), then the views
+        for bid in removed:
+            for index in (self.search_index, self.sort_index, self.facets, self.rank_index):
+                index.remove(bid)
+        for bid in touched:
+            rec = live[bid]
+            for index in (self.search_index, self.sort_index, self.facets, self.rank_index):
+                index.update(bid, rec)
+        self._edit_version += 1
+        if added or changed or removed:
+            self._cg_version += 1
+        match = filter_predicate(self.filters)
+        for bid in (*removed, *touched):
+            self._reroute(bid, match)
+
+        if restored:
+            try:
+                save_db_atomic(live)
+            except Exception as e:
+                messagebox.showerror("Save failed", f"Could not restore your edits to the DB file:\n{e}")
+        if self.detail.bill_id in live and (self.detail.bill_id in touched):
+            self.detail.show_bill(self.detail.bill_id, live[self.detail.bill_id])
+        self._render_current()
+        return {"changed": changed, "added": added, "removed": len(removed), "restored": restored}
+
+    def _reroute(self, bill_id, match):
+        """Put one new/changed/removed bill where it now belongs in every built view."""
+        rec = self.db.get(bill_id)
+        self.membership.reclassify(bill_id, rec)
+        passes = rec is not None and self._passes(bill_id, rec, match)
+        tab_now = self.membership.tab_of.get(bill_id)
+        for tab, view in self.views.items():
+            if view is None:
+                continue
+            was_in = bill_id in view
+            view.remove(bill_id)
+            if not passes or (tab != "feed" and tab_now != tab):
+                continue
+            if view.fixed and not was_in:
+                continue    # a relevance top-k only re-ranks its own rows; new matches need a new search
+            view.insert(bill_id)
 
     def open_filters(self):
+        if self._loading:
+            return
         try:
-            dlg = FilterDialog(self, initial_filters=self.filters, db=self.db)
+            with TRACER.span("open_filters", db=len(self.db)):
+                dlg = FilterDialog(self, initial_filters=self.filters, db=self.db,
+                                   facets=self.facets, counts=self._facet_counts())
             result = dlg.show()  # expected to return dict or None
             if result:
                 self.filters.update(result)
-                self.current_limit = START_LIMIT
                 self.recompute_views()
         except Exception as e:
             messagebox.showerror("Filters", f"Could not open filters dialog:\n{e}")
 
+    def _facet_counts(self):
+        """Per-option bill counts for the Filters dialog: current tab under the current search."""
+        tab = self.current_tab
+        hits = self._search_hits()
+        source = self._tab_source(tab)
+        if hits is None:
+            within = None if tab == "feed" else source
+        elif tab == "feed":
+            within = hits
+        else:
+            small, big = (hits, source) if len(hits) < len(source) else (source, hits)
+            within = [bid for bid in small if bid in big]
+        return self.facets.counts(within)
+
+    def _on_rank_toggled(self):
+        self.filters["rank"] = bool(self.rank_var.get())
+        self.recompute_views()
+
+    @staticmethod
+    def _ranked(filters):
+        """Relevance order applies only while there is free text (field:value terms don't rank)."""
+        return bool(filters.get("rank") and parse_query(filters.get("text") or "").free_text)
+
+    def on_sort_column(self, field: str):
+        """Header clicked: sort by that column, or flip the direction if it already is."""
+        if self._loading:
+            return
+        if self.current_tab in self.saved_specs:
+            self._sort_saved(self.current_tab, field)
+            return
+        if self._ranked(self.filters):
+            # leave relevance mode: the ranked views only hold the top TOP_K, so re-filter
+            self.filters["rank"] = False
+            self.rank_var.set(False)
+            self.filters["sort_field"] = field
+            self.filters["sort_dir"] = HEADER_SORT_DEFAULT_DIR.get(field, "desc")
+            self.recompute_views()
+            return
+        self.filters["rank"] = False
+        self.rank_var.set(False)
+        if self.filters.get("sort_field") == field:
+            self.filters["sort_dir"] = "asc" if self.filters.get("sort_dir") == "desc" else "desc"
+        else:
+            self.filters["sort_field"] = field
+            self.filters["sort_dir"] = HEADER_SORT_DEFAULT_DIR.get(field, "desc")
+        # same rows, new order: re-cut built views from the sort index instead of re-filtering
+        for view in self.views.values():
+            if view is not None:
+                view.resort(self.filters, self.sort_index)
+        self._render_current(reset_position=True)
+
+    def _update_sort_indicators(self):
+        field = None if self._ranked(self.filters) else self.filters.get("sort_field")
+        for tab in TAB_KEYS:
+            self.tables[tab].set_sort_indicator(field, self.filters.get("sort_dir"))
+
+    # ---------- Saved views ----------
+    def on_save_view(self):
+        """Save the current tab's query (tab + search + filters + sort) as a named view tab."""
+        if self._loading:
+            return
+        tab = self.current_tab
+        if tab in self.saved_specs:
+            base = self.saved_specs[tab]        # save a copy of this view under another name
+            source_tab, filters = base["tab"], spec_filters(base)
+        else:
+            source_tab, filters = tab, dict(self.filters, text=self._pending_text)
+        name = simpledialog.askstring("Save view", "Name for this view:", parent=self)
+        name = (name or "").strip()
+        if not name:
+            return
+        key = SAVED_TAB_PREFIX + name
+        if key in self.saved_specs and not messagebox.askyesno(
+                "Save view", f"Replace the saved view \"{name}\"?", parent=self):
+            return
+        spec = make_spec(name, source_tab, filters)
+        if key in self.saved_specs:
+            self.saved_specs[key] = spec
+            self.saved_cache.pop(key, None)
+        else:
+            self._add_saved_tab(spec)
+        self._persist_views()
+        self.nb.select(self.tab_order.index(key))
+        if self.current_tab == key:
+            self._render_current(reset_position=True)    # replaced in place: no tab change event
+
+    def on_delete_view(self):
+        tab = self.current_tab
+        spec = self.saved_specs.get(tab)
+        if spec is None:
+            return
+        if not messagebox.askyesno("Delete view", f"Delete the saved view \"{spec['name']}\"?", parent=self):
+            return
+        idx = self.tab_order.index(tab)
+        del self.saved_specs[tab]
+        self.saved_cache.pop(tab, None)
+        del self.tab_order[idx]
+        del self.tables[tab]
+        self.nb.forget(idx)
+        self.tabs.pop(tab).destroy()
+        self._persist_views()
+
+    def _persist_views(self):
+        try:
+            save_saved_views(list(self.saved_specs.values()))
+        except Exception as e:
+            messagebox.showerror("Save failed", f"Could not save views:\n{e}")
+
+    def _sort_saved(self, tab, field):
+        """Header clicked on a saved view: its own sort changes (and is saved); no re-filter unless it was ranked."""
+        f = self.saved_specs[tab]["filters"]
+        if self._ranked(f):
+            f["rank"] = False       # a top-k has no other order: content changes, re-evaluated
+            f["sort_field"] = field
+            f["sort_dir"] = HEADER_SORT_DEFAULT_DIR.get(field, "desc")
+        elif f.get("sort_field", "latestActionDate") == field:
+            f["sort_dir"] = "asc" if f.get("sort_dir", "desc") == "desc" else "desc"
+        else:
+            f["sort_field"] = field
+            f["sort_dir"] = HEADER_SORT_DEFAULT_DIR.get(field, "desc")
+        self._persist_views()
+        self._render_current(reset_position=True)
+
+    def _saved_view(self, tab):
+        """
+        A saved view's rows, memoized per tab. Re-evaluated only when its definition
+        (tab / search / filters) or the data it reads changed since: feed views read
+        congressGovData only, the others also tab membership, so edits that don't move a
+        bill between tabs invalidate nothing. A sort change re-cuts the
+        cached rows from the sort index.
+        """
+        spec = self.saved_specs[tab]
+        filters = spec_filters(spec)
+        plan = parse_query(filters.get("text") or "")
+        custom = spec["tab"] != "feed" or plan.uses_custom
+        version = (self._cg_version, self.membership.version if custom else None)
+        key = (version, content_key(spec))
+        cached = self.saved_cache.get(tab)
+        if cached is not None and cached[0] == key:
+            view = cached[1]
+            view.resort(filters, self.sort_index)
+        else:
+            hits = plan.run(self._query_indexes(plan))
+            view = self._apply_search_and_filters(self._tab_source(spec["tab"]), filters, hits)
+            self.saved_cache[tab] = (key, view)
+        field = None if self._ranked(filters) else filters.get("sort_field") or "latestActionDate"
+        self.tables[tab].set_sort_indicator(field, filters.get("sort_dir") or "desc")
+        return view, self._tab_source(spec["tab"])
+
     # row selected in any table
     def on_select_row(self, bill_id: str):
         rec = self.db.get(bill_id)
@@ -204,149 +792,313 @@ class HillWatchApp(tk.Tk):
         self.detail.show_bill(bill_id, rec)
 
     # star toggled from detail pane
+    @traced("save_watchlist", lambda ok, self, *a, **k: {"db": len(self.db), "ok": ok})
     def on_toggle_watchlist(self, bill_id: str, new_value: bool) -> bool:
+        if not self._can_edit():
+            return False
         try:
             set_watchlist_and_save(self.db, bill_id, new_value)
-            self.recompute_views()
+            self._note_own_save((bill_id,))
+            self._on_record_changed(bill_id)
             return True
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
             return False
 
     # any custom field edited in detail pane
+    @traced("save_field", lambda ok, self, bill_id, group, key, *a, **k:
+            {"field": f"{group}.{key}", "db": len(self.db), "ok": ok})
     def on_set_custom_field(self, bill_id: str, group: str, key: str, value) -> bool:
+        if not self._can_edit():
+            return False
         try:
             set_custom_field_and_save(self.db, bill_id, group, key, value)
-            self.recompute_views()
+            self._note_own_save((bill_id,))
+            self._on_record_changed(bill_id)
             return True
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
             return False
 
-    # ---------- Core: recompute per-tab data ----------
+    # ---------- Multi-select: bulk edits ----------
+    def on_selection_changed(self, tab, bill_ids):
+        """Several rows selected: the bulk panel replaces the detail pane (and back for one)."""
+        if tab != self.current_tab:
+            return
+        if len(bill_ids) > 1:
+            if not self._bulk_shown:
+                self._bulk_shown = True
+                self.detail.pack_forget()
+                self.bulk.reset()
+                self.bulk.show_selection(bill_ids, expert_options(self.db))
+                self.bulk.pack(fill="both", expand=True)
+            else:
+                self.bulk.show_selection(bill_ids)
+        elif self._bulk_shown:
+            self._bulk_shown = False
+            self.bulk.pack_forget()
+            self.detail.pack(fill="both", expand=True)
+            if bill_ids and bill_ids[0] in self.db:
+                self.detail.show_bill(bill_ids[0], self.db[bill_ids[0]])
+
+    def _clear_multi(self):
+        self.tables[self.current_tab].collapse_selection()
+
+    @traced("save_bulk", lambda ok, self, bill_ids, changes, *a, **k:
+            {"bills": len(bill_ids), "fields": len(changes), "db": len(self.db), "ok": ok})
+    def on_bulk_apply(self, bill_ids, changes) -> bool:
+        """One change set for every selected bill: a single DB write, then a single view refresh."""
+        if not self._can_edit():
+            return False
+        try:
+            changed = set_custom_fields_bulk_and_save(self.db, bill_ids, changes)
+        except Exception as e:
+            messagebox.showerror("Save failed", str(e))
+            return False
+        if changed:
+            self._note_own_save(changed)
+            self._on_records_changed(changed)
+            if self.detail.bill_id in changed:
+                self.detail.show_bill(self.detail.bill_id, self.db[self.detail.bill_id])
+        return True
+
+    def _note_own_save(self, bill_ids):
+        # our own write must not look like an updater rewrite to _watch_db
+        self._edited_ids.update(bill_ids)
+        self._db_stat = db_file_stat()
+
+    def _can_edit(self):
+        # a save writes the whole in-memory DB, so never before it is fully loaded
+        if self._loading:
+            messagebox.showinfo("Loading", "The database is still loading; edits are enabled once it finishes.")
+            return False
+        return True
+
+    # ---------- Core: per-tab views ----------
+    @traced("recompute_views", lambda _r, self: {
+        "db": len(self.db), "tab": self.current_tab, "rows": self.tables[self.current_tab].row_count()})
     def recompute_views(self):
-        """Rebuild lists for each tab from full DB using current search/filters/sort, then show the active tab."""
-        all_items = list(self.db.items())  # [(bill_id, record)]
-
-        # Bills Feed = everyone (apply search/filters/sort)
-        feed_all = self._apply_search_and_filters(all_items)
-
-        # Classify each watchlisted bill into exactly one tab
-        watch_bucket, reject_bucket, complete_bucket = [], [], []
-        for bid, rec in all_items:
-            cls = classify_watch_tab(rec)
-            if cls == "watch":
-                watch_bucket.append((bid, rec))
-            elif cls == "reject":
-                reject_bucket.append((bid, rec))
-            elif cls == "complete":
-                complete_bucket.append((bid, rec))
-
-        # Apply search/filters/sort to each bucket as well (so tabs respect the UI filters)
-        watch_all    = self._apply_search_and_filters(watch_bucket)
-        reject_all   = self._apply_search_and_filters(reject_bucket)
-        complete_all = self._apply_search_and_filters(complete_bucket)
-
-        # Save for load-more
-        self.feed_items_all     = feed_all
-        self.watch_items_all    = watch_all
-        self.reject_items_all   = reject_all
-        self.complete_items_all = complete_all
-
-        # Limit slice
-        def limited(lst): return lst[: self.current_limit]
-
-        # Update active table + count label
-        if self.current_tab == "feed":
-            rows = limited(self.feed_items_all)
-            self.tables["feed"].set_rows(rows)
-            self._update_count_label(len(rows), len(self.feed_items_all))
-        elif self.current_tab == "watch":
-            rows = limited(self.watch_items_all)
-            self.tables["watch"].set_rows(rows)
-            self._update_count_label(len(rows), len(self.watch_items_all))
-        elif self.current_tab == "reject":
-            rows = limited(self.reject_items_all)
-            self.tables["reject"].set_rows(rows)
-            self._update_count_label(len(rows), len(self.reject_items_all))
-        elif self.current_tab == "complete":
-            rows = limited(self.complete_items_all)
-            self.tables["complete"].set_rows(rows)
-            self._update_count_label(len(rows), len(self.complete_items_all))
+        """Search/filters/sort changed: drop every tab's view, rebuild and show only the active tab."""
+        # a synchronous recompute supersedes any search still running in the background
+        self._search_gen += 1
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+        self.filters["text"] = self._pending_text
+        self._invalidate_views()
+        self._render_current(reset_position=True)
+
+    def _invalidate_views(self):
+        self.views = {t: None for t in TAB_KEYS}
+
+    def _tab_source(self, tab):
+        """Bill ids a tab draws from before search/filters: the whole DB for the feed."""
+        return self.db.keys() if tab == "feed" else self.membership.members[tab]
+
+    def _render_current(self, reset_position=False):
+        """Hand the active tab's full view to its (virtual) table; only visible rows get rendered."""
+        if self._loading:
+            return  # the first page (or nothing) stays up until the indexes are ready
+        tab = self.current_tab
+        if tab in self.saved_specs:
+            view, source = self._saved_view(tab)
+        else:
+            view = self.views.get(tab)
+            if view is None:
+                view = self.views[tab] = self._apply_search_and_filters(
+                    self._tab_source(tab), self.filters, self._search_hits())
+            source = self._tab_source(tab)
+            self._update_sort_indicators()
+        self.tables[tab].set_rows(view.as_rows(), reset_position=reset_position)
+        if getattr(view, "matched", None) is not None:
+            self.count_var.set(f"Top {len(view):,} of {view.matched:,} matches")
+        else:
+            self._update_count_label(len(view), len(source))
+
+    def _on_record_changed(self, bill_id: str):
+        self._on_records_changed((bill_id,))
+
+    def _on_records_changed(self, bill_ids):
+        """
+        These bills' customData changed: re-route just them between
+        WatchList / Rejected / Complete, patch the affected views, and render once.
+        (Search, filters and sort only read congressGovData, so the feed is unaffected.)
+        """
+        self._edit_version += 1
+        if parse_query(self.filters.get("text") or "").uses_custom:
+            # watch: in the search box, so even the feed's rows depend on customData
+            match = filter_predicate(self.filters)
+            for bill_id in bill_ids:
+                self._reroute(bill_id, match)
+            self._render_current()
+            return
+        touched = set()
+        match = None
+        for bill_id in bill_ids:
+            rec = self.db.get(bill_id)
+            old, new = self.membership.reclassify(bill_id, rec)
+            if old == new:
+                continue
+            touched.update((old, new))
+            if old and self.views.get(old) is not None:
+                self.views[old].remove(bill_id)
+            if new and self.views.get(new) is not None:
+                match = match or filter_predicate(self.filters)
+                if self._passes(bill_id, rec, match):
+                    self.views[new].insert(bill_id)
+        spec = self.saved_specs.get(self.current_tab)
+        # a saved view over a tab that moved (or querying watch:) no longer matches its memo: re-evaluated
+        if self.current_tab in touched or (spec is not None and touched and (
+                spec["tab"] in touched or parse_query(spec["filters"].get("text") or "").uses_custom)):
+            self._render_current()
+
+    def _passes(self, bill_id, rec, match=None):
+        plan = parse_query(self.filters.get("text") or "")
+        if plan and not plan.test(bill_id, rec, self._query_indexes(plan)):
+            return False
+        return (match or filter_predicate(self.filters))(rec)
+
+    # ---------- Background search ----------
+    def _start_search(self):
+        """Debounce fired: evaluate the query on a worker thread; newest generation wins."""
+        self._search_after = None
+        if self.current_tab in self.saved_specs:
+            # typed just before switching to a saved view: the main tabs pick it up on return
+            self.recompute_views()
+            return
+        self._search_gen += 1
+        gen = self._search_started_gen = self._search_gen
+        tab = self.current_tab
+        filters = dict(self.filters, text=self._pending_text)
+        # snapshot on the Tk thread: edits keep mutating the live sets, and _merge_db
+        # adds/deletes keys of self.db itself (feed = whole DB)
+        source = set(self._tab_source(tab))
+        plan = parse_query(filters["text"])
+        ix = self._query_indexes(plan, snapshot=True)
+        threading.Thread(target=self._search_worker,
+                         args=(gen, self._edit_version, tab, self.db, source, filters, plan, ix),
+                         name="hillwatch-search", daemon=True).start()
+        if not self._search_polling:
+            self._search_polling = True
+            self.after(SEARCH_POLL_MS, self._poll_search_results)
+
+    def _search_worker(self, gen, edit_version, tab, db, source, filters, plan, ix):
+        try:
+            if gen != self._search_gen:
+                return
+            hits = plan.run(ix, within=source)
+            if gen != self._search_gen:
+                return
+            view = self._apply_search_and_filters(source, filters, hits, db)
+        except Exception as e:
+            view = e
+        self._search_results.put((gen, edit_version, tab, filters["text"], view))
+
+    def _poll_search_results(self):
+        """Runs on the Tk thread via after(): apply the newest finished search, drop stale ones."""
+        latest = None
+        while True:
+            try:
+                item = self._search_results.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == self._search_gen:
+                latest = item
+        if latest is not None:
+            _gen, edit_version, tab, text, view = latest
+            if isinstance(view, Exception) and edit_version == self._edit_version:
+                messagebox.showerror("Search", f"Search failed:\n{view}")
+            else:
+                self.filters["text"] = text
+                self._invalidate_views()
+                # an edit or merge while the worker ran may have moved or removed bills (and
+                # may have tripped the worker up); then rebuild on the Tk thread
+                if (not isinstance(view, Exception) and edit_version == self._edit_version
+                        and self.db is view.db):
+                    view.resort(self.filters, self.sort_index)   # a header click may have landed meanwhile
+                    self.views[tab] = view
+                # new results: start at the top
+                self._render_current(reset_position=True)
+            self._search_polling = False
+            return
+        if self._search_started_gen != self._search_gen:
+            # superseded by a synchronous recompute_views(); no worker will answer
+            self._search_polling = False
+            return
+        self.after(SEARCH_POLL_MS, self._poll_search_results)
 
     # ---------- Helpers: search / filters / sort ----------
-    def _apply_search_and_filters(self, items):
+    @traced("apply_search_and_filters", lambda view, self, bill_ids, filters, hits, db=None: {
+        "db": len(self.db if db is None else db), "candidates": len(bill_ids),
+        "hits": None if hits is None else len(hits), "rows": len(view)})
+    def _apply_search_and_filters(self, bill_ids, filters, hits, db=None):
         """
-        items: list[(bill_id, record)]
-        returns: filtered/sorted list[(bill_id, record)]
-        Applies keyword search, structured filters, and sort. Does NOT apply the limit.
+        bill_ids: the tab's candidate ids; hits: ids from the token index (None = no search text).
+        Returns a SortedView with keyword search, structured filters and sort applied;
+        the order is cut out of the maintained sort index rather than sorted from
+        scratch. Touches no Tk state, so the search worker can call it.
         """
-        f = self.filters
-        text = (f.get("text") or "").lower().strip()
-        committees = set(f.get("committees") or [])
-        sponsors = set(f.get("sponsors") or [])
-        types = set(f.get("types") or [])
-        chambers = set(f.get("chambers") or [])
-        date_field = f.get("date_field") or "latestActionDate"
-        date_from = f.get("date_from") or None
-        date_to = f.get("date_to") or None
-        sort_field = f.get("sort_field") or "latestActionDate"
-        sort_dir = f.get("sort_dir") or "desc"
-
-        # --- keyword match function (search across many cong.gov fields)
-        def match_text(rec):
-            if not text:
-                return True
-            cg = rec.get("congressGovData", {}) or {}
-            hay = " ".join([
-                str(cg.get("billType", "")),
-                str(cg.get("billNumber", "")),
-                str(cg.get("title", "")),
-                str(cg.get("sponsorFullName", "")),
-                str(cg.get("currentCommitteeName", "")),
-                str(cg.get("currentSubcommitteeName", "")),
-                str(cg.get("latestActionText", "")),
-            ]).lower()
-            return text in hay
-
-        # --- structured filters
-        def match_filters(rec):
-            cg = rec.get("congressGovData", {}) or {}
-            if committees and (cg.get("currentCommitteeName") or "") not in committees:
-                return False
-            if sponsors and (cg.get("sponsorFullName") or "") not in sponsors:
-                return False
-            if types and (cg.get("billType") or "") not in types:
-                return False
-            if chambers and (cg.get("originChamber") or "") not in chambers:
-                return False
-            # date range (on selected field)
-            val = (cg.get(date_field) or "").strip()  # YYYY-MM-DD or ''
-            if date_from and (not val or val < date_from):
-                return False
-            if date_to and (not val or val > date_to):
-                return False
-            return True
+        db = self.db if db is None else db
+        if hits is not None:
+            # walk whichever side is smaller
+            if len(hits) < len(bill_ids):
+                bill_ids = [bid for bid in hits if bid in bill_ids]
+            else:
+                bill_ids = [bid for bid in bill_ids if bid in hits]
+        match = filter_predicate(filters)
+        ids = [bid for bid in bill_ids if bid in db and match(db[bid])]
+        if self._ranked(filters):
+            return self._ranked_view(db, ids, filters)
+        order = self.sort_index if db is self.db else None
+        return SortedView(db, ids, filters, order=order)
+
+    def _ranked_view(self, db, ids, filters):
+        """Best TOP_K of the matching ids by BM25 score, best first (ties: title, bill id)."""
+        text = parse_query(filters["text"]).free_text
 
-        # filter pipeline
-        filtered = [(bid, rec) for (bid, rec) in items if match_text(rec) and match_filters(rec)]
+        def tie(bid):
+            cg = (db[bid] or {}).get("congressGovData", {}) or {}
+            return (cg.get("title") or "", bid)
 
-        # sort
-        def sort_key(pair):
-            rec = pair[1]
-            cg = rec.get("congressGovData", {}) or {}
-            # normalize date fields to string YYYY-MM-DD; missing -> ''
-            a = (cg.get(sort_field) or "")
-            b = (cg.get("title") or "")
-            return (a, b)
+        # same tie-break when picking the top k as when ordering them
+        best, scores = self.rank_index.top_k(text, ids, TOP_K, tie=tie)
+        ranker = self.rank_index
 
-        reverse = (sort_dir == "desc")
-        filtered.sort(key=sort_key, reverse=reverse)
+        def key(bid, rec):
+            score = scores.get(bid)
+            if score is None:       # a bill that joined the tab after ranking
+                score = ranker.score(text, bid)
+            return (-score, *tie(bid))
+
+        view = SortedView(db, best, filters, key=key)
+        view.matched = len(ids)
+        return view
+
+    def _search_hits(self):
+        """
+        Bill ids matching the search box (None = no query), from the query plan over the
+        token / facet / date indexes. Memoized per text + data version; watch: terms
+        also depend on tab membership.
+        """
+        text = self.filters.get("text") or ""
+        plan = parse_query(text)
+        key = (text, self._cg_version, self.search_index.version,
+               self.membership.version if plan.uses_custom else None)
+        if key != self._hits_key:
+            self._hits = plan.run(self._query_indexes(plan))
+            self._hits_key = key
+        return self._hits
 
-        return filtered
+    def _query_indexes(self, plan, snapshot=False):
+        """Indexes for a query plan; snapshot copies the WatchList ids for a worker thread."""
+        watched = None
+        if plan.uses_custom:
+            watched = frozenset(self.membership.tab_of) if snapshot else self.membership.tab_of
+        return Indexes(self.db, search=self.search_index, facets=self.facets,
+                       dates=self.sort_index, watched=watched)
 
     def _update_count_label(self, shown, total):
-        self.count_var.set(f"Showing {shown} of {total}")
+        self.count_var.set(f"Showing {shown:,} of {total:,}")
 
 
 def main():
@@ -0,0 +1,112 @@
+# desktop_gui/bulk_panel.py
+# Right pane while several rows are selected: one change set for all of them.
+# - every field starts at "(no change)"; only fields set to a value are written
+# - Apply hands [(group, key, value), ...] to on_apply(bill_ids, changes), which
+#   saves once and refreshes the views once (see app.on_bulk_apply)
+
+import tkinter as tk
+from tkinter import ttk
+
+from desktop_gui.detail_panel import P_INNER, ROW_PADY, apply_detail_styles
+
+NO_CHANGE = "(no change)"
+NONE_EXPERT = "(none)"
+YES, NO = "Yes", "No"
+
+# (group, key, label) of the yes/no fields offered for bulk edits
+BULK_BOOL_FIELDS = [
+    ("Review", "WatchList", "⭐ WatchList"),
+    ("Review", "CEIExpertAcceptOrReject", "Accept (CEIExpertAcceptOrReject)"),
+    ("Review", "Review_Done", "Review_Done"),
+    ("Review", "StatementRequested", "StatementRequested"),
+    ("Outreach", "Outreach_Done", "Outreach_Done"),
+    ("FinalTracking", "Final_Tracking_Done", "Final_Tracking_Done"),
+]
+
+
+def expert_options(db: dict, bill_ids=None) -> list[str]:
+    """Sorted CeiExpert names offered by (or assigned to) the given bills (None = all)."""
+    names = set()
+    recs = db.values() if bill_ids is None else (db[bid] for bid in bill_ids if bid in db)
+    for rec in recs:
+        review = ((rec or {}).get("customData") or {}).get("Review") or {}
+        names.update(n for n in review.get("CeiExpertOptions") or [] if n)
+        names.update(n for n in review.get("CeiExpert") or [] if n)
+    return sorted(names)
+
+
+class BulkPanel(ttk.Frame):
+    def __init__(self, parent, on_apply, on_clear=None):
+        super().__init__(parent)
+        apply_detail_styles(self)
+        self.on_apply = on_apply      # (bill_ids, changes) -> bool
+        self.on_clear = on_clear      # () -> None: back to a single selection
+        self.bill_ids = []
+
+        inner = ttk.Frame(self, padding=P_INNER)
+        inner.pack(fill="both", expand=True)
+
+        self.header_var = tk.StringVar(value="")
+        ttk.Label(inner, textvariable=self.header_var, style="HW.Header.TLabel").pack(anchor="w")
+        ttk.Label(inner, text="Fields left at “(no change)” are not touched.",
+                  style="HW.Small.TLabel").pack(anchor="w", pady=(2, 0))
+        ttk.Separator(inner, orient="horizontal").pack(fill="x", pady=(10, 8))
+
+        form = ttk.Frame(inner)
+        form.pack(fill="x")
+        self.vars = {}      # (group, key) -> StringVar
+        for r, (group, key, label) in enumerate(BULK_BOOL_FIELDS):
+            ttk.Label(form, text=label, style="HW.TLabel").grid(row=r, column=0, sticky="w", pady=ROW_PADY)
+            var = tk.StringVar(value=NO_CHANGE)
+            ttk.Combobox(form, textvariable=var, state="readonly", width=14,
+                         values=[NO_CHANGE, YES, NO]).grid(row=r, column=1, sticky="w", padx=(8, 0))
+            self.vars[(group, key)] = var
+        r = len(BULK_BOOL_FIELDS)
+        ttk.Label(form, text="CeiExpert:", style="HW.TLabel").grid(row=r, column=0, sticky="w", pady=ROW_PADY)
+        self.expert_var = tk.StringVar(value=NO_CHANGE)
+        self.expert_combo = ttk.Combobox(form, textvariable=self.expert_var, state="readonly", width=36)
+        self.expert_combo.grid(row=r, column=1, sticky="w", padx=(8, 0))
+
+        btns = ttk.Frame(inner)
+        btns.pack(anchor="w", pady=(12, 0))
+        self.apply_btn = ttk.Button(btns, text="Apply to selected", command=self._apply)
+        self.apply_btn.pack(side="left")
+        if on_clear is not None:
+            ttk.Button(btns, text="Clear selection", command=on_clear).pack(side="left", padx=(8, 0))
+
+        self.msg_var = tk.StringVar(value="")
+        ttk.Label(inner, textvariable=self.msg_var, style="HW.Success.TLabel").pack(anchor="w", pady=(6, 0))
+
+    def show_selection(self, bill_ids, experts=None):
+        """Rebind to a new selection; `experts` refreshes the CeiExpert choices when given."""
+        self.bill_ids = list(bill_ids)
+        self.header_var.set(f"{len(self.bill_ids):,} bills selected")
+        if experts is not None:
+            self.expert_combo["values"] = [NO_CHANGE, NONE_EXPERT] + list(experts)
+
+    def reset(self):
+        for var in self.vars.values():
+            var.set(NO_CHANGE)
+        self.expert_var.set(NO_CHANGE)
+        self.msg_var.set("")
+
+    def changes(self) -> list:
+        """[(group, key, value)] for every field set to something other than "(no change)"."""
+        out = []
+        for (group, key), var in self.vars.items():
+            if var.get() != NO_CHANGE:
+                out.append((group, key, var.get() == YES))
+        expert = self.expert_var.get()
+        if expert != NO_CHANGE:
+            out.append(("Review", "CeiExpert", [] if expert == NONE_EXPERT else [expert]))
+        return out
+
+    def _apply(self):
+        changes = self.changes()
+        if not changes or not self.bill_ids:
+            self.msg_var.set("Nothing to apply.")
+            return
+        n = len(self.bill_ids)
+        if self.on_apply(self.bill_ids, changes):
+            self.reset()
+            self.msg_var.set(f"Saved {len(changes)} field(s) on {n:,} bills")
@@ -3,12 +3,14 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import os
 import time
 from pathlib import Path
 from typing import Any, Dict
 
+import json_codec
+
 # ---- Resolve DB path from config.py (fallback to data/bills_119.json) ----
 try:
     # config.py lives at project root
@@ -20,16 +22,31 @@ except Exception:
 
 # ---- Load / Save (with Windows-friendly atomic write + retries) ----
 
-def load_db() -> Dict[str, Any]:
+LOAD_CHUNK_BYTES = 1 << 20
+
+
+def load_db(progress=None) -> Dict[str, Any]:
     """
     Load the JSON DB and return as a dict.
     If the file doesn't exist yet, returns empty dict.
+    progress(fraction) is called while the file is read (in LOAD_CHUNK_BYTES chunks).
     """
     p = Path(DB_PATH)
     if not p.exists():
         return {}
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    if progress is None:
+        return json_codec.load_file(p)
+    total = p.stat().st_size or 1
+    chunks, done = [], 0
+    with open(p, "rb") as f:
+        while True:
+            chunk = f.read(LOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            done += len(chunk)
+            progress(min(1.0, done / total))
+    return json_codec.loads(b"".join(chunks))
 
 
 def save_db_atomic(db: Dict[str, Any], retries: int = 6, backoff: float = 0.15) -> None:
@@ -44,10 +61,7 @@ def save_db_atomic(db: Dict[str, Any], retries: int = 6, backoff: float = 0.15)
     for attempt in range(1, retries + 1):
         try:
             # Write to a temp file
-            with tmp_path.open("w", encoding="utf-8", newline="\n") as f:
-                json.dump(db, f, ensure_ascii=False, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
+            json_codec.write_file(db, tmp_path, fsync=True)
             # Atomic replace
             os.replace(tmp_path, db_path)
             return
@@ -178,3 +192,40 @@ def set_custom_field_and_save(db: Dict[str, Any], bill_id: str, group: str, key:
     # DEBUG (optional): uncomment if you need to see writes in the terminal
     # print(f"[SAVE] {bill_id}: customData[{group}][{key}] = {value!r}")
     save_db_atomic(db)
+
+
+def set_custom_fields_bulk_and_save(db: Dict[str, Any], bill_ids, changes) -> list:
+    """
+    Bulk setter used by the multi-select panel:
+      customData[group][key] = value for every (group, key, value) in changes,
+    on every bill in bill_ids, then ONE atomic save.
+    All-or-nothing: unknown bill ids raise before anything changes, and a failed
+    save puts the previous customData back. Returns the ids whose data changed.
+    """
+    bill_ids = list(dict.fromkeys(bill_ids))
+    missing = [bid for bid in bill_ids if not db.get(bid)]
+    if missing:
+        raise KeyError(f"Bill not found: {missing[0]}")
+
+    before = {bid: copy.deepcopy(db[bid].get("customData")) for bid in bill_ids}
+    changed = []
+    for bid in bill_ids:
+        cd = ensure_custom_full(db[bid])
+        for group, key, value in changes:
+            if group not in cd or not isinstance(cd[group], dict):
+                cd[group] = {}
+            cd[group][key] = copy.deepcopy(value)
+        if cd != before[bid]:
+            changed.append(bid)
+    if not changed:
+        return changed
+    try:
+        save_db_atomic(db)
+    except Exception:
+        for bid, cd in before.items():
+            if cd is None:
+                db[bid].pop("customData", None)
+            else:
+                db[bid]["customData"] = cd
+        raise
+    return changed
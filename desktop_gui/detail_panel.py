@@ -1,6 +1,8 @@
 # desktop_gui/detail_panel.py
 # Right pane: single scroll area, CG Data (open) + Custom (collapsed),
 # vertical Review/Outreach/FinalTracking, clean spacing, section dividers, compact styles.
+# Widgets are built once; show_bill() only rebinds their values and bill id
+# (labels for unexpected extra congressGovData keys are created on first sight).
 
 import tkinter as tk
 from tkinter import ttk
@@ -8,6 +10,7 @@ import webbrowser
 
 from desktop_gui.collapsible import Collapsible
 from desktop_gui.editor_fields import BoolCheck, TextEntry, DateEntryValidated, CeiExpertPicker
+from desktop_gui.latency import traced
 
 # ----- Read-only CG keys display order -----
 READONLY_KEYS_ORDER = [
@@ -16,6 +19,7 @@ READONLY_KEYS_ORDER = [
     "currentCommitteeName","currentSubcommitteeName","latestActionText","latestActionDate",
     "updateDate","updateDateIncludingText","sourceUrl","congressGovUrl","contentHash","committeeLastActionSeen",
 ]
+_KNOWN_KEYS = frozenset(READONLY_KEYS_ORDER)
 
 # ----- Layout constants (tweak to taste) -----
 P_INNER = (14, 12)    # padding for inner scroll frame
@@ -51,6 +55,7 @@ class DetailPanel(ttk.Frame):
         self._record = {}
         self._congress_url = None
         self._saved_after_id = None
+        self._bodies_packed = False
 
         # ===== Single scroll area =====
         outer = ttk.Frame(self); outer.pack(fill="both", expand=True)
@@ -91,7 +96,10 @@ class DetailPanel(ttk.Frame):
         self.cg_section = Collapsible(self.inner, "Congress.gov Data", start_open=True)
         self.cg_section.pack(fill="x", expand=False, pady=P_SECT)
         self.cg_body = ttk.Frame(self.cg_section.body, padding=P_BODY); self.cg_body.pack(fill="x", expand=True)
-        self.cg_grid = ttk.Frame(self.cg_body); self.cg_grid.pack(fill="x", expand=True)
+        self.cg_grid = ttk.Frame(self.cg_body)   # packed on the first show_bill
+        self._cg_rows = {}     # cg key -> [value StringVar, label, value label, grid row or None]
+        for k in READONLY_KEYS_ORDER:
+            self._cg_row(k)
 
         ttk.Separator(self.inner, orient="horizontal").pack(fill="x", pady=(8, 8))
 
@@ -111,9 +119,13 @@ class DetailPanel(ttk.Frame):
         self.fin_section.pack(fill="x", pady=(4, 4))
 
         # Bodies for vertical form rows
-        self.rev_body = ttk.Frame(self.rev_section.body, padding=P_BODY); self.rev_body.pack(fill="x")
-        self.out_body = ttk.Frame(self.out_section.body, padding=P_BODY); self.out_body.pack(fill="x")
-        self.fin_body = ttk.Frame(self.fin_section.body, padding=P_BODY); self.fin_body.pack(fill="x")
+        # (packed on the first show_bill; until then there is nothing to edit)
+        self.rev_body = ttk.Frame(self.rev_section.body, padding=P_BODY)
+        self.out_body = ttk.Frame(self.out_section.body, padding=P_BODY)
+        self.fin_body = ttk.Frame(self.fin_section.body, padding=P_BODY)
+
+        self._editors = []     # (widget, group, key, default) rebound by show_bill
+        self._build_editors()
 
     # ===== mouse wheel =====
     def _on_mousewheel(self, event): self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -143,35 +155,91 @@ class DetailPanel(ttk.Frame):
         return ok
 
     # ===== row builders (vertical) =====
-    def _line_check(self, parent, group, key, label, src_dict):
+    def _save_cb(self):
+        return lambda bid, grp, k, v: self._set_custom(grp, k, v)
+
+    def _line_check(self, parent, group, key, label):
         row = ttk.Frame(parent); row.pack(fill="x", pady=ROW_PADY)
-        BoolCheck(row, self.bill_id, group, key,
-                  lambda: src_dict.get(key, False),
-                  lambda bid, grp, k, v: self._set_custom(grp, k, v),
-                  label).pack(side="left")
+        w = BoolCheck(row, self.bill_id, group, key, lambda: False, self._save_cb(), label)
+        w.pack(side="left")
+        self._editors.append((w, group, key, False))
 
-    def _line_text(self, parent, group, key, label, get_value, width=56):
+    def _line_text(self, parent, group, key, label, width=56):
         row = ttk.Frame(parent); row.pack(fill="x", pady=ROW_PADY)
         ttk.Label(row, text=label, style="HW.TLabel").pack(side="left", padx=(0, 6))
-        TextEntry(row, self.bill_id, group, key,
-                  get_value,
-                  lambda bid, grp, k, v: self._set_custom(grp, k, v),
-                  width=width).pack(side="left", fill="x", expand=True)
+        w = TextEntry(row, self.bill_id, group, key, lambda: "", self._save_cb(), width=width)
+        w.pack(side="left", fill="x", expand=True)
+        self._editors.append((w, group, key, ""))
 
-    def _line_date(self, parent, group, key, label, get_value):
+    def _line_date(self, parent, group, key, label):
         row = ttk.Frame(parent); row.pack(fill="x", pady=ROW_PADY)
         ttk.Label(row, text=label, style="HW.TLabel").pack(side="left", padx=(0, 6))
-        DateEntryValidated(row, self.bill_id, group, key,
-                           get_value,
-                           lambda bid, grp, k, v: self._set_custom(grp, k, v)).pack(side="left")
+        w = DateEntryValidated(row, self.bill_id, group, key, lambda: None, self._save_cb())
+        w.pack(side="left")
+        self._editors.append((w, group, key, None))
 
     def _line_widget(self, parent, label_text, widget):
         row = ttk.Frame(parent); row.pack(fill="x", pady=ROW_PADY)
         ttk.Label(row, text=label_text, style="HW.TLabel").pack(side="left", padx=(0, 6))
         widget.pack(side="left")
 
+    def _cg_row(self, key):
+        var = tk.StringVar(value="")
+        lbl = ttk.Label(self.cg_grid, text=f"{key}:", width=LABEL_W, style="HW.Small.TLabel")
+        val = ttk.Label(self.cg_grid, textvariable=var, width=VALUE_W, style="HW.TLabel")
+        row = [var, lbl, val, None]
+        self._cg_rows[key] = row
+        return row
+
+    def _build_editors(self):
+        # === REVIEW (reorder these for your preferred order) ===
+        self._line_check(self.rev_body, "Review", "CEIExpertAcceptOrReject", "Accept (CEIExpertAcceptOrReject)")
+        self._line_check(self.rev_body, "Review", "Review_Done", "Review_Done")
+        self._line_check(self.rev_body, "Review", "StatementRequested", "StatementRequested")
+        self._line_date(self.rev_body, "Review", "StatementRequestedDate", "StatementRequestedDate:")
+        self.cei_picker = CeiExpertPicker(
+            self.rev_body, self.bill_id,
+            get_options=lambda: [],
+            get_current=lambda: [],
+            set_value_callback=self._save_cb(),
+        )
+        self._line_widget(self.rev_body, "CeiExpert:", self.cei_picker)
+
+        # === OUTREACH ===
+        for key, label in [
+            ("Worked_Directly_with_Office", "Worked_Directly_with_Office"),
+            ("Statement_Complete", "Statement_Complete"),
+        ]:
+            self._line_check(self.out_body, "Outreach", key, label)
+        self._line_date(self.out_body, "Outreach", "Statement_Complete_Date", "Statement_Complete_Date:")
+        for key, label in [
+            ("Statement_Emailed_Directly", "Statement_Emailed_Directly"),
+            ("Statement_Emailed_Quorum", "Statement_Emailed_Quorum"),
+            ("InternalLed_Coalition_Letter", "InternalLed_Coalition_Letter"),
+            ("ExternalLed_Coalition_Letter", "ExternalLed_Coalition_Letter"),
+            ("Support_Posted_Website", "Support_Posted_Website"),
+        ]:
+            self._line_check(self.out_body, "Outreach", key, label)
+        self._line_text(self.out_body, "Outreach", "Other_Support", "Other_Support:", width=56)
+        self._line_check(self.out_body, "Outreach", "Outreach_Done", "Outreach_Done")
+
+        # === FINAL TRACKING ===
+        self._line_check(self.fin_body, "FinalTracking", "Press_Release_Mention", "Press_Release_Mention")
+        self._line_text(self.fin_body, "FinalTracking", "Press Release Mention_Source",
+                        "Press Release Mention_Source:", width=56)
+        self._line_check(self.fin_body, "FinalTracking", "Any_Public_Mention", "Any_Public_Mention")
+        self._line_text(self.fin_body, "FinalTracking", "Any_Public_Mention_Source",
+                        "Any_Public_Mention_Source:", width=56)
+        self._line_text(self.fin_body, "FinalTracking", "Notes_or_Other", "Notes_or_Other:", width=56)
+        self._line_date(self.fin_body, "FinalTracking", "Public_Mention_Date", "Public_Mention_Date:")
+        self._line_check(self.fin_body, "FinalTracking", "Final_Tracking_Done", "Final_Tracking_Done")
+
     # ===== render selection =====
+    @traced("show_bill", lambda _r, self, bill_id, *a, **k: {"bill": bill_id})
     def show_bill(self, bill_id: str, record: dict):
+        # commit edits still pending for the outgoing bill (its FocusOut arrives after this)
+        for w, _group, _key, _default in self._editors:
+            w.flush()
         self.bill_id = bill_id
         self._record = record or {}
 
@@ -191,74 +259,37 @@ class DetailPanel(ttk.Frame):
         self.watch_var.set(bool(review.get("WatchList", False)))
         self.watch_btn.configure(state="normal")
 
-        # ---- Congress.gov Data grid ----
-        for w in self.cg_grid.winfo_children(): w.destroy()
-
+        # ---- Congress.gov Data grid: known keys first, then extras in record order ----
         r = 0
-        def add_kv(label, value):
-            nonlocal r
-            ttk.Label(self.cg_grid, text=f"{label}:", width=LABEL_W, style="HW.Small.TLabel")\
-               .grid(row=r, column=0, sticky="w", padx=(4, 8), pady=ROW_PADY)
-            ttk.Label(self.cg_grid, text="" if value is None else str(value), width=VALUE_W, style="HW.TLabel")\
-               .grid(row=r, column=1, sticky="w", padx=(0, 4), pady=ROW_PADY)
+        shown = set()
+        keys = [k for k in READONLY_KEYS_ORDER if k in cg]
+        keys += [k for k in cg if k not in _KNOWN_KEYS]
+        for k in keys:
+            row = self._cg_rows.get(k) or self._cg_row(k)
+            v = cg.get(k)
+            row[0].set("" if v is None else str(v))
+            if row[3] != r:
+                row[1].grid(row=r, column=0, sticky="w", padx=(4, 8), pady=ROW_PADY)
+                row[2].grid(row=r, column=1, sticky="w", padx=(0, 4), pady=ROW_PADY)
+                row[3] = r
+            shown.add(k)
             r += 1
-
-        seen = set()
-        for k in READONLY_KEYS_ORDER:
-            if k in cg: add_kv(k, cg.get(k)); seen.add(k)
-        for k, v in cg.items():
-            if k not in seen: add_kv(k, v)
+        for k, row in self._cg_rows.items():
+            if k not in shown and row[3] is not None:
+                row[1].grid_remove()
+                row[2].grid_remove()
+                row[3] = None
 
         # ---- Custom editor (VERTICAL) ----
-        for f in self.rev_body.winfo_children(): f.destroy()
-        for f in self.out_body.winfo_children(): f.destroy()
-        for f in self.fin_body.winfo_children(): f.destroy()
-
-        # === REVIEW (reorder these for your preferred order) ===
-        self._line_check(self.rev_body, "Review", "CEIExpertAcceptOrReject", "Accept (CEIExpertAcceptOrReject)", review)
-        self._line_check(self.rev_body, "Review", "Review_Done", "Review_Done", review)
-        self._line_check(self.rev_body, "Review", "StatementRequested", "StatementRequested", review)
-        self._line_date(self.rev_body, "Review", "StatementRequestedDate", "StatementRequestedDate:",
-                        lambda: review.get("StatementRequestedDate"))
-        self._line_widget(
-            self.rev_body, "CeiExpert:",
-            CeiExpertPicker(
-                self.rev_body, self.bill_id,
-                get_options=lambda: review.get("CeiExpertOptions", []),
-                get_current=lambda: review.get("CeiExpert", []),
-                set_value_callback=lambda bid, grp, key, val: self._set_custom(grp, key, val),
-            )
-        )
-
-        # === OUTREACH ===
-        for key, label in [
-            ("Worked_Directly_with_Office", "Worked_Directly_with_Office"),
-            ("Statement_Complete", "Statement_Complete"),
-        ]:
-            self._line_check(self.out_body, "Outreach", key, label, outreach)
-        self._line_date(self.out_body, "Outreach", "Statement_Complete_Date", "Statement_Complete_Date:",
-                        lambda: outreach.get("Statement_Complete_Date"))
-        for key, label in [
-            ("Statement_Emailed_Directly", "Statement_Emailed_Directly"),
-            ("Statement_Emailed_Quorum", "Statement_Emailed_Quorum"),
-            ("InternalLed_Coalition_Letter", "InternalLed_Coalition_Letter"),
-            ("ExternalLed_Coalition_Letter", "ExternalLed_Coalition_Letter"),
-            ("Support_Posted_Website", "Support_Posted_Website"),
-        ]:
-            self._line_check(self.out_body, "Outreach", key, label, outreach)
-        self._line_text(self.out_body, "Outreach", "Other_Support", "Other_Support:",
-                        lambda: outreach.get("Other_Support", ""), width=56)
-        self._line_check(self.out_body, "Outreach", "Outreach_Done", "Outreach_Done", outreach)
-
-        # === FINAL TRACKING ===
-        self._line_check(self.fin_body, "FinalTracking", "Press_Release_Mention", "Press_Release_Mention", final)
-        self._line_text(self.fin_body, "FinalTracking", "Press Release Mention_Source",
-                        "Press Release Mention_Source:", lambda: final.get("Press Release Mention_Source", ""), width=56)
-        self._line_check(self.fin_body, "FinalTracking", "Any_Public_Mention", "Any_Public_Mention", final)
-        self._line_text(self.fin_body, "FinalTracking", "Any_Public_Mention_Source",
-                        "Any_Public_Mention_Source:", lambda: final.get("Any_Public_Mention_Source", ""), width=56)
-        self._line_text(self.fin_body, "FinalTracking", "Notes_or_Other",
-                        "Notes_or_Other:", lambda: final.get("Notes_or_Other", ""), width=56)
-        self._line_date(self.fin_body, "FinalTracking", "Public_Mention_Date",
-                        "Public_Mention_Date:", lambda: final.get("Public_Mention_Date"))
-        self._line_check(self.fin_body, "FinalTracking", "Final_Tracking_Done", "Final_Tracking_Done", final)
+        groups = {"Review": review, "Outreach": outreach, "FinalTracking": final}
+        for w, group, key, default in self._editors:
+            w.rebind(bill_id, groups[group].get(key, default))
+        self.cei_picker.rebind(bill_id,
+                               get_options=lambda: review.get("CeiExpertOptions", []),
+                               get_current=lambda: review.get("CeiExpert", []))
+
+        if not self._bodies_packed:
+            self.cg_grid.pack(fill="x", expand=True)
+            for body in (self.rev_body, self.out_body, self.fin_body):
+                body.pack(fill="x")
+            self._bodies_packed = True
@@ -29,6 +29,14 @@ class BoolCheck(ttk.Checkbutton):
         self.key = key
         self.set_value_callback = set_value_callback
 
+    def flush(self):
+        """Toggles save at once; nothing is ever pending."""
+
+    def rebind(self, bill_id: str, value):
+        """Point this (pooled) checkbox at another bill without recreating it."""
+        self.bill_id = bill_id
+        self.var.set(bool(value))
+
     def _on_change(self):
         new_val = bool(self.var.get())
         ok = self.set_value_callback(self.bill_id, self.group, self.key, new_val)
@@ -48,17 +56,35 @@ class TextEntry(ttk.Frame):
         self.set_value_callback = set_value_callback
 
         self.var = tk.StringVar(value=str(get_value() or ""))
+        self._loaded = self.var.get()
         self.entry = ttk.Entry(self, textvariable=self.var, width=width)
         self.entry.pack(fill="x", expand=True)
         self.entry.bind("<FocusOut>", self._save)
         self.entry.bind("<Return>", self._save)
 
+    def rebind(self, bill_id: str, value):
+        # a row click rebinds before Tk delivers this entry's FocusOut: commit the
+        # outgoing bill's edit first, or it would be lost
+        self.flush()
+        self.bill_id = bill_id
+        self.var.set(str(value or ""))
+        self._loaded = self.var.get()
+
+    def flush(self):
+        """Save a pending edit for the current bill (no-op when untouched)."""
+        self._save()
+
     def _save(self, _event=None):
         new_val = self.var.get()
+        if new_val == self._loaded:
+            # untouched since the last load/save (also the late FocusOut after a rebind)
+            return
+        # marked saved up front: the save re-renders the tables, which may rebind (and flush) us again
+        prev, self._loaded = self._loaded, new_val
         ok = self.set_value_callback(self.bill_id, self.group, self.key, new_val)
         if not ok:
             # we could show an error; for now just leave it as is
-            pass
+            self._loaded = prev
 
 class DateEntryValidated(ttk.Frame):
     """
@@ -74,6 +100,7 @@ class DateEntryValidated(ttk.Frame):
 
         self.err_var = tk.StringVar(value="")
         self.var = tk.StringVar(value=str(get_value() or ""))
+        self._loaded = self.var.get().strip()
 
         self.entry = ttk.Entry(self, textvariable=self.var, width=width)
         self.entry.pack(side="left")
@@ -83,13 +110,36 @@ class DateEntryValidated(ttk.Frame):
         self.err_lbl = ttk.Label(self, textvariable=self.err_var, foreground="#b00020")
         self.err_lbl.pack(side="left", padx=(8, 0))
 
+    def rebind(self, bill_id: str, value):
+        # same late-FocusOut race as TextEntry: commit the outgoing bill's date first
+        self.flush()
+        self.bill_id = bill_id
+        self.var.set(str(value or ""))
+        self._loaded = self.var.get().strip()
+        self.err_var.set("")
+
+    def flush(self):
+        """Save a pending valid date for the current bill; invalid input can't be kept."""
+        s = self.var.get().strip()
+        if s != self._loaded and is_valid_date(s):
+            self._commit(s)
+
+    def _commit(self, s: str) -> bool:
+        prev, self._loaded = self._loaded, s     # see TextEntry._save
+        ok = self.set_value_callback(self.bill_id, self.group, self.key, s or None)  # blank => null
+        if not ok:
+            self._loaded = prev
+        return ok
+
     def _on_blur(self, _event=None):
         s = self.var.get().strip()
+        if s == self._loaded:
+            # untouched since the last load/save (also the late FocusOut after a rebind)
+            self.err_var.set("")
+            return
         if s == "":
-            # blank => null
             self.err_var.set("")
-            ok = self.set_value_callback(self.bill_id, self.group, self.key, None)
-            if not ok:
+            if not self._commit(s):
                 self.err_var.set("Save failed")
             return
 
@@ -100,8 +150,7 @@ class DateEntryValidated(ttk.Frame):
             return
 
         self.err_var.set("")
-        ok = self.set_value_callback(self.bill_id, self.group, self.key, s)
-        if not ok:
+        if not self._commit(s):
             self.err_var.set("Save failed")
             self.entry.focus_set()
             self.entry.selection_range(0, "end")
@@ -120,13 +169,29 @@ class CeiExpertPicker(ttk.Frame):
         self.get_current = get_current       # () -> list[str] (0 or 1 items)
         self.set_value_callback = set_value_callback  # (bill_id, "Review", "CeiExpert", list[str]) -> bool
 
+        self.var = tk.StringVar(value="")
+
+        # Dropdown
+        self.combo = ttk.Combobox(self, textvariable=self.var, state="readonly", width=36)
+        self._load()
+        self.combo.pack(side="left")
+
+        # Save on change (except when "(none)" is chosen — use Clear for that)
+        self.combo.bind("<<ComboboxSelected>>", self._on_select)
+
+        # Clear button
+        ttk.Button(self, text="Clear", command=self._on_clear).pack(side="left", padx=(6, 0))
+
+        # Status
+        self.msg = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.msg, foreground="#2e7d32").pack(side="left", padx=(8, 0))
+
+    def _load(self):
         # Current value (text)
         cur_list = self.get_current() or []
         current = cur_list[0] if (isinstance(cur_list, list) and cur_list) else ""
-        self.var = tk.StringVar(value=current)
+        self.var.set(current)
 
-        # Dropdown
-        self.combo = ttk.Combobox(self, textvariable=self.var, state="readonly", width=36)
         opts = self.get_options() or []
         # Include a top "(none)" entry to visually indicate no selection. Selecting it won't save;
         # use Clear to actually write [] to the DB.
@@ -142,17 +207,12 @@ class CeiExpertPicker(ttk.Frame):
         except Exception:
             self.combo.current(0)
 
-        self.combo.pack(side="left")
-
-        # Save on change (except when "(none)" is chosen — use Clear for that)
-        self.combo.bind("<<ComboboxSelected>>", self._on_select)
-
-        # Clear button
-        ttk.Button(self, text="Clear", command=self._on_clear).pack(side="left", padx=(6, 0))
-
-        # Status
-        self.msg = tk.StringVar(value="")
-        ttk.Label(self, textvariable=self.msg, foreground="#2e7d32").pack(side="left", padx=(8, 0))
+    def rebind(self, bill_id, get_options, get_current):
+        self.bill_id = bill_id
+        self.get_options = get_options
+        self.get_current = get_current
+        self.msg.set("")
+        self._load()
 
     def _on_select(self, _evt=None):
         val = self.var.get().strip()
@@ -0,0 +1,112 @@
+# desktop_gui/export_dialog.py
+# Modal dialog for File → Export…: scope (this tab / whole DB), format, columns, file.
+# Returns {"scope", "fmt", "columns", "path"} or None if canceled; the app then
+# streams the rows with export_bills.export_bills on a worker thread.
+
+import tkinter as tk
+from datetime import date
+from tkinter import filedialog, ttk
+
+from export_bills import CG_COLUMNS, CUSTOM_COLUMNS, DEFAULT_COLUMNS, xlsx_available
+
+FORMAT_CHOICES = [("csv", "CSV"), ("xlsx", "Excel (.xlsx)"), ("ndjson", "NDJSON")]
+FILE_TYPES = {
+    "csv": [("CSV", "*.csv")],
+    "xlsx": [("Excel workbook", "*.xlsx")],
+    "ndjson": [("NDJSON", "*.ndjson *.jsonl")],
+}
+
+
+class ExportDialog(tk.Toplevel):
+    def __init__(self, parent, tab_title: str, tab_rows: int, db_rows: int, file_stem: str = "bills"):
+        super().__init__(parent)
+        self.title("Export")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.result = None
+        self.file_stem = file_stem
+        self.columns = list(CG_COLUMNS) + list(CUSTOM_COLUMNS)
+
+        body = ttk.Frame(self, padding=12)
+        body.pack(fill="both", expand=True)
+
+        # ---- Scope ----
+        ttk.Label(body, text="Rows").grid(row=0, column=0, sticky="w")
+        self.var_scope = tk.StringVar(value="tab")
+        ttk.Radiobutton(body, text=f"{tab_title} as shown ({tab_rows:,} bills, current order)",
+                        value="tab", variable=self.var_scope).grid(row=1, column=0, sticky="w")
+        ttk.Radiobutton(body, text=f"Whole database ({db_rows:,} bills)",
+                        value="all", variable=self.var_scope).grid(row=2, column=0, sticky="w")
+
+        # ---- Format ----
+        ttk.Label(body, text="Format").grid(row=3, column=0, sticky="w", pady=(10, 0))
+        fmt_row = ttk.Frame(body)
+        fmt_row.grid(row=4, column=0, sticky="w")
+        self.var_fmt = tk.StringVar(value="csv")
+        for fmt, label in FORMAT_CHOICES:
+            rb = ttk.Radiobutton(fmt_row, text=label, value=fmt, variable=self.var_fmt)
+            rb.pack(side="left", padx=(0, 12))
+            if fmt == "xlsx" and not xlsx_available():
+                rb.state(["disabled"])
+        if not xlsx_available():
+            ttk.Label(body, text="Excel export needs openpyxl (pip install openpyxl)",
+                      foreground="#555555").grid(row=5, column=0, sticky="w")
+
+        # ---- Columns ----
+        ttk.Label(body, text="Columns (customData fields are Group.Key)").grid(row=6, column=0, sticky="w", pady=(10, 0))
+        self.lb_cols = tk.Listbox(body, selectmode="extended", height=14, width=44, exportselection=False)
+        for col in self.columns:
+            self.lb_cols.insert("end", col)
+        self.lb_cols.grid(row=7, column=0, sticky="nsew", pady=(2, 0))
+        self._select_defaults()
+
+        # Buttons
+        btns = ttk.Frame(self); btns.pack(fill="x", padx=12, pady=(0, 12))
+        ttk.Button(btns, text="Default columns", command=self._select_defaults).pack(side="left")
+        ttk.Button(btns, text="Cancel", command=self._on_cancel).pack(side="right")
+        ttk.Button(btns, text="Export…", command=self._on_export).pack(side="right", padx=(0, 8))
+
+        self.update_idletasks()
+        self._center_over_parent(parent)
+        self.grab_set()
+        self.bind("<Escape>", lambda e: self._on_cancel())
+
+    def _center_over_parent(self, parent):
+        try:
+            x = parent.winfo_rootx() + (parent.winfo_width() - self.winfo_reqwidth()) // 2
+            y = parent.winfo_rooty() + (parent.winfo_height() - self.winfo_reqheight()) // 3
+            self.geometry(f"+{x}+{y}")
+        except Exception:
+            pass
+
+    def _select_defaults(self):
+        self.lb_cols.selection_clear(0, "end")
+        for i, col in enumerate(self.columns):
+            if col in DEFAULT_COLUMNS:
+                self.lb_cols.selection_set(i)
+
+    def _on_export(self):
+        # keep the listbox order (congressGovData first), not the click order
+        columns = [self.columns[i] for i in self.lb_cols.curselection()]
+        if not columns:
+            return
+        fmt = self.var_fmt.get()
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export to",
+            defaultextension="." + fmt,
+            filetypes=FILE_TYPES[fmt],
+            initialfile=f"{self.file_stem}_{date.today().isoformat()}.{fmt}",
+        )
+        if not path:
+            return
+        self.result = {"scope": self.var_scope.get(), "fmt": fmt, "columns": columns, "path": path}
+        self.destroy()
+
+    def _on_cancel(self):
+        self.result = None
+        self.destroy()
+
+    def show(self):
+        self.wait_window(self)
+        return self.result
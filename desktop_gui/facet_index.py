@@ -0,0 +1,137 @@
+# desktop_gui/facet_index.py
+# Facet index for the Filters dialog: facet -> value -> set(bill_id).
+# - built once at load, then update(bill_id, rec) / remove(bill_id) as records change
+# - options(facet) = sorted distinct values (no DB scan when the dialog opens)
+# - counts(within) = bills per value inside a candidate set (e.g. the current search)
+
+import threading
+from collections import Counter
+from operator import itemgetter
+
+# filters-dict key -> congressGovData field it filters on
+FACETS = {
+    "committees": "currentCommitteeName",
+    "sponsors": "sponsorFullName",
+    "types": "billType",
+    "chambers": "originChamber",
+    "parties": "sponsorParty",
+    "states": "sponsorState",
+}
+
+
+def facet_values(rec: dict) -> tuple:
+    """One value (or None) per FACETS entry, in FACETS order."""
+    cg = (rec or {}).get("congressGovData", {}) or {}
+    return tuple(str(v) if v else None for v in map(cg.get, FACETS.values()))
+
+
+def unique_values(db: dict, field: str) -> list[str]:
+    """Sorted distinct non-empty congressGovData[field] values (one-off scan, no index)."""
+    vals = set()
+    for rec in db.values():
+        v = ((rec or {}).get("congressGovData", {}) or {}).get(field)
+        if v:
+            vals.add(str(v))
+    return sorted(vals)
+
+
+class FacetIndex:
+    def __init__(self, db: dict | None = None):
+        self.lock = threading.RLock()
+        self.values: dict[str, dict[str, set]] = {f: {} for f in FACETS}
+        self.doc_values: dict[str, tuple] = {}
+        self.version = 0
+        self._options = {}          # facet -> (version, sorted values)
+        if db:
+            self.rebuild(db)
+
+    # ---------- build / maintain ----------
+    def rebuild(self, db: dict):
+        doc_values = {bid: facet_values(rec) for bid, rec in db.items()}
+        values = {}
+        for i, facet in enumerate(FACETS):
+            by_value = values[facet] = {}
+            for bid, vals in doc_values.items():
+                v = vals[i]
+                if v is not None:
+                    s = by_value.get(v)
+                    if s is None:
+                        by_value[v] = {bid}
+                    else:
+                        s.add(bid)
+        with self.lock:
+            self.values = values
+            self.doc_values = doc_values
+            self.version += 1
+
+    def update(self, bill_id: str, rec: dict):
+        new = facet_values(rec)
+        with self.lock:
+            old = self.doc_values.get(bill_id)
+            if old == new:
+                return
+            for i, facet in enumerate(FACETS):
+                if old is not None and old[i] != new[i]:
+                    self._drop(facet, old[i], bill_id)
+                if new[i] is not None and (old is None or old[i] != new[i]):
+                    self.values[facet].setdefault(new[i], set()).add(bill_id)
+            self.doc_values[bill_id] = new
+            self.version += 1
+
+    def remove(self, bill_id: str):
+        with self.lock:
+            old = self.doc_values.pop(bill_id, None)
+            if old is None:
+                return
+            for facet, v in zip(FACETS, old):
+                self._drop(facet, v, bill_id)
+            self.version += 1
+
+    def _drop(self, facet, value, bill_id):
+        s = self.values[facet].get(value)
+        if s is None:
+            return
+        s.discard(bill_id)
+        if not s:
+            del self.values[facet][value]
+
+    # ---------- query ----------
+    def options(self, facet: str) -> list[str]:
+        """Sorted distinct values of one facet (cached until the index changes)."""
+        with self.lock:
+            cached = self._options.get(facet)
+            if cached is None or cached[0] != self.version:
+                cached = self._options[facet] = (self.version, sorted(self.values[facet]))
+            return cached[1]
+
+    def bill_ids(self, facet: str, selected) -> set:
+        """Union of the id sets for the selected values of one facet."""
+        with self.lock:
+            out = set()
+            for v in selected:
+                out |= self.values[facet].get(v, set())
+            return out
+
+    def size(self, facet: str, selected) -> int:
+        """Bills having one of the selected values (no set is built)."""
+        with self.lock:
+            return sum(len(self.values[facet].get(v, ())) for v in selected)
+
+    def counts(self, within=None) -> dict[str, dict[str, int]]:
+        """
+        {facet: {value: bills}} over the bills in `within` (None = every bill).
+        Tallies only `within`, so a narrow search is cheap to count.
+        """
+        with self.lock:
+            if within is None:
+                return {f: {v: len(s) for v, s in self.values[f].items()} for f in FACETS}
+            rows = [vals for vals in map(self.doc_values.get, within) if vals is not None]
+        out = {}
+        for i, facet in enumerate(FACETS):
+            tally = Counter(map(itemgetter(i), rows))     # counted in C
+            tally.pop(None, None)
+            out[facet] = dict(tally)
+        return out
+
+    def __len__(self):
+        return len(self.doc_values)
@@ -1,34 +1,40 @@
 # desktop_gui/filter_dialog.py
 # Modal dialog to edit table filters & sorting.
 # Returns a dict (same shape as app.py's self.filters) or None if canceled.
+# Options come from the app's FacetIndex (no DB scan on open); with `counts`
+# each option shows how many bills it would match (current tab + search).
 
 import tkinter as tk
 from tkinter import ttk
 
-def _unique_values(db, key):
-    """Collect unique non-empty values from record['congressGovData'][key]."""
-    vals = set()
-    for rec in db.values():
-        cg = (rec or {}).get("congressGovData", {}) or {}
-        v = cg.get(key)
-        if v:
-            vals.add(str(v))
-    return sorted(vals)
+from desktop_gui.facet_index import FACETS, unique_values
+
+
+def _with_count(value, counts):
+    if counts is None:
+        return value
+    return f"{value}  ({counts.get(value, 0):,})"
+
 
 class FilterDialog(tk.Toplevel):
     BILL_TYPES = ["HR", "S", "HJRES", "SJRES", "HCONRES", "SCONRES"]
     CHAMBERS   = ["House", "Senate"]
 
-    def __init__(self, parent, initial_filters: dict, db: dict):
+    def __init__(self, parent, initial_filters: dict, db: dict, facets=None, counts=None):
         super().__init__(parent)
         self.title("Filters")
         self.resizable(False, False)
         self.transient(parent)
         self.result = None
+        counts = counts or {}
 
-        # Build option lists from DB
-        self.committee_options = _unique_values(db, "currentCommitteeName")
-        self.sponsor_options   = _unique_values(db, "sponsorFullName")
+        # Option lists: from the facet index when given, else one scan of the DB
+        def options(facet):
+            return facets.options(facet) if facets is not None else unique_values(db, FACETS[facet])
+        self.committee_options = options("committees")
+        self.sponsor_options   = options("sponsors")
+        self.state_options     = options("states")
+        self.party_options     = options("parties")
 
         # Clone initial filters
         f = initial_filters or {}
@@ -36,6 +42,8 @@ class FilterDialog(tk.Toplevel):
         self.init_sponsors   = set(f.get("sponsors") or [])
         self.init_types      = set(f.get("types") or [])
         self.init_chambers   = set(f.get("chambers") or [])
+        self.init_parties    = set(f.get("parties") or [])
+        self.init_states     = set(f.get("states") or [])
         self.init_date_field = f.get("date_field") or "latestActionDate"
         self.init_date_from  = f.get("date_from") or ""
         self.init_date_to    = f.get("date_to") or ""
@@ -45,6 +53,9 @@ class FilterDialog(tk.Toplevel):
         # Layout: two columns
         body = ttk.Frame(self, padding=12)
         body.pack(fill="both", expand=True)
+        if counts:
+            ttk.Label(body, text="(n) = bills in this tab matching the current search",
+                      foreground="#555555").grid(row=1, column=0, columnspan=2, sticky="w", pady=(8, 0))
 
         left  = ttk.Frame(body); left.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
         right = ttk.Frame(body); right.grid(row=0, column=1, sticky="nsew")
@@ -53,7 +64,7 @@ class FilterDialog(tk.Toplevel):
         ttk.Label(left, text="Committees").pack(anchor="w")
         self.lb_comm = tk.Listbox(left, selectmode="extended", height=10, width=36)
         for i, val in enumerate(self.committee_options):
-            self.lb_comm.insert("end", val)
+            self.lb_comm.insert("end", _with_count(val, counts.get("committees")))
             if val in self.init_committees:
                 self.lb_comm.selection_set(i)
         self.lb_comm.pack(fill="x", pady=(2, 10))
@@ -61,10 +72,18 @@ class FilterDialog(tk.Toplevel):
         ttk.Label(left, text="Sponsors").pack(anchor="w")
         self.lb_spons = tk.Listbox(left, selectmode="extended", height=10, width=36)
         for i, val in enumerate(self.sponsor_options):
-            self.lb_spons.insert("end", val)
+            self.lb_spons.insert("end", _with_count(val, counts.get("sponsors")))
             if val in self.init_sponsors:
                 self.lb_spons.selection_set(i)
-        self.lb_spons.pack(fill="x", pady=(2, 0))
+        self.lb_spons.pack(fill="x", pady=(2, 10))
+
+        ttk.Label(left, text="Sponsor State").pack(anchor="w")
+        self.lb_states = tk.Listbox(left, selectmode="extended", height=6, width=36)
+        for i, val in enumerate(self.state_options):
+            self.lb_states.insert("end", _with_count(val, counts.get("states")))
+            if val in self.init_states:
+                self.lb_states.selection_set(i)
+        self.lb_states.pack(fill="x", pady=(2, 0))
 
         # ---- Right column: Types, Chambers, Date filter, Sort ----
         grp_types = ttk.LabelFrame(right, text="Bill Types")
@@ -72,14 +91,24 @@ class FilterDialog(tk.Toplevel):
         self.var_types = {t: tk.BooleanVar(value=(t in self.init_types)) for t in self.BILL_TYPES}
         row = ttk.Frame(grp_types); row.pack(anchor="w", pady=4)
         for i, t in enumerate(self.BILL_TYPES):
-            ttk.Checkbutton(row, text=t, variable=self.var_types[t]).grid(row=0, column=i, padx=4, sticky="w")
+            ttk.Checkbutton(row, text=_with_count(t, counts.get("types")),
+                            variable=self.var_types[t]).grid(row=i // 3, column=i % 3, padx=4, sticky="w")
 
         grp_ch = ttk.LabelFrame(right, text="Origin Chamber")
         grp_ch.pack(fill="x", pady=(0, 8))
         self.var_chambers = {c: tk.BooleanVar(value=(c in self.init_chambers)) for c in self.CHAMBERS}
         row = ttk.Frame(grp_ch); row.pack(anchor="w", pady=4)
         for i, c in enumerate(self.CHAMBERS):
-            ttk.Checkbutton(row, text=c, variable=self.var_chambers[c]).grid(row=0, column=i, padx=4, sticky="w")
+            ttk.Checkbutton(row, text=_with_count(c, counts.get("chambers")),
+                            variable=self.var_chambers[c]).grid(row=0, column=i, padx=4, sticky="w")
+
+        grp_party = ttk.LabelFrame(right, text="Sponsor Party")
+        grp_party.pack(fill="x", pady=(0, 8))
+        self.var_parties = {p: tk.BooleanVar(value=(p in self.init_parties)) for p in self.party_options}
+        row = ttk.Frame(grp_party); row.pack(anchor="w", pady=4)
+        for i, p in enumerate(self.party_options):
+            ttk.Checkbutton(row, text=_with_count(p, counts.get("parties")),
+                            variable=self.var_parties[p]).grid(row=0, column=i, padx=4, sticky="w")
 
         grp_date = ttk.LabelFrame(right, text="Date Filter")
         grp_date.pack(fill="x", pady=(0, 8))
@@ -107,6 +136,8 @@ class FilterDialog(tk.Toplevel):
                         variable=self.var_sort_field).grid(row=0, column=0, padx=4, sticky="w")
         ttk.Radiobutton(sf, text="Introduced Date", value="introducedDate",
                         variable=self.var_sort_field).grid(row=0, column=1, padx=12, sticky="w")
+        ttk.Radiobutton(sf, text="Title", value="title",
+                        variable=self.var_sort_field).grid(row=0, column=2, padx=4, sticky="w")
         sd = ttk.Frame(grp_sort); sd.pack(anchor="w")
         ttk.Radiobutton(sd, text="Newest → Oldest", value="desc",
                         variable=self.var_sort_dir).grid(row=0, column=0, padx=4, sticky="w")
@@ -148,6 +179,8 @@ class FilterDialog(tk.Toplevel):
         sponsors   = self._collect_listbox(self.lb_spons, self.sponsor_options)
         types      = { t for t, var in self.var_types.items() if var.get() }
         chambers   = { c for c, var in self.var_chambers.items() if var.get() }
+        parties    = { p for p, var in self.var_parties.items() if var.get() }
+        states     = self._collect_listbox(self.lb_states, self.state_options)
         date_field = self.var_date_field.get()
         date_from  = self.var_date_from.get().strip() or None
         date_to    = self.var_date_to.get().strip() or None
@@ -160,6 +193,8 @@ class FilterDialog(tk.Toplevel):
             "sponsors": sponsors,
             "types": types,
             "chambers": chambers,
+            "parties": parties,
+            "states": states,
             "date_field": date_field,
             "date_from": date_from,
             "date_to": date_to,
@@ -176,9 +211,8 @@ class FilterDialog(tk.Toplevel):
         # Reset all controls to "no filters" but keep sort defaults
         self.lb_comm.selection_clear(0, "end")
         self.lb_spons.selection_clear(0, "end")
-        for var in self.var_types.values():
-            var.set(False)
-        for var in self.var_chambers.values():
+        self.lb_states.selection_clear(0, "end")
+        for var in (*self.var_types.values(), *self.var_chambers.values(), *self.var_parties.values()):
             var.set(False)
         self.var_date_from.set("")
         self.var_date_to.set("")
@@ -3,77 +3,38 @@
 
 from typing import Dict, Tuple, List
 
-def _cg_text(rec: dict) -> str:
-    """
-    Build a searchable text blob from congressGovData fields.
-    Only congressGovData is searched (not customData).
-    """
-    cg = rec.get("congressGovData", {}) or {}
-    parts = [
-        str(cg.get("billType", "")),
-        str(cg.get("billNumber", "")),
-        str(cg.get("title", "")),
-        str(cg.get("originChamber", "")),
-        str(cg.get("latestActionText", "")),
-        str(cg.get("sponsorFullName", "")),
-        str(cg.get("sponsorParty", "")),
-        str(cg.get("sponsorState", "")),
-        str(cg.get("currentCommitteeName", "")),
-        str(cg.get("currentSubcommitteeName", "")),
-        str(cg.get("introducedDate", "")),
-        str(cg.get("latestActionDate", "")),
-    ]
-    # Lowercase + single string for fast substring checks
-    return " ".join(parts).lower()
-
-def _matches(query: str, blob: str) -> bool:
-    """
-    AND match on tokens: every token in the query must be present in the blob.
-    """
-    q = (query or "").strip().lower()
-    if not q:
-        return True
-    tokens = [t for t in q.split() if t]
-    return all(t in blob for t in tokens)
+from desktop_gui.query import DateRange, Facet, Indexes, parse_query
 
-def search_items(db: Dict[str, dict], query: str) -> List[Tuple[str, dict]]:
+def _run_plan(db: Dict[str, dict], plan, index=None) -> List[Tuple[str, dict]]:
+    hits = plan.run(Indexes(db, search=index))
+    if hits is None:
+        return list(db.items())
+    return [(bid, rec) for bid, rec in db.items() if bid in hits]
+
+def search_items(db: Dict[str, dict], query: str, index=None) -> List[Tuple[str, dict]]:
     """
     Return a list of (bill_id, record) that match the query across congressGovData.
+    The query goes through the same engine as the GUI search box (desktop_gui.query):
+    free words prefix-match, field:value terms filter. With a search_index.SearchIndex
+    over db, words are looked up in the index instead of scanning every record.
     """
-    if not query or not query.strip():
-        return list(db.items())
-    out = []
-    for bid, rec in db.items():
-        blob = _cg_text(rec)
-        if _matches(query, blob):
-            out.append((bid, rec))
-    return out
+    return _run_plan(db, parse_query(query or ""), index)
 
 # -------- FILTERS DIALOG (UI only for Phase 4) --------
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Optional, Tuple
 
+from desktop_gui.facet_index import unique_values
+
 FIXED_BILL_TYPES = ["HR", "S", "HJRES", "SJRES", "HCONRES", "SCONRES"]
 FIXED_ORIGIN_CHAMBERS = ["House", "Senate"]
 
 def build_unique_committees(db: Dict[str, dict]) -> List[str]:
-    s = set()
-    for _, rec in db.items():
-        cg = rec.get("congressGovData", {}) or {}
-        name = (cg.get("currentCommitteeName") or "").strip()
-        if name:
-            s.add(name)
-    return sorted(s)
+    return unique_values(db, "currentCommitteeName")
 
 def build_unique_sponsors(db: Dict[str, dict]) -> List[str]:
-    s = set()
-    for _, rec in db.items():
-        cg = rec.get("congressGovData", {}) or {}
-        name = (cg.get("sponsorFullName") or "").strip()
-        if name:
-            s.add(name)
-    return sorted(s)
+    return unique_values(db, "sponsorFullName")
 
 class FiltersDialog(tk.Toplevel):
     """
@@ -254,28 +215,11 @@ def _parse_date(d: Optional[str]):
     except Exception:
         return None
 
-def _in_date_range(value: Optional[str], dfrom: str, dto: str) -> bool:
-    v = _parse_date(value)
-    if v is None:
-        return False
-    if dfrom:
-        vf = _parse_date(dfrom)
-        if not vf:
-            return False
-        if v < vf:
-            return False
-    if dto:
-        vt = _parse_date(dto)
-        if not vt:
-            return False
-        if v > vt:
-            return False
-    return True
-
 def filter_and_sort_items(
     db: Dict[str, dict],
     query: str,
     filters: Optional[dict],
+    index=None,
 ) -> Tuple[List[Tuple[str, dict]], str, str]:
     """
     Returns (items, sort_field, sort_dir)
@@ -284,11 +228,11 @@ def filter_and_sort_items(
     sort_dir: "asc" or "desc"
     """
     # 1) Global search across congressGovData
-    items = search_items(db, query)
+    plan = parse_query(query or "")
 
     if not filters:
         # default sort: latest desc, tiebreaker title A→Z (done in table)
-        return items, "latest", "desc"
+        return _run_plan(db, plan, index), "latest", "desc"
 
     comms = set(filters.get("committees") or [])
     spons = set(filters.get("sponsors") or [])
@@ -300,35 +244,23 @@ def filter_and_sort_items(
     sort_field = filters.get("sort_field") or "latest" # latest | introduced
     sort_dir = filters.get("sort_dir") or "desc"       # asc | desc
 
-    out = []
-    for bid, rec in items:
-        cg = rec.get("congressGovData", {}) or {}
-
-        # committees
-        if comms:
-            if (cg.get("currentCommitteeName") or "") not in comms:
-                continue
-        # sponsors
-        if spons:
-            if (cg.get("sponsorFullName") or "") not in spons:
-                continue
-        # bill types
-        if bill_types:
-            if (cg.get("billType") or "") not in bill_types:
-                continue
-        # origin chambers
-        if origin_chambers:
-            if (cg.get("originChamber") or "") not in origin_chambers:
-                continue
-        # date range (exclusive mode)
-        if date_mode == "introduced":
-            if not _in_date_range(cg.get("introducedDate"), date_from, date_to):
-                continue
-        elif date_mode == "latest":
-            if not _in_date_range(cg.get("latestActionDate"), date_from, date_to):
-                continue
-
-        out.append((bid, rec))
+    # 2) Structured filters join the search's plan (one engine, one pass)
+    preds = []
+    if comms:
+        preds.append(Facet("committees", comms))
+    if spons:
+        preds.append(Facet("sponsors", spons))
+    if bill_types:
+        preds.append(Facet("types", bill_types))
+    if origin_chambers:
+        preds.append(Facet("chambers", origin_chambers))
+    if date_mode in ("introduced", "latest"):
+        # _parse_date keeps the old rule: an unparseable bound matches nothing
+        if (date_from and not _parse_date(date_from)) or (date_to and not _parse_date(date_to)):
+            return [], sort_field, sort_dir
+        field = "introducedDate" if date_mode == "introduced" else "latestActionDate"
+        preds.append(DateRange(field, lo=date_from or None, hi=(date_to + "\uffff") if date_to else None))
+    out = _run_plan(db, plan.extend(preds), index)
 
     # sorting happens in table (we’ll pass the chosen field/dir)
     return out, sort_field, sort_dir
@@ -0,0 +1,142 @@
+# desktop_gui/latency.py
+# Opt-in interaction latency tracer for the GUI.
+# - @traced("op", ctx) wraps a method; while TRACER is off it only checks a flag
+# - each call records its duration plus context (DB size, result counts, ...)
+# - summary() = p50/p95/max per operation; readout() = one line for the status bar
+# - dump() writes the summary and the raw events as JSON for offline analysis
+# Enable with HILLWATCH_TRACE=1 or the Debug menu; the trace is written on exit.
+
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import json_codec
+from updater_metrics import quantile
+
+try:
+    from config import GUI_TRACE_ENABLED, GUI_TRACE_PATH  # type: ignore
+except Exception:
+    GUI_TRACE_ENABLED = os.getenv("HILLWATCH_TRACE", "") not in ("", "0")
+    GUI_TRACE_PATH = Path(__file__).resolve().parents[1] / "data" / "logs" / "gui_latency.json"
+
+MAX_EVENTS = 20000      # raw events kept for the dump (oldest dropped first)
+
+
+class LatencyTracer:
+    """Thread-safe: the search worker times _apply_search_and_filters too."""
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc)
+        self.samples: dict[str, list[float]] = {}     # op -> durations (seconds)
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.last = None
+        self.meta: dict = {}
+
+    def record(self, op: str, seconds: float, **ctx):
+        event = {"op": op, "t": round(time.perf_counter() - self.started, 4),
+                 "ms": round(seconds * 1000, 3), **ctx}
+        if threading.current_thread() is not threading.main_thread():
+            event["thread"] = threading.current_thread().name
+        with self.lock:
+            self.samples.setdefault(op, []).append(seconds)
+            self.events.append(event)
+            self.last = event
+
+    @contextmanager
+    def span(self, op: str, **ctx):
+        """Time a block; the yielded dict can take context known only at the end."""
+        if not self.enabled:
+            yield ctx
+            return
+        t0 = time.perf_counter()
+        try:
+            yield ctx
+        finally:
+            self.record(op, time.perf_counter() - t0, **ctx)
+
+    def summary(self) -> dict:
+        with self.lock:
+            samples = {op: sorted(vals) for op, vals in self.samples.items()}
+        return {
+            op: {
+                "count": len(vals),
+                "p50_ms": round(quantile(vals, 0.50) * 1000, 3),
+                "p95_ms": round(quantile(vals, 0.95) * 1000, 3),
+                "max_ms": round(vals[-1] * 1000, 3),
+            }
+            for op, vals in sorted(samples.items())
+        }
+
+    def readout(self) -> str:
+        """Last operation, plus the one with the worst p95 so far."""
+        summary = self.summary()
+        last = self.last
+        if not summary or last is None:
+            return "Latency trace on: no operations yet"
+        extra = ", ".join(f"{k}={v}" for k, v in last.items() if k not in ("op", "t", "ms"))
+        text = f"Last: {last['op']} {last['ms']:.1f} ms" + (f" ({extra})" if extra else "")
+        op, s = max(summary.items(), key=lambda kv: kv[1]["p95_ms"])
+        return (text + f"   ·   slowest p95: {op} {s['p95_ms']:.1f} ms "
+                f"(p50 {s['p50_ms']:.1f}, max {s['max_ms']:.1f}, n={s['count']})")
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+            self.events.clear()
+            self.last = None
+
+    def to_dict(self) -> dict:
+        summary = self.summary()
+        with self.lock:
+            return {
+                "startedAt": self.started_at.isoformat(timespec="seconds"),
+                "finishedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "meta": dict(self.meta),
+                "operations": summary,
+                "events": list(self.events),
+            }
+
+    def dump(self, path=None) -> Path:
+        path = Path(path or GUI_TRACE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        json_codec.write_file_atomic(self.to_dict(), path)
+        return path
+
+
+TRACER = LatencyTracer(GUI_TRACE_ENABLED)
+
+
+def traced(op: str, ctx=None):
+    """
+    Decorator: time each call into TRACER while it is enabled.
+    ctx(result, *args, **kwargs) -> dict of context for the event (DB size, rows, ...).
+    """
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                TRACER.record(op, time.perf_counter() - t0, error=type(e).__name__)
+                raise
+            seconds = time.perf_counter() - t0
+            extra = {}
+            if ctx is not None:
+                try:
+                    extra = ctx(result, *args, **kwargs)
+                except Exception:
+                    pass    # context is best-effort; never break the traced call
+            TRACER.record(op, seconds, **extra)
+            return result
+        return wrapper
+    return deco
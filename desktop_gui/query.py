@@ -0,0 +1,271 @@
+# desktop_gui/query.py
+# Search-box query language, compiled to index lookups.
+#   sponsor:blumenthal committee:"energy and natural resources" type:s,hr
+#   latest>=2025-06-01 introduced:2025-03 watch:yes -party:r clean water
+# - field:value    substring match (sponsor, committee) or exact (type, chamber,
+#                  party, state); "a,b" = either; quotes keep spaces together
+# - date op value  latest / introduced with >= > <= < ; ":" or "=" = prefix (2025-06)
+# - watch:yes|no   on the WatchList (customData)
+# - -term          negates any term; everything else is free text (all words must
+#                  prefix-match, same as the plain search box)
+# A Plan runs the indexed predicates cheapest-first (estimated from the token,
+# facet and date indexes) and checks the rest record by record on the survivors.
+# Without indexes every predicate falls back to a per-record test, which is what
+# filters.filter_and_sort_items uses.
+
+import re
+from functools import lru_cache
+
+from desktop_gui.facet_index import FACETS
+from desktop_gui.search_index import record_tokens, tokenize
+
+# query field -> (facet key, exact match?)
+FACET_FIELDS = {
+    "sponsor": ("sponsors", False),
+    "committee": ("committees", False),
+    "type": ("types", True),
+    "chamber": ("chambers", True),
+    "party": ("parties", True),
+    "state": ("states", True),
+}
+# query field -> congressGovData date field (both are SortIndex fields)
+DATE_FIELDS = {
+    "latest": "latestActionDate",
+    "introduced": "introducedDate",
+}
+YES = frozenset(("yes", "y", "true", "1"))
+
+# once the running result is this many times smaller than a predicate's own
+# estimate, testing the survivors one by one beats building the predicate's set
+SCAN_FACTOR = 8
+
+_TERM_RE = re.compile(r'(-)?(?:([A-Za-z]+)(>=|<=|>|<|:|=))?("[^"]*"?|\S+)')
+
+
+class Indexes:
+    """What a plan may use; any index left None is answered record by record."""
+    def __init__(self, db, search=None, facets=None, dates=None, watched=None):
+        self.db = db
+        self.search = search        # SearchIndex
+        self.facets = facets        # FacetIndex
+        self.dates = dates          # SortIndex (range_ids / range_count)
+        self.watched = watched      # container of WatchList bill ids
+
+
+def _cg(rec):
+    return (rec or {}).get("congressGovData", {}) or {}
+
+
+# ---------- Predicates ----------
+class Text:
+    """Every word prefix-matches a searched token (SearchIndex semantics)."""
+    def __init__(self, words):
+        self.words = list(words)
+
+    def indexed(self, ix):
+        return ix.search is not None
+
+    def estimate(self, ix):
+        return min(ix.search.doc_freq(w) for w in self.words)
+
+    def ids(self, ix):
+        return ix.search.search(" ".join(self.words))
+
+    def test(self, bid, rec, ix):
+        toks = ix.search.doc_tokens.get(bid) if ix.search is not None else None
+        if toks is None:
+            toks = record_tokens(rec)
+        return all(any(t.startswith(w) for t in toks) for w in self.words)
+
+
+class Facet:
+    """congressGovData facet value among `values`: exact (case-insensitive) or substring."""
+    def __init__(self, facet, values, exact=True):
+        self.facet = facet
+        self.field = FACETS[facet]
+        self.exact = exact
+        self.values = frozenset(v.lower() for v in values if v)
+        self._needles = re.compile("|".join(map(re.escape, sorted(self.values))) or "(?!)")
+        self._cache = (None, None, None)    # (index, version, matching values)
+
+    def _ok(self, value):
+        v = str(value or "").lower()
+        if not v:
+            return False
+        if self.exact:
+            return v in self.values
+        return self._needles.search(v) is not None
+
+    def indexed(self, ix):
+        return ix.facets is not None
+
+    def _matching(self, ix):
+        # distinct values are far fewer than bills, so matching them beats touching bills;
+        # kept until the index changes (estimate + ids, and the next keystroke, reuse it)
+        index, version, values = self._cache
+        if index is not ix.facets or version != ix.facets.version:
+            values = [v for v in ix.facets.options(self.facet) if self._ok(v)]
+            self._cache = (ix.facets, ix.facets.version, values)
+        return values
+
+    def estimate(self, ix):
+        return ix.facets.size(self.facet, self._matching(ix))
+
+    def ids(self, ix):
+        return ix.facets.bill_ids(self.facet, self._matching(ix))
+
+    def test(self, bid, rec, ix):
+        return self._ok(_cg(rec).get(self.field))
+
+
+class DateRange:
+    """lo <= congressGovData[field] < hi in string order (YYYY-MM-DD); empty dates never match."""
+    def __init__(self, field, lo=None, hi=None):
+        self.field = field
+        self.lo = lo or "\x00"
+        self.hi = hi
+
+    @classmethod
+    def from_op(cls, field, op, value):
+        if op in (":", "="):
+            return cls(field, value, value + "\uffff")
+        if op == ">=":
+            return cls(field, lo=value)
+        if op == ">":
+            return cls(field, lo=value + "\uffff")
+        if op == "<=":
+            return cls(field, hi=value + "\uffff")
+        return cls(field, hi=value)
+
+    def indexed(self, ix):
+        return ix.dates is not None
+
+    def estimate(self, ix):
+        return ix.dates.range_count(self.field, self.lo, self.hi)
+
+    def ids(self, ix):
+        return set(ix.dates.range_ids(self.field, self.lo, self.hi))
+
+    def test(self, bid, rec, ix):
+        v = _cg(rec).get(self.field) or ""
+        return self.lo <= v and (self.hi is None or v < self.hi)
+
+
+class Watched:
+    """Review.WatchList is set."""
+    def indexed(self, ix):
+        return ix.watched is not None
+
+    def estimate(self, ix):
+        return len(ix.watched)
+
+    def ids(self, ix):
+        return set(ix.watched)
+
+    def test(self, bid, rec, ix):
+        if ix.watched is not None:
+            return bid in ix.watched
+        review = ((rec or {}).get("customData") or {}).get("Review") or {}
+        return bool(review.get("WatchList"))
+
+
+class Not:
+    """Negation: always tested per record (its complement is rarely selective)."""
+    def __init__(self, pred):
+        self.pred = pred
+
+    def indexed(self, ix):
+        return False
+
+    def test(self, bid, rec, ix):
+        return not self.pred.test(bid, rec, ix)
+
+
+# ---------- Parse / plan ----------
+class Plan:
+    def __init__(self, preds, free_text=""):
+        self.preds = list(preds)
+        self.free_text = free_text      # non-negated free words (relevance ranking)
+        self.uses_custom = any(isinstance(p.pred if isinstance(p, Not) else p, Watched) for p in self.preds)
+
+    def __bool__(self):
+        return bool(self.preds)
+
+    def extend(self, preds):
+        return Plan(self.preds + list(preds), self.free_text)
+
+    def run(self, ix, within=None) -> set | None:
+        """
+        Matching bill ids (None = the plan has no predicates). `within` limits the
+        result to a candidate set (e.g. the tab's bills).
+        """
+        if not self.preds:
+            return None
+        db = ix.db
+        indexed = sorted(((p.estimate(ix), i, p) for i, p in enumerate(self.preds) if p.indexed(ix)),
+                         key=lambda t: t[:2])
+        rest = [p for p in self.preds if not p.indexed(ix)]
+        if indexed:
+            result = None
+            for est, _i, p in indexed:
+                if result is None:
+                    result = p.ids(ix)
+                    if within is not None:
+                        result = {bid for bid in result if bid in within}
+                elif len(result) * SCAN_FACTOR < est:
+                    rest.append(p)
+                    continue
+                else:
+                    result &= p.ids(ix)
+                if not result:
+                    return set()
+        else:
+            result = db.keys() if within is None else within
+        if rest:
+            result = {bid for bid in result
+                      if bid in db and all(p.test(bid, db[bid], ix) for p in rest)}
+        return result if isinstance(result, set) else set(result)
+
+    def test(self, bid, rec, ix) -> bool:
+        """One record against the whole plan (incremental updates)."""
+        return all(p.test(bid, rec, ix) for p in self.preds)
+
+
+def _unquote(value):
+    if value.startswith('"'):
+        value = value[1:]
+        if value.endswith('"'):
+            value = value[:-1]
+    return value
+
+
+@lru_cache(maxsize=64)
+def parse_query(text: str) -> Plan:
+    """Search-box text -> Plan. Unknown `field:` prefixes are just free text."""
+    preds, words = [], []
+    for m in _TERM_RE.finditer(text or ""):
+        neg, field, op, value = m.groups()
+        field = (field or "").lower()
+        value = _unquote(value)
+        pred = None
+        if field in FACET_FIELDS and op in (":", "="):
+            facet, exact = FACET_FIELDS[field]
+            pred = Facet(facet, [v.strip() for v in value.split(",")], exact)
+        elif field in DATE_FIELDS and value:
+            pred = DateRange.from_op(DATE_FIELDS[field], op, value)
+        elif field == "watch" and op in (":", "="):
+            pred = Watched() if value.lower() in YES else Not(Watched())
+        elif field:
+            value = f"{field} {value}"      # e.g. "hr:1234" searches both words
+        if pred is None:
+            toks = tokenize(value)
+            if not toks:
+                continue
+            if not neg:
+                words.extend(toks)
+                continue
+            pred = Text(toks)
+        preds.append(Not(pred) if neg else pred)
+    if words:
+        preds.insert(0, Text(words))
+    return Plan(preds, " ".join(words))
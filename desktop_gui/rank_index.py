@@ -0,0 +1,338 @@
+# desktop_gui/rank_index.py
+# Relevance ranking for the search box ("Rank by relevance").
+# - BM25F over title, latest action text and committee, with per-field weights
+# - term -> set(bill_id) postings (document frequency = len), per-field lengths
+#   and their running totals, all built once at load and kept in sync by
+#   update(bill_id, rec) / remove(bill_id)
+# - per field, word and hit count, the bills holding the word that many times,
+#   sorted by the field's length (by_len): a shorter field scores a hit higher,
+#   so walking one list gives falling caps on what the word adds
+# - top_k() walks those lists for the query terms and stops once the caps left
+#   can't beat the k-th best score so far: bills further down never get scored
+
+import bisect
+import heapq
+import math
+import threading
+
+from desktop_gui.search_index import tokenize
+
+# congressGovData field -> weight (a title hit counts most)
+RANK_FIELDS = {
+    "title": 3.0,
+    "currentCommitteeName": 1.5,
+    "latestActionText": 1.0,
+}
+K1 = 1.2
+B = 0.75
+TOP_K = 200
+
+
+def field_tokens(rec: dict) -> tuple:
+    """One token tuple per RANK_FIELDS entry, in RANK_FIELDS order."""
+    cg = (rec or {}).get("congressGovData", {}) or {}
+    return tuple(tuple(tokenize(str(cg.get(f) or ""))) for f in RANK_FIELDS)
+
+
+class RankIndex:
+    def __init__(self, db: dict | None = None):
+        self.lock = threading.RLock()       # queried from the search worker, updated on the Tk thread
+        self.postings: dict[str, set] = {}
+        self.vocab: list[str] = []          # sorted keys of postings (prefix expansion)
+        self.doc_fields: dict[str, tuple] = {}
+        self.by_len: list[dict] = [{} for _ in RANK_FIELDS]  # per field: word -> {hits: sorted [(len, bill)]}
+        self.total_len = [0] * len(RANK_FIELDS)
+        self.version = 0
+        if db:
+            self.rebuild(db)
+
+    # ---------- build / maintain ----------
+    def rebuild(self, db: dict):
+        postings: dict[str, set] = {}
+        doc_fields = {}
+        by_len = [{} for _ in RANK_FIELDS]
+        total_len = [0] * len(RANK_FIELDS)
+        for bid, rec in db.items():
+            fields = field_tokens(rec)
+            doc_fields[bid] = fields
+            for i, toks in enumerate(fields):
+                total_len[i] += len(toks)
+                entry = (len(toks), bid)
+                for t, hits in _counts(toks).items():
+                    by_len[i].setdefault(t, {}).setdefault(hits, []).append(entry)
+            for t in set().union(*fields):
+                s = postings.get(t)
+                if s is None:
+                    postings[t] = {bid}
+                else:
+                    s.add(bid)
+        for words in by_len:
+            for buckets in words.values():
+                for lst in buckets.values():
+                    lst.sort()
+        with self.lock:
+            self.postings = postings
+            self.vocab = sorted(postings)
+            self.doc_fields = doc_fields
+            self.by_len = by_len
+            self.total_len = total_len
+            self.version += 1
+
+    def update(self, bill_id: str, rec: dict):
+        new = field_tokens(rec)
+        with self.lock:
+            old = self.doc_fields.get(bill_id)
+            if old == new:
+                return
+            self._unlink(bill_id, old)
+            for i, toks in enumerate(new):
+                self.total_len[i] += len(toks)
+                entry = (len(toks), bill_id)
+                for t, hits in _counts(toks).items():
+                    bisect.insort(self.by_len[i].setdefault(t, {}).setdefault(hits, []), entry)
+            for t in set().union(*new):
+                s = self.postings.get(t)
+                if s is None:
+                    self.postings[t] = {bill_id}
+                    bisect.insort(self.vocab, t)
+                else:
+                    s.add(bill_id)
+            self.doc_fields[bill_id] = new
+            self.version += 1
+
+    def remove(self, bill_id: str):
+        with self.lock:
+            self._unlink(bill_id, self.doc_fields.pop(bill_id, None))
+            self.version += 1
+
+    def _unlink(self, bill_id, fields):
+        if fields is None:
+            return
+        for i, toks in enumerate(fields):
+            self.total_len[i] -= len(toks)
+            entry = (len(toks), bill_id)
+            for t, hits in _counts(toks).items():
+                buckets = self.by_len[i].get(t, {})
+                lst = buckets.get(hits)
+                if lst is None:
+                    continue
+                j = bisect.bisect_left(lst, entry)
+                if j < len(lst) and lst[j] == entry:
+                    del lst[j]
+                if not lst:
+                    del buckets[hits]
+                    if not buckets:
+                        del self.by_len[i][t]
+        for t in set().union(*fields):
+            s = self.postings.get(t)
+            if s is None:
+                continue
+            s.discard(bill_id)
+            if not s:
+                del self.postings[t]
+                j = bisect.bisect_left(self.vocab, t)
+                if j < len(self.vocab) and self.vocab[j] == t:
+                    del self.vocab[j]
+
+    # ---------- scoring ----------
+    def _expand(self, term: str) -> frozenset:
+        """Indexed words the query term prefixes (same matching as the search box)."""
+        i = bisect.bisect_left(self.vocab, term)
+        j = bisect.bisect_left(self.vocab, term + "\uffff")
+        return frozenset(self.vocab[i:j])
+
+    def _query(self, query: str):
+        """[(words, idf)] per distinct query term that occurs in the ranked fields."""
+        n = len(self.doc_fields)
+        out = []
+        for term in dict.fromkeys(tokenize(query)):
+            words = self._expand(term)
+            if not words:
+                continue
+            df = min(n, sum(len(self.postings[w]) for w in words))
+            out.append((words, math.log(1 + (n - df + 0.5) / (df + 0.5))))
+        return out
+
+    def _score(self, fields, terms, avg_len) -> float:
+        norms = [1 - B + B * (len(toks) / avg if avg else 0.0) for toks, avg in zip(fields, avg_len)]
+        score = 0.0
+        for words, idf in terms:
+            tf = 0.0
+            for (toks, weight), norm in zip(zip(fields, RANK_FIELDS.values()), norms):
+                hits = sum(1 for t in toks if t in words)
+                if hits:
+                    tf += weight * hits / norm
+            if tf:
+                score += idf * tf * (K1 + 1) / (tf + K1)
+        return score
+
+    def _avg_len(self):
+        n = len(self.doc_fields) or 1
+        return [total / n for total in self.total_len]
+
+    def score(self, query: str, bill_id: str) -> float:
+        with self.lock:
+            fields = self.doc_fields.get(bill_id)
+            if fields is None:
+                return 0.0
+            return self._score(fields, self._query(query), self._avg_len())
+
+    def _streams(self, terms, avg_len):
+        """
+        Streams of (field length, bill) in ascending length, each with a hit cap and the
+        (term, field) group it covers: one per hit count for a single word (an exact cap;
+        a bill sits in just one of them), one merged over the words for a prefix term
+        (the words' max counts summed).
+        """
+        out = []
+        groups = 0
+        for words, idf in terms:
+            for i, weight in enumerate(RANK_FIELDS.values()):
+                buckets = [self.by_len[i][w] for w in words if w in self.by_len[i]]
+                if not buckets:
+                    continue
+                if len(buckets) == 1:
+                    for hits, lst in buckets[0].items():
+                        out.append((iter(lst), idf, weight, hits, avg_len[i], groups))
+                else:
+                    cap = sum(max(b) for b in buckets)
+                    lists = [lst for b in buckets for lst in b.values()]
+                    out.append((heapq.merge(*lists), idf, weight, cap, avg_len[i], groups))
+                groups += 1
+        return out, groups
+
+    def top_k(self, query: str, candidates=None, k: int = TOP_K, tie=None) -> tuple[list, dict]:
+        """
+        Best k bills for the query as ([bill_id, ...] best first, {bill_id: score}).
+        candidates limits the result (e.g. the search/filter matches); bills in it
+        without a query term in the ranked fields score 0 and only fill leftover slots.
+        tie(bill_id) orders equal scores (default: bill id); pass the display order's
+        tie-break so the bills kept at the cutoff are the ones shown first.
+
+        Threshold pruning over the by_len streams: a stream's head caps what its term can
+        add, in its field, to any bill not reached yet (cap hits over a field no shorter
+        than the head's; BM25 saturation is subadditive, so the caps sum to a bound).
+        Once the heads' sum can't beat the k-th score the walk stops; the returned
+        scores cover just the bills scored.
+        """
+        tie = tie or (lambda bid: bid)
+        if isinstance(candidates, (list, tuple)):
+            candidates = set(candidates)
+        with self.lock:
+            terms = self._query(query)
+            avg_len = self._avg_len()
+            doc_fields = self.doc_fields
+            carrying = set()
+            for words, _idf in terms:
+                for w in words:
+                    carrying |= self.postings[w]
+            if candidates is not None:
+                if len(candidates) < len(carrying):
+                    carrying = {bid for bid in candidates if bid in carrying}
+                else:
+                    carrying = {bid for bid in carrying if bid in candidates}
+
+            scores = {}
+            if len(carrying) <= 4 * k:
+                # few enough to score outright (a small tab, or a rare word)
+                for bid in carrying:
+                    scores[bid] = self._score(doc_fields[bid], terms, avg_len)
+            else:
+                self._walk(terms, avg_len, carrying, k, tie, scores)
+        best = heapq.nsmallest(k, scores, key=lambda bid: (-scores[bid], tie(bid)))
+        if len(best) < k and candidates is not None:
+            rest = (bid for bid in candidates if bid not in carrying)
+            for bid in heapq.nsmallest(k - len(best), rest, key=tie):
+                scores[bid] = 0.0
+                best.append(bid)
+        return best, scores
+
+    def _walk(self, terms, avg_len, carrying, k, tie, scores):
+        """Fill scores with every bill that can still make the top k (caller holds the lock)."""
+        streams, groups = self._streams(terms, avg_len)
+        members = [[] for _ in range(groups)]
+        for s, stream in enumerate(streams):
+            members[stream[5]].append(s)
+        heads = [None] * len(streams)   # (field length, bill) next in each stream
+        caps = [0.0] * len(streams)     # what that bill's stream can add to it (0 once drained)
+
+        def advance(s):
+            it, idf, weight, cap, avg, _g = streams[s]
+            heads[s] = nxt = next(it, None)
+            if nxt is None:
+                caps[s] = 0.0
+                return
+            # cap / norm peaks at n == cap and falls after it: the cap for this bill and
+            # every longer one behind it in the stream
+            norm = 1 - B + B * (max(nxt[0], cap) / avg if avg else 0.0)
+            tf = 0.0 + weight * cap / norm
+            caps[s] = idf * tf * (K1 + 1) / (tf + K1)
+
+        for s in range(len(streams)):
+            advance(s)
+        # per (term, field) group its best head cap (a bill is in one stream of a group);
+        # summed over the groups, the most any bill not reached yet can score
+        top = [max(caps[s] for s in group) for group in members]
+        live = [g for g in range(groups) if top[g] > 0.0]
+        kth = []        # the best k so far, worst on top: (score, _Desc(tie))
+        passed = set()  # level with the bar but behind it on the tie: can never get in
+        turn = 0
+        while live:
+            if 2 * (len(scores) + len(passed)) > len(carrying):
+                # not pruning (prefix terms cap loosely): the rest costs less scored outright
+                for bid in carrying:
+                    if bid not in scores and bid not in passed:
+                        scores[bid] = self._score(self.doc_fields[bid], terms, avg_len)
+                return
+            ub = sum(top)
+            if len(kth) == k:
+                bar, worst = kth[0]
+                if ub < bar:
+                    break
+            # groups take turns (a short stream drains fast and its cap drops out)
+            g = live[turn % len(live)]
+            turn += 1
+            group = members[g]
+            s = group[0] if len(group) == 1 else max(group, key=caps.__getitem__)
+            bid = heads[s][1]
+            advance(s)
+            top[g] = caps[s] if len(group) == 1 else max(caps[x] for x in group)
+            if top[g] == 0.0:
+                live.remove(g)
+            if bid in scores or bid in passed or bid not in carrying:
+                continue
+            t = tie(bid)
+            if len(kth) == k and ub == bar and t > worst.v:
+                passed.add(bid)
+                continue
+            score = self._score(self.doc_fields[bid], terms, avg_len)
+            scores[bid] = score
+            entry = (score, _Desc(t))
+            if len(kth) < k:
+                heapq.heappush(kth, entry)
+            elif kth[0] < entry:
+                heapq.heapreplace(kth, entry)
+
+    def __len__(self):
+        return len(self.doc_fields)
+
+
+class _Desc:
+    """Reverses comparison, so a min-heap keeps the largest tie key on top."""
+    __slots__ = ("v",)
+
+    def __init__(self, v):
+        self.v = v
+
+    def __lt__(self, other):
+        return self.v > other.v
+
+    def __eq__(self, other):
+        return self.v == other.v
+
+
+def _counts(toks) -> dict:
+    counts = {}
+    for t in toks:
+        counts[t] = counts.get(t, 0) + 1
+    return counts
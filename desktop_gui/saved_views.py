@@ -0,0 +1,54 @@
+# desktop_gui/saved_views.py
+# Named "smart views": a tab source + search text + filters + sort, saved to
+# data/saved_views.json and shown as extra tabs in the GUI.
+# Spec shape: {"name", "tab": "feed"|"watch"|"reject"|"complete", "filters": {...}}
+# where filters is app.py's filters dict (text, sets as lists on disk, sort, rank).
+
+from pathlib import Path
+
+import json_codec
+
+try:
+    from config import SAVED_VIEWS_PATH  # type: ignore
+except Exception:
+    SAVED_VIEWS_PATH = Path(__file__).resolve().parents[1] / "data" / "saved_views.json"
+
+SET_KEYS = ("committees", "sponsors", "types", "chambers", "parties", "states")
+SORT_KEYS = ("sort_field", "sort_dir")
+
+
+def make_spec(name: str, tab: str, filters: dict) -> dict:
+    f = {k: (sorted(v) if k in SET_KEYS else v) for k, v in filters.items()}
+    return {"name": name, "tab": tab, "filters": f}
+
+
+def spec_filters(spec: dict) -> dict:
+    """The spec's filters in app.py's in-memory shape (sets, not lists)."""
+    f = dict(spec.get("filters") or {})
+    for k in SET_KEYS:
+        f[k] = set(f.get(k) or [])
+    return f
+
+
+def content_key(spec: dict) -> tuple:
+    """What decides which bills are in the view (sort excluded: re-sorting needs no re-filter)."""
+    f = spec.get("filters") or {}
+    return (spec.get("tab"),) + tuple(
+        (k, tuple(sorted(v)) if k in SET_KEYS else v)
+        for k, v in sorted(f.items()) if k not in SORT_KEYS
+    )
+
+
+def load_saved_views() -> list[dict]:
+    p = Path(SAVED_VIEWS_PATH)
+    if not p.exists():
+        return []
+    try:
+        data = json_codec.load_file(p)
+    except (OSError, ValueError):
+        return []
+    return [v for v in (data.get("views") or []) if v.get("name")]
+
+
+def save_saved_views(specs: list[dict]) -> None:
+    json_codec.write_file_atomic({"views": specs}, SAVED_VIEWS_PATH)
@@ -0,0 +1,151 @@
+# desktop_gui/search_index.py
+# Inverted token index over the searched congressGovData fields.
+# - token -> set(bill_id) posting lists, built once at load
+# - update(bill_id, rec) / remove(bill_id) keep it in sync when records change
+# - search("ener comm") = AND of tokens; each token is a prefix match found by
+#   bisecting the sorted vocabulary
+
+import bisect
+import re
+import threading
+
+# congressGovData fields the search box looks at (customData is never searched)
+SEARCH_FIELDS = (
+    "billType",
+    "billNumber",
+    "title",
+    "originChamber",
+    "latestActionText",
+    "sponsorFullName",
+    "sponsorParty",
+    "sponsorState",
+    "currentCommitteeName",
+    "currentSubcommitteeName",
+    "introducedDate",
+    "latestActionDate",
+)
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+# below this many candidates, checking each bill's own tokens beats unioning postings
+_SCAN_CANDIDATES = 256
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word/number runs; 'HR.1234 - Energy' -> ['hr', '1234', 'energy']."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def record_tokens(rec: dict) -> frozenset:
+    cg = (rec or {}).get("congressGovData", {}) or {}
+    # one regex pass over the joined fields; the separator keeps fields apart
+    text = " ".join(str(v) for v in map(cg.get, SEARCH_FIELDS) if v)
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+class SearchIndex:
+    def __init__(self, db: dict | None = None):
+        self.lock = threading.RLock()       # searched from worker threads, updated on the Tk thread
+        self.postings: dict[str, set] = {}
+        self.doc_tokens: dict[str, frozenset] = {}
+        self.vocab: list[str] = []          # sorted keys of postings
+        self.version = 0                    # bumped on every change (cache key for callers)
+        if db:
+            self.rebuild(db)
+
+    # ---------- build / maintain ----------
+    def rebuild(self, db: dict):
+        postings: dict[str, set] = {}
+        doc_tokens = {}
+        for bid, rec in db.items():
+            toks = record_tokens(rec)
+            doc_tokens[bid] = toks
+            for t in toks:
+                s = postings.get(t)
+                if s is None:
+                    postings[t] = {bid}
+                else:
+                    s.add(bid)
+        with self.lock:
+            self.postings = postings
+            self.doc_tokens = doc_tokens
+            self.vocab = sorted(postings)
+            self.version += 1
+
+    def update(self, bill_id: str, rec: dict):
+        """Re-index one record (new or changed). Only touched tokens are updated."""
+        new = record_tokens(rec)
+        with self.lock:
+            old = self.doc_tokens.get(bill_id, frozenset())
+            if new == old and bill_id in self.doc_tokens:
+                return
+            for t in old - new:
+                self._drop(t, bill_id)
+            for t in new - old:
+                s = self.postings.get(t)
+                if s is None:
+                    self.postings[t] = {bill_id}
+                    bisect.insort(self.vocab, t)
+                else:
+                    s.add(bill_id)
+            self.doc_tokens[bill_id] = new
+            self.version += 1
+
+    def remove(self, bill_id: str):
+        with self.lock:
+            for t in self.doc_tokens.pop(bill_id, frozenset()):
+                self._drop(t, bill_id)
+            self.version += 1
+
+    def _drop(self, token: str, bill_id: str):
+        s = self.postings.get(token)
+        if s is None:
+            return
+        s.discard(bill_id)
+        if not s:
+            del self.postings[token]
+            i = bisect.bisect_left(self.vocab, token)
+            if i < len(self.vocab) and self.vocab[i] == token:
+                del self.vocab[i]
+
+    # ---------- query ----------
+    def _prefix_tokens(self, prefix: str) -> list[str]:
+        i = bisect.bisect_left(self.vocab, prefix)
+        j = bisect.bisect_left(self.vocab, prefix + "\uffff")
+        return self.vocab[i:j]
+
+    def search(self, query: str) -> set | None:
+        """
+        Bill ids matching every query token (prefix match). None for an empty query,
+        meaning "no text constraint".
+        """
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)   # longer = usually rarer
+        if not terms:
+            return None
+        with self.lock:
+            candidates = None
+            for term in terms:
+                if candidates is not None and len(candidates) <= _SCAN_CANDIDATES:
+                    candidates = {bid for bid in candidates
+                                  if any(t.startswith(term) for t in self.doc_tokens.get(bid, ()))}
+                else:
+                    exact = self.postings.get(term)
+                    words = self._prefix_tokens(term)
+                    if len(words) == 1 and exact is not None:
+                        hits = set(exact)
+                    else:
+                        hits = set()
+                        for w in words:
+                            hits |= self.postings[w]
+                    candidates = hits if candidates is None else candidates & hits
+                if not candidates:
+                    return set()
+            return candidates
+
+    def doc_freq(self, term: str) -> int:
+        """Upper bound on the bills a prefix term matches (sum of its words' postings)."""
+        with self.lock:
+            return sum(len(self.postings[w]) for w in self._prefix_tokens(term))
+
+    def __len__(self):
+        return len(self.doc_tokens)
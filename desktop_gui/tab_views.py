@@ -0,0 +1,336 @@
+# desktop_gui/tab_views.py
+# Per-tab membership + sorted orders, maintained incrementally.
+# - TabMembership: which watchlisted bills are in watch / reject / complete
+#   (classified once at load, then one bill at a time on edits)
+# - SortedView: one tab's filtered rows kept sorted with bisect, so moving a
+#   single bill is O(log n) + a list insert instead of a full re-sort
+# - SortIndex: the whole DB pre-sorted once per sort field; a view is cut out of
+#   it with a filter walk (or a small sort for small result sets) instead of
+#   sorting every filtered list from scratch
+# - classify_watch_tab / filter_predicate: which tab a bill belongs to and the
+#   structured-filter test (no Tk here, so CLI tools share them too)
+
+import bisect
+import threading
+
+SORT_FIELDS = ("latestActionDate", "introducedDate", "title")
+
+
+def sort_key_fn(filters: dict):
+    """Sort key for the current sort field; title then bill id break ties."""
+    sort_field = filters.get("sort_field") or "latestActionDate"
+
+    def key(bill_id: str, rec: dict):
+        cg = (rec or {}).get("congressGovData", {}) or {}
+        # normalize date fields to string YYYY-MM-DD; missing -> ''
+        return (cg.get(sort_field) or "", cg.get("title") or "", bill_id)
+
+    return key
+
+
+class SortedView:
+    """
+    Rows of one tab under the current filters/search/sort.
+    Stored ascending as (key, bill_id); rows() reverses for "desc".
+    With a SortIndex, entries are taken from its pre-sorted order instead of sorted here.
+    A custom `key` (e.g. relevance rank) fixes the order: ascending, ignoring sort settings.
+    """
+    def __init__(self, db: dict, bill_ids, filters: dict, order: "SortIndex | None" = None, key=None):
+        self.db = db
+        self.fixed = key is not None
+        if self.fixed:
+            self.sort_field = None
+            self.reverse = False
+            self.key = key
+            self.key_of = {bid: key(bid, db[bid]) for bid in bill_ids}
+            self.entries = sorted((k, bid) for bid, k in self.key_of.items())
+            return
+        self.reverse = (filters.get("sort_dir") or "desc") == "desc"
+        self._set_order(bill_ids, filters, order)
+
+    def _set_order(self, bill_ids, filters, order):
+        self.sort_field = filters.get("sort_field") or "latestActionDate"
+        self.key = sort_key_fn(filters)
+        entries = order.select(self.sort_field, bill_ids) if order is not None else None
+        if entries is None or len(entries) != len(bill_ids):
+            # no index for this field (or it lags behind db): sort here
+            self.key_of = {bid: self.key(bid, self.db[bid]) for bid in bill_ids}
+            self.entries = sorted((k, bid) for bid, k in self.key_of.items())
+        else:
+            self.entries = entries
+            self.key_of = {bid: k for k, bid in entries}
+
+    def resort(self, filters: dict, order: "SortIndex | None" = None):
+        """Same rows under another sort field/direction (a direction flip alone is O(1))."""
+        if self.fixed:
+            return
+        self.reverse = (filters.get("sort_dir") or "desc") == "desc"
+        if (filters.get("sort_field") or "latestActionDate") != self.sort_field:
+            self._set_order(list(self.key_of), filters, order)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, bill_id):
+        return bill_id in self.key_of
+
+    def rows(self, limit: int | None = None) -> list:
+        """[(bill_id, record)] in display order, at most `limit` rows."""
+        if self.reverse:
+            picked = self.entries[-limit:][::-1] if limit else self.entries[::-1]
+        else:
+            picked = self.entries[:limit] if limit else self.entries
+        return [(bid, self.db[bid]) for _k, bid in picked]
+
+    def ids(self) -> list:
+        """Bill ids in display order, as a snapshot list (export hands it to a worker thread)."""
+        ids = [bid for _k, bid in self.entries]
+        if self.reverse:
+            ids.reverse()
+        return ids
+
+    def as_rows(self) -> "ViewRows":
+        """Live, index-addressable rows for TableView (no list is materialized)."""
+        return ViewRows(self)
+
+    def insert(self, bill_id: str):
+        if bill_id in self.key_of:
+            self.remove(bill_id)
+        k = self.key(bill_id, self.db[bill_id])
+        self.key_of[bill_id] = k
+        bisect.insort(self.entries, (k, bill_id))
+
+    def remove(self, bill_id: str):
+        k = self.key_of.pop(bill_id, None)
+        if k is None:
+            return
+        i = bisect.bisect_left(self.entries, (k, bill_id))
+        if i < len(self.entries) and self.entries[i][1] == bill_id:
+            del self.entries[i]
+
+
+class SortIndex:
+    """
+    Whole-DB (key, bill_id) lists per SORT_FIELDS entry, ascending, with the same
+    keys SortedView uses. Each ordering is built the first time its field is used,
+    then kept sorted with bisect as records change.
+    """
+    def __init__(self, db: dict | None = None):
+        self.lock = threading.RLock()       # read from the search worker, updated on the Tk thread
+        self.keys = {f: sort_key_fn({"sort_field": f}) for f in SORT_FIELDS}
+        self.rebuild(db or {})
+
+    def rebuild(self, db: dict):
+        with self.lock:
+            self.db = db
+            self.entries: dict[str, list] = {}      # field -> ascending (key, bill_id)
+            self.key_of: dict[str, dict] = {}       # field -> bill_id -> key
+
+    def _build(self, field):
+        key = self.keys[field]
+        key_of = {bid: key(bid, rec) for bid, rec in self.db.items()}
+        self.key_of[field] = key_of
+        self.entries[field] = sorted((k, bid) for bid, k in key_of.items())
+
+    def update(self, bill_id: str, rec: dict):
+        """Re-position one record (new or changed) in every ordering built so far."""
+        with self.lock:
+            for f in self.entries:
+                k = self.keys[f](bill_id, rec)
+                old = self.key_of[f].get(bill_id)
+                if old == k:
+                    continue
+                if old is not None:
+                    self._drop(f, old, bill_id)
+                self.key_of[f][bill_id] = k
+                bisect.insort(self.entries[f], (k, bill_id))
+
+    def remove(self, bill_id: str):
+        with self.lock:
+            for f in self.entries:
+                old = self.key_of[f].pop(bill_id, None)
+                if old is not None:
+                    self._drop(f, old, bill_id)
+
+    def _drop(self, field, k, bill_id):
+        entries = self.entries[field]
+        i = bisect.bisect_left(entries, (k, bill_id))
+        if i < len(entries) and entries[i][1] == bill_id:
+            del entries[i]
+
+    def select(self, field: str, bill_ids) -> list | None:
+        """
+        Ascending (key, bill_id) entries for bill_ids under `field`; None when the
+        field isn't indexed. Small sets are sorted directly (m log m), large ones
+        are cut out of the maintained order with one walk (n), whichever is cheaper.
+        """
+        if field not in self.keys:
+            return None
+        with self.lock:
+            if field not in self.entries:
+                self._build(field)
+            entries = self.entries[field]
+            m = len(bill_ids)
+            if m * max(1, m.bit_length()) < len(entries):
+                key_of = self.key_of[field]
+                return sorted((key_of[bid], bid) for bid in bill_ids if bid in key_of)
+            wanted = set(bill_ids) if isinstance(bill_ids, (list, tuple)) else bill_ids
+            return [e for e in entries if e[1] in wanted]
+
+    def _span(self, field, lo, hi):
+        if field not in self.entries:
+            self._build(field)
+        entries = self.entries[field]
+        i = bisect.bisect_left(entries, ((lo,),))
+        j = len(entries) if hi is None else bisect.bisect_left(entries, ((hi,),), i)
+        return entries, i, j
+
+    def range_ids(self, field: str, lo: str, hi: str | None = None) -> list | None:
+        """
+        Bill ids whose `field` value v has lo <= v < hi (string order, hi None = no
+        upper bound), found by bisecting the maintained order. None if not indexed.
+        """
+        if field not in self.keys:
+            return None
+        with self.lock:
+            entries, i, j = self._span(field, lo, hi)
+            return [bid for _k, bid in entries[i:j]]
+
+    def range_count(self, field: str, lo: str, hi: str | None = None) -> int | None:
+        if field not in self.keys:
+            return None
+        with self.lock:
+            _entries, i, j = self._span(field, lo, hi)
+            return max(0, j - i)
+
+
+class ViewRows:
+    """Sequence view over a SortedView in display order: len(), rows[i], index_of(bill_id)."""
+    def __init__(self, view: SortedView):
+        self.view = view
+
+    def __len__(self):
+        return len(self.view.entries)
+
+    def _pos(self, i: int) -> int:
+        n = len(self.view.entries)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return n - 1 - i if self.view.reverse else i
+
+    def __getitem__(self, i: int):
+        bid = self.view.entries[self._pos(i)][1]
+        return bid, self.view.db[bid]
+
+    def index_of(self, bill_id: str) -> int | None:
+        k = self.view.key_of.get(bill_id)
+        if k is None:
+            return None
+        j = bisect.bisect_left(self.view.entries, (k, bill_id))
+        if j >= len(self.view.entries) or self.view.entries[j][1] != bill_id:
+            return None
+        return len(self.view.entries) - 1 - j if self.view.reverse else j
+
+
+# ---------- Routing predicates ----------
+def classify_watch_tab(rec):
+    """
+    Returns: "complete" | "reject" | "watch" | None
+    Only bills with Review.WatchList == True get classified; others return None.
+    Rules (mutually exclusive):
+      - Complete: CEIExpertAcceptOrReject == True AND Final_Tracking_Done == True
+      - Rejected: CEIExpertAcceptOrReject == False AND Review_Done == True
+      - Watch:    all other watchlisted bills
+    """
+    cd = (rec or {}).get("customData", {}) or {}
+    r  = cd.get("Review", {}) or {}
+    f  = cd.get("FinalTracking", {}) or {}
+
+    if not bool(r.get("WatchList")):
+        return None
+
+    cei_accept = r.get("CEIExpertAcceptOrReject")
+    review_done = bool(r.get("Review_Done"))
+    final_done = bool(f.get("Final_Tracking_Done"))
+
+    # Complete
+    if cei_accept is True and final_done is True:
+        return "complete"
+
+    # Rejected (must be explicitly False AND review finished)
+    if cei_accept is False and review_done is True:
+        return "reject"
+
+    # Otherwise still in WatchList
+    return "watch"
+
+
+def filter_predicate(filters):
+    """rec -> bool for the structured filters (committees, sponsors, types, chambers, party, state, date range)."""
+    f = filters
+    committees = set(f.get("committees") or [])
+    sponsors = set(f.get("sponsors") or [])
+    types = set(f.get("types") or [])
+    chambers = set(f.get("chambers") or [])
+    parties = set(f.get("parties") or [])
+    states = set(f.get("states") or [])
+    date_field = f.get("date_field") or "latestActionDate"
+    date_from = f.get("date_from") or None
+    date_to = f.get("date_to") or None
+
+    def match_filters(rec):
+        cg = rec.get("congressGovData", {}) or {}
+        if committees and (cg.get("currentCommitteeName") or "") not in committees:
+            return False
+        if sponsors and (cg.get("sponsorFullName") or "") not in sponsors:
+            return False
+        if types and (cg.get("billType") or "") not in types:
+            return False
+        if chambers and (cg.get("originChamber") or "") not in chambers:
+            return False
+        if parties and (cg.get("sponsorParty") or "") not in parties:
+            return False
+        if states and (cg.get("sponsorState") or "") not in states:
+            return False
+        # date range (on selected field)
+        val = (cg.get(date_field) or "").strip()  # YYYY-MM-DD or ''
+        if date_from and (not val or val < date_from):
+            return False
+        if date_to and (not val or val > date_to):
+            return False
+        return True
+
+    return match_filters
+
+
+class TabMembership:
+    """bill_id -> "watch" | "reject" | "complete" for watchlisted bills, plus per-tab sets."""
+    TABS = ("watch", "reject", "complete")
+
+    def __init__(self, db: dict, classify):
+        self.classify = classify
+        self.version = 0            # bumped whenever a bill changes tab
+        self.tab_of: dict[str, str] = {}
+        self.members: dict[str, set] = {t: set() for t in self.TABS}
+        for bid, rec in db.items():
+            cls = classify(rec)
+            if cls:
+                self.tab_of[bid] = cls
+                self.members[cls].add(bid)
+
+    def reclassify(self, bill_id: str, rec: dict) -> tuple[str | None, str | None]:
+        """Re-route one bill. Returns (old tab, new tab); equal when nothing moved."""
+        old = self.tab_of.get(bill_id)
+        new = self.classify(rec) if rec is not None else None
+        if old == new:
+            return old, new
+        self.version += 1
+        if old:
+            self.members[old].discard(bill_id)
+            del self.tab_of[bill_id]
+        if new:
+            self.members[new].add(bill_id)
+            self.tab_of[bill_id] = new
+        return old, new
@@ -1,75 +1,469 @@
 # desktop_gui/table_view.py
 # Minimal table widget for HillWatch v3
 # - Two columns: Title and Latest Action Date
-# - set_rows(items) where items = [(bill_id, record), ...]
-# - Calls on_select(bill_id) when a row is clicked
+# - set_rows(items) where items = [(bill_id, record), ...] (any sequence with len() and [i])
+# - Calls on_select(bill_id) when a row is clicked, on_sort(field) when a column header is clicked
+# - Multi-select (Ctrl+click, Shift+click, Shift+arrows, Ctrl+A): on_selection([bill_id, ...])
+#   fires whenever the set of selected bills changes; selected_ids() reads it
+# - Virtual mode (default): the Treeview only holds a viewport's worth of rows plus a
+#   small margin; scrolling re-binds those rows from the backing sequence, and the
+#   scrollbar reflects the full result size. Render cost no longer depends on result size.
+# - Both modes diff the rows they show against the new ones (edit_script) and only
+#   delete / insert / move / re-value what changed, so scroll and selection survive.
 
+import bisect
 import tkinter as tk
 from tkinter import ttk
 
+from desktop_gui.latency import traced
+
+ROW_MARGIN = 2            # extra rows kept below the viewport (partially visible last row)
+DEFAULT_ROW_HEIGHT = 20   # Treeview default when the theme doesn't say
+HEADER_HEIGHT = 24
+WHEEL_ROWS = 3
+
+# column id = the congressGovData sort field it shows
+HEADINGS = {"title": "Title", "latestActionDate": "Latest Action Date"}
+
+
+def row_values(rec):
+    cg = (rec or {}).get("congressGovData", {}) or {}
+    title_text = f"{cg.get('billType','')}.{cg.get('billNumber','')} - {cg.get('title','')}"
+    lad = cg.get("latestActionDate") or ""
+    return (title_text, lad)
+
+
+def _stable_ids(seq, old_pos) -> set:
+    """Ids of seq forming a longest run whose old positions increase (patience sort)."""
+    tails = []          # tails[k] = old position ending the best run of length k+1
+    tail_idx = []       # index into seq of that tail
+    prev = [-1] * len(seq)
+    for i, iid in enumerate(seq):
+        p = old_pos[iid]
+        k = bisect.bisect_left(tails, p)
+        if k == len(tails):
+            tails.append(p)
+            tail_idx.append(i)
+        else:
+            tails[k] = p
+            tail_idx[k] = i
+        prev[i] = tail_idx[k - 1] if k else -1
+    out = set()
+    i = tail_idx[-1] if tail_idx else -1
+    while i >= 0:
+        out.add(seq[i])
+        i = prev[i]
+    return out
+
+
+def edit_script(old: list, new: list) -> tuple[list, list, list]:
+    """
+    Minimal edits turning ordered id list `old` into `new`: (removed, added, moved).
+    Ids in both lists that keep their relative order stay put; only the others move.
+    """
+    if old == new:
+        return [], [], []
+    # a single edit leaves long common ends; only the middle needs the LIS
+    lo, n_old, n_new = 0, len(old), len(new)
+    while lo < n_old and lo < n_new and old[lo] == new[lo]:
+        lo += 1
+    hi_old, hi_new = n_old, n_new
+    while hi_old > lo and hi_new > lo and old[hi_old - 1] == new[hi_new - 1]:
+        hi_old -= 1
+        hi_new -= 1
+    old_mid, new_mid = old[lo:hi_old], new[lo:hi_new]
+
+    old_pos = {iid: i for i, iid in enumerate(old_mid)}
+    new_set = set(new_mid)
+    removed = [iid for iid in old_mid if iid not in new_set]
+    added = [iid for iid in new_mid if iid not in old_pos]
+    kept = [iid for iid in new_mid if iid in old_pos]
+    stable = _stable_ids(kept, old_pos)
+    moved = [iid for iid in kept if iid not in stable]
+    return removed, added, moved
+
+
 class TableView(ttk.Frame):
-    def __init__(self, parent, on_select=None):
+    def __init__(self, parent, on_select=None, virtual=True, on_sort=None, on_selection=None):
         super().__init__(parent)
         self.on_select = on_select
-        self._items = []  # backing list [(bill_id, record)]
+        self.on_sort = on_sort
+        self.on_selection = on_selection
+        self.virtual = virtual
+        self._items = []  # backing sequence [(bill_id, record)]
+        self._shown = []  # bill ids currently in the Treeview, top to bottom (iid = bill_id)
+        self._values = {}  # bill_id -> values currently shown for it
+
+        # Virtual-mode state
+        self._top = 0               # index in _items of the first shown row
+        self._visible = 20          # rows that fit in the viewport (updated on <Configure>)
+        self._selected = None       # focused bill_id, shown in the detail pane (may be scrolled out of view)
+        self._sel_index = None      # its index in _items
+        self._selection = set()     # every selected bill_id (includes _selected)
+        self._anchor = None         # index Shift+click / Shift+arrow ranges start from
 
         # Treeview with two columns
         columns = ("title", "latestActionDate")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
-        self.tree.heading("title", text="Title")
-        self.tree.heading("latestActionDate", text="Latest Action Date")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="extended")
+        for col in columns:
+            self.tree.heading(col, text=HEADINGS[col], command=lambda c=col: self._on_heading(c))
 
         # Column widths / stretch
         self.tree.column("title", width=680, anchor="w", stretch=True)
         self.tree.column("latestActionDate", width=140, anchor="center", stretch=False)
 
-        # Attach scrollbar
-        vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        # Attach scrollbar (virtual mode drives it from our own row index)
+        self.vsb = ttk.Scrollbar(self, orient="vertical",
+                                 command=self._yview if virtual else self.tree.yview)
+        if not virtual:
+            self.tree.configure(yscrollcommand=self.vsb.set)
         self.tree.pack(side="left", fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
+        self.vsb.pack(side="right", fill="y")
 
         # Bind selection
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
 
-        # Style tweak so text truncates nicely (OS default handles ellipsis visually)
-        style = ttk.Style(self)
-        # You can adjust fonts if you want, e.g.:
-        # style.configure("Treeview", font=("Segoe UI", 9))
+        if virtual:
+            style = ttk.Style(self)
+            try:
+                self._row_height = int(style.lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+            except (tk.TclError, ValueError):
+                self._row_height = DEFAULT_ROW_HEIGHT
+            self.tree.bind("<Configure>", self._on_resize)
+            # we own scrolling: the Treeview itself must never scroll the rows we bind
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.tree.bind(seq, self._on_wheel)
+            for seq, fn in (("<Up>", lambda: self._move_selection(-1)),
+                            ("<Down>", lambda: self._move_selection(1)),
+                            ("<Prior>", lambda: self._move_selection(-self._visible)),
+                            ("<Next>", lambda: self._move_selection(self._visible)),
+                            ("<Home>", lambda: self._select_index(0)),
+                            ("<End>", lambda: self._select_index(len(self._items) - 1)),
+                            ("<Shift-Up>", lambda: self._extend_by(-1)),
+                            ("<Shift-Down>", lambda: self._extend_by(1)),
+                            ("<Control-a>", self.select_all)):
+                self.tree.bind(seq, lambda _e, fn=fn: (fn(), "break")[1])
+            # rows scrolled out of view can't be selected by the Treeview itself, so clicks are ours too
+            for seq, mode in (("<Button-1>", None), ("<Control-Button-1>", "toggle"),
+                              ("<Shift-Button-1>", "range")):
+                self.tree.bind(seq, lambda e, mode=mode: self._on_click(e, mode))
+
+    # ---------- Public ----------
+    @traced("set_rows", lambda _r, self, items, *a, **k: {"rows": len(items) if items is not None else 0})
+    def set_rows(self, items, reset_position: bool = False):
+        """
+        items: sequence of (bill_id, record) tuples.
+        reset_position: scroll back to the top (new search/filters) instead of keeping
+        the first visible bill in place.
+        """
+        if not self.virtual:
+            self._set_rows_full(items)
+            return
+
+        anchor = None
+        if not reset_position and self._shown:
+            anchor = self._shown[0]
+        self._items = items if items is not None else []
+        total = len(self._items)
+
+        # Keep the same bill at the top when it is still there
+        top = 0
+        if anchor is not None:
+            idx = self._index_of(anchor)
+            top = idx if idx is not None else self._top
+        self._top = self._clamp_top(top)
+
+        # Keep the selection when the bill is still listed; otherwise select the first row
+        self._sel_index = self._index_of(self._selected) if self._selected is not None else None
+        before = self._selection
+        if len(before) > 1:
+            self._selection = {bid for bid in before if self._index_of(bid) is not None}
+        notify = None
+        if self._sel_index is None and len(before) > 1 and self._selection:
+            # the focused bill left but others stay selected: focus the topmost of them
+            self._selected = min(self._selection, key=self._index_of)
+            self._sel_index = self._index_of(self._selected)
+            notify = self._selected
+        if self._sel_index is None:
+            self._selected = None
+            self._selection = set()
+            if total:
+                self._selected = self._items[0][0]
+                self._sel_index = 0
+                self._selection = {self._selected}
+                notify = self._selected
+        self._anchor = self._sel_index     # row indices shift with new rows
+        self._bind_rows()
+        if notify is not None:
+            self._notify_select(notify)
+        if self._selection != before:
+            self._notify_selection()
+
+    def row_count(self) -> int:
+        return len(self._items)
+
+    def selected_ids(self) -> list:
+        """Every selected bill id, in display order."""
+        if not self.virtual:
+            return list(self.tree.selection())
+        return sorted(self._selection, key=lambda bid: self._index_of(bid) or 0)
+
+    def collapse_selection(self):
+        """Keep only the focused row selected."""
+        if not self.virtual:
+            if self._selected:
+                self.tree.selection_set(self._selected)
+        elif self._sel_index is not None:
+            self._select_index(self._sel_index)
+
+    def select_all(self):
+        if not self.virtual:
+            self.tree.selection_set(*self.tree.get_children())
+            return
+        if not self._items:
+            return
+        if self._selected is None:
+            self._select_index(0)
+        self._selection = {bid for bid, _rec in self._items}
+        self._anchor = 0
+        self._bind_rows()
+        self._notify_selection()
+
+    def set_sort_indicator(self, sort_field: str, sort_dir: str):
+        """Arrow on the header of the column the rows are sorted by (none for other fields)."""
+        arrow = " ▼" if sort_dir == "desc" else " ▲"
+        for col, text in HEADINGS.items():
+            self.tree.heading(col, text=text + (arrow if col == sort_field else ""))
+
+    def _on_heading(self, col):
+        if callable(self.on_sort):
+            self.on_sort(col)
+
+    # ---------- Virtual mode ----------
+    def _index_of(self, bill_id):
+        finder = getattr(self._items, "index_of", None)
+        if finder is not None:
+            return finder(bill_id)
+        for i, (bid, _rec) in enumerate(self._items):
+            if bid == bill_id:
+                return i
+        return None
+
+    def _clamp_top(self, top):
+        return max(0, min(top, len(self._items) - self._visible))
 
-    def set_rows(self, items):
-        """items: list of (bill_id, record) tuples."""
+    def _bind_rows(self):
+        """Show _items[_top : _top + viewport + margin]; only rows that changed are touched."""
+        total = len(self._items)
+        end = min(total, self._top + self._visible + ROW_MARGIN)
+        window = [self._items[i] for i in range(self._top, end)]
+        self._apply_rows(window)
+
+        self._sync_tree_selection()
+
+        if total:
+            self.vsb.set(self._top / total, min(1.0, (self._top + self._visible) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _sync_tree_selection(self):
+        """Mirror _selection onto the rows currently in the Treeview."""
+        current = self.tree.selection()
+        want = [bid for bid in self._shown if bid in self._selection]
+        if set(current) != set(want):
+            if want:
+                self.tree.selection_set(*want)
+            else:
+                self.tree.selection_remove(*current)
+        if self._selected in self._values and self.tree.focus() != self._selected:
+            self.tree.focus(self._selected)
+
+    def _scroll_to(self, top):
+        top = self._clamp_top(top)
+        if top != self._top:
+            self._top = top
+            self._bind_rows()
+
+    def _yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._items)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible if args[2] == "pages" else 1)
+            self._scroll_to(self._top + step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._top - WHEEL_ROWS)
+        else:
+            self._scroll_to(self._top + WHEEL_ROWS)
+        return "break"
+
+    def _on_resize(self, event):
+        visible = max(1, (event.height - HEADER_HEIGHT) // self._row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._top = self._clamp_top(self._top)
+            self._bind_rows()
+
+    def _move_selection(self, delta):
+        start = self._sel_index if self._sel_index is not None else -1 if delta > 0 else len(self._items)
+        self._select_index(start + delta)
+
+    def _reveal(self, idx):
+        if idx < self._top:
+            self._top = idx
+        elif idx >= self._top + self._visible:
+            self._top = self._clamp_top(idx - self._visible + 1)
+
+    def _select_index(self, idx):
+        """Select only the row at idx."""
+        total = len(self._items)
+        if not total:
+            return
+        idx = max(0, min(idx, total - 1))
+        self._reveal(idx)
+        bill_id = self._items[idx][0]
+        changed = bill_id != self._selected
+        multi_changed = self._selection != {bill_id}
+        self._selected, self._sel_index = bill_id, idx
+        self._selection = {bill_id}
+        self._anchor = idx
+        self._bind_rows()
+        if changed:
+            self._notify_select(bill_id)
+        if multi_changed:
+            self._notify_selection()
+
+    def _extend_to(self, idx):
+        """Select the range from the anchor row to idx (Shift+click / Shift+arrow)."""
+        total = len(self._items)
+        if not total:
+            return
+        idx = max(0, min(idx, total - 1))
+        anchor = self._anchor if self._anchor is not None else (self._sel_index or 0)
+        lo, hi = min(anchor, idx), max(anchor, idx)
+        self._reveal(idx)
+        bill_id = self._items[idx][0]
+        changed = bill_id != self._selected
+        self._selected, self._sel_index, self._anchor = bill_id, idx, anchor
+        self._selection = {self._items[i][0] for i in range(lo, hi + 1)}
+        self._bind_rows()
+        if changed:
+            self._notify_select(bill_id)
+        self._notify_selection()
+
+    def _extend_by(self, delta):
+        if self._sel_index is not None:
+            self._extend_to(self._sel_index + delta)
+
+    def _toggle_index(self, idx):
+        """Add the row at idx to the selection, or drop it (Ctrl+click); the last row always stays."""
+        bill_id = self._items[idx][0]
+        self._anchor = idx
+        if bill_id in self._selection:
+            if len(self._selection) == 1:
+                return
+            self._selection.discard(bill_id)
+            if bill_id == self._selected:
+                # focus moves to the nearest remaining selected row
+                self._selected = min(self._selection, key=lambda b: abs((self._index_of(b) or 0) - idx))
+                self._sel_index = self._index_of(self._selected)
+                self._notify_select(self._selected)
+        else:
+            self._selection.add(bill_id)
+            self._selected, self._sel_index = bill_id, idx
+            self._notify_select(bill_id)
+        self._bind_rows()
+        self._notify_selection()
+
+    def _on_click(self, event, mode):
+        if self.tree.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return None     # headings / column separators: default Treeview handling
+        iid = self.tree.identify_row(event.y)
+        self.tree.focus_set()
+        if iid and iid in self._values:
+            idx = self._top + self._shown.index(iid)
+            if mode == "toggle":
+                self._toggle_index(idx)
+            elif mode == "range":
+                self._extend_to(idx)
+            else:
+                self._select_index(idx)
+        return "break"
+
+    # ---------- Full mode (every row inserted) ----------
+    def _set_rows_full(self, items):
         self._items = items or []
-        # Clear existing
-        for iid in self.tree.get_children(""):
-            self.tree.delete(iid)
-
-        # Insert rows
-        for bill_id, rec in self._items:
-            cg = (rec or {}).get("congressGovData", {}) or {}
-            title_text = f"{cg.get('billType','')}.{cg.get('billNumber','')} - {cg.get('title','')}"
-            lad = cg.get("latestActionDate") or ""
-            # Keep iid = bill_id so we can map selection back
-            self.tree.insert("", "end", iid=bill_id, values=(title_text, lad))
-
-        # Auto-select first row (optional)
-        if self._items:
+        self._apply_rows(self._items)
+
+        # Auto-select first row only if nothing is selected (a deleted row drops out of the selection)
+        if self._items and not self.tree.selection():
             first_id = self._items[0][0]
-            # only auto-select if nothing selected
-            if not self.tree.selection():
-                try:
-                    self.tree.selection_set(first_id)
-                    self.tree.see(first_id)
-                    self._notify_select(first_id)
-                except Exception:
-                    pass
+            try:
+                self.tree.selection_set(first_id)
+                self.tree.see(first_id)
+                self._selected = first_id
+                self._notify_select(first_id)
+            except Exception:
+                pass
+
+    # ---------- Row diffing ----------
+    def _apply_rows(self, rows):
+        """
+        Make the Treeview show `rows` ([(bill_id, record)] in order) with the fewest
+        changes: one delete for removed rows, one detach for reordered ones, then
+        inserts/moves at their new index and value updates only where the text changed.
+        All of it runs before Tk gets to redraw, so the user sees a single update.
+        """
+        new_ids = [bid for bid, _rec in rows]
+        removed, added, moved = edit_script(self._shown, new_ids)
+        tree = self.tree
+        if removed:
+            tree.delete(*removed)
+            for bid in removed:
+                self._values.pop(bid, None)
+        if moved:
+            tree.detach(*moved)
+        # the tree now holds only rows that keep their relative order, so placing each
+        # added/moved row at its final index while walking `rows` top-down is exact
+        added, moved = set(added), set(moved)
+        for i, (bid, rec) in enumerate(rows):
+            values = row_values(rec)
+            if bid in added:
+                tree.insert("", i, iid=bid, values=values)
+                self._values[bid] = values
+                continue
+            if bid in moved:
+                tree.move(bid, "", i)
+            if self._values.get(bid) != values:
+                tree.item(bid, values=values)
+                self._values[bid] = values
+        self._shown = new_ids
 
+    # ---------- Selection ----------
     def _on_select(self, _event):
+        if self.virtual:
+            # clicks and keys are handled above; anything else (e.g. Space) is undone here
+            self._sync_tree_selection()
+            return
         sel = self.tree.selection()
         if not sel:
             return
-        bill_id = sel[0]
-        self._notify_select(bill_id)
+        bill_id = self.tree.focus() if self.tree.focus() in sel else sel[0]
+        if bill_id != self._selected:
+            self._selected = bill_id
+            self._notify_select(bill_id)
+        self._notify_selection()
+
+    def _notify_selection(self):
+        if callable(self.on_selection):
+            try:
+                self.on_selection(self.selected_ids())
+            except Exception:
+                pass
 
     def _notify_select(self, bill_id: str):
         if callable(self.on_select):
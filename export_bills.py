@@ -0,0 +1,215 @@
+# export_bills.py
+# Export bills to CSV / NDJSON / XLSX, streamed row by row (no table is built in memory).
+# - columns: congressGovData keys ("title") or customData "Group.Key" paths ("Review.CeiExpert")
+# - the GUI exports its current tab in on-screen order (File → Export…, on a worker thread);
+#   from the terminal pick a tab, a saved view, a search query, or --all
+# - XLSX needs openpyxl (optional: pip install openpyxl); CSV and NDJSON need nothing extra
+#
+# Usage:
+#   python export_bills.py --tab watch --out watchlist.xlsx
+#   python export_bills.py --view "Energy watch" --out energy.csv
+#   python export_bills.py --tab complete --query "latest>=2025-06-01" --sort title --dir asc --out done.csv
+#   python export_bills.py --all --format ndjson --out all.ndjson --columns billId,title,Review.CeiExpert
+
+import argparse
+import csv
+import importlib.util
+import os
+from pathlib import Path
+
+from config import DB_PATH
+import json_codec
+from desktop_gui.data_access import CUSTOM_DEFAULT
+from desktop_gui.query import Indexes, parse_query
+from desktop_gui.tab_views import SORT_FIELDS, classify_watch_tab, filter_predicate, sort_key_fn
+
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson", ".xlsx": "xlsx"}
+TABS = ("feed", "watch", "reject", "complete")
+PROGRESS_EVERY = 500    # rows between progress callbacks
+
+CG_COLUMNS = (
+    "billId", "congress", "billType", "billNumber", "title", "originChamber",
+    "introducedDate", "sponsorFullName", "sponsorParty", "sponsorState", "sponsorDistrict",
+    "currentCommitteeName", "currentSubcommitteeName", "latestActionText", "latestActionDate",
+    "updateDate", "congressGovUrl",
+)
+CUSTOM_COLUMNS = tuple(f"{group}.{key}" for group, keys in CUSTOM_DEFAULT.items()
+                       for key in keys if key != "CeiExpertOptions")
+DEFAULT_COLUMNS = (
+    "billId", "title", "sponsorFullName", "currentCommitteeName", "introducedDate",
+    "latestActionDate", "latestActionText", "congressGovUrl",
+    "Review.WatchList", "Review.CeiExpert", "Review.CEIExpertAcceptOrReject", "Review.Review_Done",
+    "Outreach.Outreach_Done", "FinalTracking.Final_Tracking_Done",
+)
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def xlsx_available() -> bool:
+    return importlib.util.find_spec("openpyxl") is not None
+
+
+def format_for(path, fmt: str | None = None) -> str:
+    """Explicit format, else from the file extension."""
+    if fmt:
+        return fmt
+    fmt = FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Unknown export format for {path} (use .csv, .ndjson or .xlsx)")
+    return fmt
+
+
+def column_value(rec: dict, column: str):
+    """One cell: customData for "Group.Key", congressGovData otherwise; lists joined with "; "."""
+    if "." in column:
+        group, key = column.split(".", 1)
+        value = (((rec or {}).get("customData") or {}).get(group) or {}).get(key)
+    else:
+        value = ((rec or {}).get("congressGovData") or {}).get(column)
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    return value
+
+
+def select_bill_ids(db: dict, tab: str = "feed", filters: dict | None = None) -> list:
+    """
+    Bill ids one GUI tab shows for the given filters dict (search text, structured
+    filters, sort), in display order. Relevance ranking isn't applied here.
+    """
+    filters = filters or {}
+    match = filter_predicate(filters)
+    hits = parse_query(filters.get("text") or "").run(Indexes(db))
+    ids = [bid for bid in (db if hits is None else hits)
+           if (tab == "feed" or classify_watch_tab(db[bid]) == tab) and match(db[bid])]
+    key = sort_key_fn(filters)
+    ids.sort(key=lambda bid: key(bid, db[bid]), reverse=(filters.get("sort_dir") or "desc") == "desc")
+    return ids
+
+
+# ---------- Writers (each consumes the row iterator once) ----------
+def _write_csv(path, columns, rows):
+    # utf-8-sig: Excel opens non-ASCII names correctly
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(columns)
+        for row in rows:
+            w.writerow(["" if v is None else v for v in row])
+
+
+def _write_ndjson(path, columns, rows):
+    with open(path, "wb") as f:
+        for row in rows:
+            f.write(json_codec.dumps(dict(zip(columns, row))))
+            f.write(b"\n")
+
+
+def _write_xlsx(path, columns, rows):
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    except ImportError:
+        raise RuntimeError("XLSX export needs openpyxl: pip install openpyxl") from None
+    wb = Workbook(write_only=True)       # rows go straight to the sheet's XML stream
+    ws = wb.create_sheet("Bills")
+    ws.append(list(columns))
+    for row in rows:
+        ws.append([ILLEGAL_CHARACTERS_RE.sub("", v) if isinstance(v, str) else v for v in row])
+    wb.save(path)
+
+
+WRITERS = {"csv": _write_csv, "ndjson": _write_ndjson, "xlsx": _write_xlsx}
+
+
+def export_bills(path, db: dict, bill_ids, columns=DEFAULT_COLUMNS, fmt: str | None = None,
+                 progress=None, cancel=None) -> int:
+    """
+    Write bill_ids (in order) to path; returns rows written. Bills no longer in db are skipped.
+    progress(done, total) is called every PROGRESS_EVERY rows; cancel() -> True stops the export.
+    Writes <path>.tmp then os.replace(), so a failed export never leaves half a file.
+    """
+    path = Path(path)
+    writer = WRITERS[format_for(path, fmt)]
+    columns = list(columns)
+    total = len(bill_ids)
+    written = 0
+
+    def rows():
+        nonlocal written
+        for i, bid in enumerate(bill_ids):
+            if i % PROGRESS_EVERY == 0:
+                if cancel is not None and cancel():
+                    raise ExportCancelled()
+                if progress is not None:
+                    progress(i, total)
+            rec = db.get(bid)
+            if rec is None:
+                continue
+            written += 1
+            yield [column_value(rec, c) for c in columns]
+
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        writer(tmp, columns, rows())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    if progress is not None:
+        progress(total, total)
+    return written
+
+
+# ---------- CLI ----------
+def main():
+    parser = argparse.ArgumentParser(description="Export HillWatch bills to CSV / NDJSON / XLSX")
+    parser.add_argument("--out", help="output file (.csv, .ndjson/.jsonl or .xlsx)")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())), default=None,
+                        help="override the format implied by --out's extension")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--tab", choices=TABS, default="feed", help="GUI tab to export (default: feed)")
+    scope.add_argument("--view", metavar="NAME", default=None, help="a saved view from the GUI")
+    scope.add_argument("--all", action="store_true", help="every bill in the DB")
+    parser.add_argument("--query", default="", help='search-box query, e.g. "sponsor:blumenthal latest>=2025-06-01"')
+    parser.add_argument("--sort", choices=SORT_FIELDS, default="latestActionDate")
+    parser.add_argument("--dir", choices=("asc", "desc"), default="desc")
+    parser.add_argument("--columns", default=None,
+                        help="comma-separated columns (congressGovData keys, customData Group.Key)")
+    parser.add_argument("--list-columns", action="store_true", help="print the known columns and exit")
+    args = parser.parse_args()
+
+    if args.list_columns:
+        print("congressGovData:", ", ".join(CG_COLUMNS))
+        print("customData:     ", ", ".join(CUSTOM_COLUMNS))
+        print("default:        ", ",".join(DEFAULT_COLUMNS))
+        return
+    if not args.out:
+        parser.error("--out is required")
+    try:
+        fmt = format_for(args.out, args.format)
+    except ValueError as e:
+        parser.error(str(e))
+    if fmt == "xlsx" and not xlsx_available():
+        parser.error("XLSX export needs openpyxl: pip install openpyxl")
+
+    db = json_codec.load_file(DB_PATH)
+    if args.view:
+        from desktop_gui.saved_views import load_saved_views, spec_filters
+        spec = next((v for v in load_saved_views() if v["name"] == args.view), None)
+        if spec is None:
+            parser.error(f"no saved view named {args.view!r}")
+        tab, filters = spec["tab"], spec_filters(spec)
+    else:
+        tab = "feed" if args.all else args.tab
+        filters = {"text": "" if args.all else args.query, "sort_field": args.sort, "sort_dir": args.dir}
+    bill_ids = select_bill_ids(db, tab, filters)
+    columns = [c.strip() for c in args.columns.split(",") if c.strip()] if args.columns else DEFAULT_COLUMNS
+
+    n = export_bills(args.out, db, bill_ids, columns, fmt=fmt,
+                     progress=lambda done, total: print(f"\r[Export] {done:,}/{total:,}", end="", flush=True))
+    print(f"\n[Export] {n:,} bills -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
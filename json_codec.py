@@ -0,0 +1,171 @@
+# json_codec.py
+# One place for JSON encode/decode used by every loader and saver.
+#
+# Serialization policy (same on every backend):
+#   - UTF-8 bytes on disk, non-ASCII kept as-is (no \uXXXX escaping)
+#   - 2-space indent for files, compact for wire/cassette use
+#   - key order preserved, trailing newline on files
+#   - malformed input raises ValueError on every backend
+#
+# Backend is picked at import time: orjson > msgspec > ujson > stdlib json.
+# Override with HILLWATCH_JSON_BACKEND=orjson|msgspec|ujson|json.
+
+import json
+import os
+from pathlib import Path
+
+BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+
+# =============================
+# BACKEND ADAPTERS
+# =============================
+
+def _make_orjson():
+    import orjson
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj, indent):
+        opts = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=opts)
+
+    return loads, dumps
+
+
+def _make_msgspec():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data):
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj, indent):
+        raw = encoder.encode(obj)
+        return msgspec.json.format(raw, indent=2) if indent else raw
+
+    return loads, dumps
+
+
+def _make_ujson():
+    import ujson
+
+    def loads(data):
+        return ujson.loads(data)
+
+    def dumps(obj, indent):
+        if indent:
+            text = ujson.dumps(obj, ensure_ascii=False, indent=2, escape_forward_slashes=False)
+        else:
+            text = ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+        return text.encode("utf-8")
+
+    return loads, dumps
+
+
+def _make_json():
+    def loads(data):
+        # json.loads accepts bytes directly and detects UTF-8 itself
+        return json.loads(data)
+
+    def dumps(obj, indent):
+        if indent:
+            text = json.dumps(obj, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    return loads, dumps
+
+
+_FACTORIES = {
+    "orjson": _make_orjson,
+    "msgspec": _make_msgspec,
+    "ujson": _make_ujson,
+    "json": _make_json,
+}
+
+
+def available_backends() -> list[str]:
+    """Backends importable in this environment, fastest first."""
+    out = []
+    for name in BACKENDS:
+        try:
+            _FACTORIES[name]()
+        except ImportError:
+            continue
+        out.append(name)
+    return out
+
+
+def get_backend(name: str):
+    """Return (loads, dumps) for a named backend. Raises ImportError if missing."""
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    return _FACTORIES[name]()
+
+
+def _select_backend():
+    wanted = (os.getenv("HILLWATCH_JSON_BACKEND") or "").strip().lower()
+    order = [wanted] if wanted in _FACTORIES else []
+    order += [b for b in BACKENDS if b != wanted]
+    for name in order:
+        try:
+            return (name,) + _FACTORIES[name]()
+        except ImportError:
+            continue
+    return ("json",) + _make_json()
+
+
+BACKEND, _loads, _dumps = _select_backend()
+
+
+# =============================
+# PUBLIC API
+# =============================
+
+def loads(data):
+    """Decode JSON from bytes (preferred) or str."""
+    return _loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Encode to UTF-8 bytes. Compact unless indent=True."""
+    return _dumps(obj, indent)
+
+
+def dumps_text(obj, indent: bool = True) -> str:
+    """Encode to str (for printing)."""
+    return _dumps(obj, indent).decode("utf-8")
+
+
+def load_file(path):
+    """Read a JSON file as raw bytes and decode without a text-decoding pass."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def write_file(obj, path, indent: bool = True, fsync: bool = False) -> None:
+    """Encode once and write bytes to path (not atomic; callers add temp+replace)."""
+    data = _dumps(obj, indent)
+    with open(path, "wb") as f:
+        f.write(data)
+        if indent:
+            f.write(b"\n")
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def write_file_atomic(obj, path, indent: bool = True, fsync: bool = False) -> None:
+    """Write to <path>.tmp then os.replace() onto path."""
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    write_file(obj, tmp, indent=indent, fsync=fsync)
+    os.replace(tmp, path)
@@ -1,9 +1,11 @@
 # Raw API probe for Congress.gov — prints and saves raw JSON
 # Requires: requests, python-dotenv, .env with CONGRESS_API_KEY
 from pathlib import Path
-import os, json, requests
+import os, requests
 from dotenv import load_dotenv
 
+import json_codec
+
 # === EDIT THESE TO TARGET A SPECIFIC BILL ===
 CONGRESS = 119
 BILL_TYPE = "s"       # e.g., "s", "hr", "hjres", "sjres", "hconres", "sconres"
@@ -19,7 +21,7 @@ def get_json(url, params=None):
     r = requests.get(url, params=params, timeout=30)
     r.raise_for_status()
     try:
-        return r.json()
+        return json_codec.loads(r.content)
     except Exception:
         print("Response was not valid JSON. Raw text follows:")
         print(r.text)
@@ -27,10 +29,9 @@ def get_json(url, params=None):
 
 def dump_json(obj, label, outdir):
     print(f"\n=== {label} ===")
-    print(json.dumps(obj, indent=2))
+    print(json_codec.dumps_text(obj))
     out = outdir / f"{label.lower().replace(' ', '_')}.json"
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
+    json_codec.write_file(obj, out)
 
 def main():
     # Setup paths & API key
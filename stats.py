@@ -1,10 +1,11 @@
 # Stats for HillWatch 2 JSON
 # Save as: stats.py (run from the HillWatch 2 folder)
 from pathlib import Path
-import json
 from datetime import datetime
 from collections import defaultdict
 
+import json_codec
+
 DB_PATH = Path("data/bills_119.json")
 
 ORDER = ["S", "HR", "SJRES", "HJRES", "HCONRES", "SCONRES"]
@@ -51,7 +52,7 @@ def main():
         print("Run: python updater.py --phase list")
         return
 
-    data = json.loads(DB_PATH.read_text(encoding="utf-8"))
+    data = json_codec.load_file(DB_PATH)
     total = len(data)
 
     phase1_total = 0
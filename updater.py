@@ -1,15 +1,17 @@
 import argparse
-import json
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 
 from config import (
     BILL_TYPES,
     API_BASE,
     CONGRESS_NUMBER,
-    CONGRESS_API_KEY,
+    DATA_DIR,
+    FAILED_BILLS_PATH,
+    RECENT_ACTION_DAYS,
 )
 from bill_utils import (
     build_congress_gov_url,
@@ -19,48 +21,32 @@ from bill_utils import (
     merge_bill_data,
     create_new_bill_entry,
 )
+import json_codec
+from updater_http import (
+    METRICS,
+    RateLimiter,
+    FetchError,
+    install_session,
+    pause,
+    session_get_json,
+)
+import updater_http
+from cassette import RecordingSession, ReplaySession
 
-# =========================
-# Rate Limiter + HTTP
-# =========================
+# Where this run writes. Replays redirect both so the real DB is never touched.
+_db_out = None                 # None -> bill_utils.save_db (config.DB_PATH)
+_failed_path = FAILED_BILLS_PATH
 
-class RateLimiter:
-    def __init__(self, qps: float):
-        self.qps = max(qps, 0.1)
-        self.lock = threading.Lock()
-        self.next_time = 0.0
-    def wait(self):
-        with self.lock:
-            now = time.perf_counter()
-            if now < self.next_time:
-                time.sleep(self.next_time - now)
-                now = time.perf_counter()
-            self.next_time = now + 1.0 / self.qps
-
-session = requests.Session()
-
-def session_get_json(url: str, params: dict | None, limiter: RateLimiter, retries: int = 4, timeout: int = 30):
-    if params is None:
-        params = {}
-    params = dict(params)
-    params["format"] = "json"
-    params["api_key"] = CONGRESS_API_KEY
-
-    backoff = 1.0
-    for attempt in range(1, retries + 1):
-        try:
-            limiter.wait()
-            resp = session.get(url, params=params, timeout=timeout)
-            if resp.status_code in (429, 500, 502, 503, 504):
-                raise RuntimeError(f"Transient HTTP {resp.status_code}")
-            resp.raise_for_status()
-            return resp.json()
-        except Exception:
-            if attempt == retries:
-                raise
-            time.sleep(backoff)
-            backoff = min(backoff * 2.0, 16.0)
-    raise RuntimeError("Exhausted retries")
+def redirect_outputs(db_path, failed_path):
+    global _db_out, _failed_path
+    _db_out = db_path
+    _failed_path = failed_path
+
+def persist_db(db: dict):
+    if _db_out is None:
+        save_db(db)
+    else:
+        json_codec.write_file_atomic(db, _db_out)
 
 # =========================
 # Parsers (robust to shape)
@@ -177,6 +163,9 @@ def build_from_list_item(list_item: dict, existing: dict | None) -> dict:
         "congressGovUrl": build_congress_gov_url(CONGRESS_NUMBER, bill_type.lower(), number),
     }
     cg["contentHash"] = compute_content_hash(cg)
+    if prev.get("committeeLastActionSeen") is not None:
+        # keep the committees bookkeeping so an unchanged bill isn't re-queued
+        cg["committeeLastActionSeen"] = prev["committeeLastActionSeen"]
     return cg
 
 def apply_detail(existing: dict, introduced_date: str | None, sponsor_info: dict) -> dict:
@@ -206,6 +195,125 @@ def _fmt_hhmmss(seconds: float) -> str:
     s = seconds % 60
     return f"{h:02d}:{m:02d}:{s:02d}"
 
+# =========================
+# Work order + run budget (detail/committees)
+# =========================
+
+def enrichment_priority(entry: dict, recent_cutoff: str) -> tuple:
+    """
+    Sort key: WatchList bills first, then bills whose latest action is on/after
+    recent_cutoff, then the rest; newest latest action first inside each tier.
+    """
+    cg = entry["congressGovData"]
+    review = (entry.get("customData") or {}).get("Review") or {}
+    lad = cg.get("latestActionDate") or ""
+    if review.get("WatchList") is True:
+        tier = 0
+    elif lad >= recent_cutoff:
+        tier = 1
+    else:
+        tier = 2
+    # ISO dates: negate ordinal so a plain ascending sort puts newest first
+    try:
+        age = -date.fromisoformat(lad[:10]).toordinal()
+    except ValueError:
+        age = 0
+    return tier, age
+
+def prioritize(db: dict, bill_ids: list[str]) -> list[str]:
+    cutoff = (date.today() - timedelta(days=RECENT_ACTION_DAYS)).isoformat()
+    return sorted(bill_ids, key=lambda bid: enrichment_priority(db[bid], cutoff))
+
+SKIPPED = object()   # task result for bills left over once the budget ran out
+
+class RunBudget:
+    """
+    Caps a run by request count (--budget) and/or wall time (--deadline minutes).
+    Workers call take() before each request, retries included; once it returns False
+    the rest of the queue is skipped and stays stale in the DB, so the next run resumes with it.
+    """
+    def __init__(self, max_requests: int | None = None, deadline_minutes: float | None = None):
+        self.max_requests = max_requests
+        self.deadline = time.time() + deadline_minutes * 60 if deadline_minutes else None
+        self.lock = threading.Lock()
+        self.used = 0
+        self.exhausted_by = None
+
+    def take(self, n: int = 1) -> bool:
+        with self.lock:
+            if self.exhausted_by:
+                return False
+            if self.deadline is not None and time.time() >= self.deadline:
+                self.exhausted_by = "deadline"
+                return False
+            if self.max_requests is not None and self.used + n > self.max_requests:
+                self.exhausted_by = "budget"
+                return False
+            self.used += n
+            return True
+
+    def describe(self) -> str:
+        parts = []
+        if self.max_requests is not None:
+            parts.append(f"{self.used}/{self.max_requests} requests")
+        if self.deadline is not None:
+            parts.append(f"deadline {datetime.fromtimestamp(self.deadline).strftime('%H:%M:%S')}")
+        return ", ".join(parts) or "unlimited"
+
+# =========================
+# Dead-letter list (bills that still failed after retries)
+# =========================
+
+class DeadLetterQueue:
+    """
+    Persisted {phase: {bill_id: info}} of bills whose fetch failed for good.
+    `updater.py --retry-failed` replays exactly these without rescanning the DB.
+    """
+    def __init__(self, path=None):
+        self.path = path or _failed_path
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict[str, dict]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json_codec.load_file(self.path) or {}
+            except ValueError:
+                print(f"[DLQ] Ignoring unreadable {self.path}")
+
+    def add(self, phase: str, bill_id: str, err: Exception):
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self.lock:
+            bucket = self.entries.setdefault(phase, {})
+            prev = bucket.get(bill_id) or {}
+            bucket[bill_id] = {
+                "error": str(err),
+                "status": getattr(err, "status", None),
+                "retryable": getattr(err, "retryable", True),
+                "failures": prev.get("failures", 0) + 1,
+                "firstFailed": prev.get("firstFailed", now),
+                "lastFailed": now,
+            }
+        METRICS.record_event("dead_lettered")
+
+    def resolve(self, phase: str, bill_id: str):
+        with self.lock:
+            self.entries.get(phase, {}).pop(bill_id, None)
+
+    def bill_ids(self, phase: str) -> list[str]:
+        with self.lock:
+            return list(self.entries.get(phase, {}).keys())
+
+    def count(self, phases=None) -> int:
+        with self.lock:
+            return sum(len(v) for k, v in self.entries.items() if phases is None or k in phases)
+
+    def save(self):
+        with self.lock:
+            data = {k: v for k, v in self.entries.items() if v}
+        if not data and not self.path.exists():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        json_codec.write_file_atomic(data, self.path)
+
 # =========================
 # Phase 1 — LIST
 # =========================
@@ -213,6 +321,7 @@ def _fmt_hhmmss(seconds: float) -> str:
 def run_phase_list(db: dict, types: list[str], qps: float):
     limiter = RateLimiter(qps)
     total_new, total_updated, checked = 0, 0, 0
+    start = time.time()
 
     for bt in types:
         print(f"\n[List] {bt.upper()} …")
@@ -220,7 +329,13 @@ def run_phase_list(db: dict, types: list[str], qps: float):
         per_page = 250
         while True:
             url = f"{API_BASE}/bill/{CONGRESS_NUMBER}/{bt}"
-            payload = session_get_json(url, {"limit": per_page, "offset": offset}, limiter)
+            try:
+                payload = session_get_json(url, {"limit": per_page, "offset": offset}, limiter, endpoint="list")
+            except FetchError as e:
+                # Keep what we have; the next list run picks the rest up
+                METRICS.record_event("list_page_failed")
+                print(f"[List] {bt.upper()} offset {offset} failed ({e}); skipping rest of {bt.upper()}.")
+                break
             items = parse_list_items(payload)
             if not items:
                 break
@@ -238,65 +353,59 @@ def run_phase_list(db: dict, types: list[str], qps: float):
                     total_new += 1
 
             offset += per_page
-            time.sleep(0.2)
+            pause(0.2)
 
-    save_db(db)
+    persist_db(db)
+    METRICS.record_phase("list", checked, time.time() - start, new=total_new, updated=total_updated)
     print(f"\n[List] Done. Checked: {checked} | New: {total_new} | Updated: {total_updated} | Total in DB: {len(db)}")
 
 # =========================
-# Phase 2 — DETAIL (sponsor + introduced)
+# Enrichment phases (per-bill endpoints)
 # =========================
+# Each phase declares how to fetch and fold in one endpoint. Adding an endpoint
+# means writing those four functions and calling register_phase(); the scan,
+# thread pool, limiter, budget, DLQ and save are shared (run_enrichment).
+
+class EnrichPhase:
+    """
+    url(bill_id) -> str                  endpoint URL for one bill
+    parse(payload, entry) -> data        API JSON -> plain fields
+    apply(entry, data) -> cg             new congressGovData (merged by the engine)
+    needs(entry) -> bool                 staleness predicate used to pick work
+    """
+    def __init__(self, name: str, url, parse, apply, needs, label: str | None = None):
+        self.name = name
+        self.url = url
+        self.parse = parse
+        self.apply = apply
+        self.needs = needs
+        self.label = label or name.capitalize()
+
+PHASES: dict[str, EnrichPhase] = {}     # registration order = order applied to a bill
+
+def register_phase(phase: EnrichPhase) -> EnrichPhase:
+    PHASES[phase.name] = phase
+    return phase
+
+def _bill_url(bill_id: str, suffix: str = "") -> str:
+    tprefix, number = bill_id.split("_", 1)
+    return f"{API_BASE}/bill/{CONGRESS_NUMBER}/{tprefix.lower()}/{number}{suffix}"
+
+# ---- detail (sponsor + introduced) ----
 
 def _needs_detail(entry: dict) -> bool:
     cg = entry["congressGovData"]
     return cg.get("introducedDate") is None or cg.get("sponsorFullName") is None
 
-def run_phase_detail(db: dict, types: list[str], limit: int | None, workers: int, qps: float):
-    limiter = RateLimiter(qps)
-    to_process = []
-    for bill_id, entry in db.items():
-        tprefix = bill_id.split("_", 1)[0].lower()
-        if tprefix in types and _needs_detail(entry):
-            to_process.append(bill_id)
-    if limit:
-        to_process = to_process[:limit]
-
-    total = len(to_process)
-    print(f"\n[Detail] Bills to enrich: {total} (workers={workers}, qps={qps})")
-    if not to_process:
-        print("[Detail] Nothing to do.")
-        return
-
-    start = time.time()
-    done = 0
+register_phase(EnrichPhase(
+    "detail",
+    url=_bill_url,
+    parse=lambda payload, entry: parse_detail(payload),
+    apply=lambda entry, data: apply_detail(entry, *data),
+    needs=_needs_detail,
+))
 
-    def task(bill_id: str):
-        tprefix, number = bill_id.split("_", 1)
-        url = f"{API_BASE}/bill/{CONGRESS_NUMBER}/{tprefix.lower()}/{number}"
-        detail_json = session_get_json(url, None, limiter)
-        introduced, sponsor = parse_detail(detail_json)
-        cg = apply_detail(db[bill_id], introduced, sponsor)
-        db[bill_id] = merge_bill_data(db[bill_id], cg)
-        return bill_id
-
-    with ThreadPoolExecutor(max_workers=workers) as ex:
-        futures = [ex.submit(task, bid) for bid in to_process]
-        for fut in as_completed(futures):
-            _ = fut.result()
-            done += 1
-            if done % 25 == 0 or done == total:
-                elapsed = max(time.time() - start, 1e-6)
-                rate = done / elapsed
-                remaining = total - done
-                eta = remaining / rate if rate > 0 else float("inf")
-                print(f"[Detail] {done}/{total} | {rate:.2f} bills/s | elapsed {_fmt_hhmmss(elapsed)} | ETA {_fmt_hhmmss(eta)}")
-
-    save_db(db)
-    print(f"[Detail] Completed {done} updates.")
-
-# =========================
-# Phase 3 — COMMITTEES
-# =========================
+# ---- committees ----
 
 def _needs_committees(entry: dict) -> bool:
     cg = entry["congressGovData"]
@@ -304,93 +413,285 @@ def _needs_committees(entry: dict) -> bool:
     seen = cg.get("committeeLastActionSeen")
     return cg.get("currentCommitteeName") is None or (las and las != seen)
 
-def run_phase_committees(db: dict, types: list[str], limit: int | None, workers: int, qps: float):
-    limiter = RateLimiter(qps)
-    to_process = []
+register_phase(EnrichPhase(
+    "committees",
+    url=lambda bill_id: _bill_url(bill_id, "/committees"),
+    parse=lambda payload, entry: parse_committees(payload, entry["congressGovData"].get("latestActionText")),
+    apply=apply_committees,
+    needs=_needs_committees,
+))
+
+# ---- engine ----
+
+def plan_work(db: dict, types: list[str], phase_names: list[str],
+              failed: dict[str, list[str]] | None = None) -> dict[str, list[str]]:
+    """
+    One pass over the DB -> {bill_id: [phase names it needs]} for the selected phases.
+    With `failed` ({phase: [bill_id]} from the dead-letter list) the DB is not
+    scanned and staleness is not checked.
+    """
+    phases = [PHASES[name] for name in PHASES if name in phase_names]
+    work: dict[str, list[str]] = {}
+    if failed is not None:
+        for ph in phases:
+            for bid in failed.get(ph.name, []):
+                if bid in db and bid.split("_", 1)[0].lower() in types:
+                    work.setdefault(bid, []).append(ph.name)
+        # keep registration order per bill
+        return {bid: [p.name for p in phases if p.name in names] for bid, names in work.items()}
     for bill_id, entry in db.items():
-        tprefix = bill_id.split("_", 1)[0].lower()
-        if tprefix in types and _needs_committees(entry):
-            to_process.append(bill_id)
+        if bill_id.split("_", 1)[0].lower() not in types:
+            continue
+        names = [ph.name for ph in phases if ph.needs(entry)]
+        if names:
+            work[bill_id] = names
+    return work
+
+def run_enrichment(db: dict, types: list[str], phase_names: list[str], limit: int | None,
+                   workers: int, qps: float, failed: dict[str, list[str]] | None = None,
+                   dlq: DeadLetterQueue | None = None, budget: RunBudget | None = None):
+    """
+    Run every selected enrichment phase in one go: one scan, one pool, one shared
+    limiter, one save. A bill's phases run in order inside one task, so two phases
+    never race on the same record.
+    """
+    limiter = RateLimiter(qps)
+    dlq = dlq or DeadLetterQueue()
+    work = plan_work(db, types, phase_names, failed)
+    to_process = prioritize(db, list(work))
     if limit:
         to_process = to_process[:limit]
 
+    tag = "+".join(PHASES[n].label for n in PHASES if n in phase_names)
     total = len(to_process)
-    print(f"\n[Committees] Bills to enrich: {total} (workers={workers}, qps={qps})")
+    per_phase = {n: sum(1 for bid in to_process if n in work[bid]) for n in PHASES if n in phase_names}
+    print(f"\n[{tag}] Bills to enrich: {total} "
+          f"({', '.join(f'{n}={c}' for n, c in per_phase.items())}; workers={workers}, qps={qps}"
+          + (f", budget: {budget.describe()})" if budget else ")"))
     if not to_process:
-        print("[Committees] Nothing to do.")
+        print(f"[{tag}] Nothing to do.")
         return
 
     start = time.time()
+    counts = {n: {"done": 0, "failed": 0, "skipped": 0} for n in per_phase}
     done = 0
 
-    def task(bill_id: str):
-        tprefix, number = bill_id.split("_", 1)
-        latest_text = db[bill_id]["congressGovData"].get("latestActionText")
-        url = f"{API_BASE}/bill/{CONGRESS_NUMBER}/{tprefix.lower()}/{number}/committees"
-        committees_json = session_get_json(url, None, limiter)
-        committee_data = parse_committees(committees_json, latest_text)
-        cg = apply_committees(db[bill_id], committee_data)
-        db[bill_id] = merge_bill_data(db[bill_id], cg)
-        return bill_id
+    def task(bill_id: str) -> list[tuple[str, object]]:
+        results = []
+        for name in work[bill_id]:
+            ph = PHASES[name]
+            if budget and not budget.take():
+                results.append((name, SKIPPED))
+                continue
+            try:
+                payload = session_get_json(ph.url(bill_id), None, limiter, endpoint=name,
+                                           charge=budget.take if budget else None)
+                cg = ph.apply(db[bill_id], ph.parse(payload, db[bill_id]))
+                db[bill_id] = merge_bill_data(db[bill_id], cg)
+            except FetchError as e:
+                dlq.add(name, bill_id, e)
+                results.append((name, e))
+                continue
+            dlq.resolve(name, bill_id)
+            results.append((name, None))
+        return results
 
     with ThreadPoolExecutor(max_workers=workers) as ex:
-        futures = [ex.submit(task, bid) for bid in to_process]
+        futures = {ex.submit(task, bid): bid for bid in to_process}
         for fut in as_completed(futures):
-            _ = fut.result()
+            bill_id = futures[fut]
             done += 1
+            for name, err in fut.result():
+                if err is SKIPPED:
+                    counts[name]["skipped"] += 1
+                elif err is not None:
+                    counts[name]["failed"] += 1
+                    print(f"[{PHASES[name].label}] {bill_id} failed: {err}")
+                else:
+                    counts[name]["done"] += 1
             if done % 25 == 0 or done == total:
                 elapsed = max(time.time() - start, 1e-6)
                 rate = done / elapsed
                 remaining = total - done
                 eta = remaining / rate if rate > 0 else float("inf")
-                print(f"[Committees] {done}/{total} | {rate:.2f} bills/s | elapsed {_fmt_hhmmss(elapsed)} | ETA {_fmt_hhmmss(eta)}")
-
-    save_db(db)
-    print(f"[Committees] Completed {done} updates.")
+                print(f"[{tag}] {done}/{total} | {rate:.2f} bills/s | elapsed {_fmt_hhmmss(elapsed)} | ETA {_fmt_hhmmss(eta)}")
+
+    persist_db(db)
+    dlq.save()
+    seconds = time.time() - start
+    for name, c in counts.items():
+        label = PHASES[name].label
+        METRICS.record_phase(name, c["done"], seconds, failed=c["failed"], skipped=c["skipped"])
+        print(f"[{label}] Completed {c['done']} updates." + (f" {c['failed']} failed → {dlq.path}" if c["failed"] else ""))
+        if c["skipped"]:
+            print(f"[{label}] Stopped by {budget.exhausted_by}: {c['skipped']} bills left for the next run.")
 
 # =========================
 # CLI
 # =========================
 
+def run_selected_phase(args, db: dict, types: list[str]):
+    if args.daemon:
+        from updater_daemon import run_daemon
+        print("=== HillWatch 2 — Daemon (list + activity-aware bill polling) ===")
+        run_daemon(db, types, workers=args.workers, qps=args.qps, persist=persist_db,
+                   dlq=DeadLetterQueue(), duration_minutes=args.daemon_minutes)
+        print("Daemon stopped.")
+        return
+
+    if "list" in args.phases:
+        print("=== HillWatch 2 — Phase: LIST ===")
+        run_phase_list(db, types, qps=args.qps)
+        print("Phase LIST complete.")
+        if args.phases == ["list"]:
+            print("Next: run --phase detail,committees.")
+            return
+
+    if not db:
+        print("Database is empty. Run: python updater.py --phase list")
+        return
+
+    budget = None
+    if args.budget or args.deadline:
+        budget = RunBudget(args.budget, args.deadline)
+
+    if args.retry_failed:
+        run_retry_failed(args, db, types, budget)
+        return
+
+    enrich = [name for name in PHASES if name in args.phases]
+    if enrich:
+        print(f"=== HillWatch 2 — Phase: {' + '.join(n.upper() for n in enrich)} ===")
+        run_enrichment(db, types, enrich, limit=args.limit, workers=args.workers, qps=args.qps, budget=budget)
+        print(f"Phase {' + '.join(n.upper() for n in enrich)} complete.")
+
+def run_retry_failed(args, db: dict, types: list[str], budget: RunBudget | None = None):
+    dlq = DeadLetterQueue()
+    phases = [name for name in PHASES if not args.phases or name in args.phases]
+    print(f"=== HillWatch 2 — Retry failed bills ({dlq.count(phases)} in {dlq.path}) ===")
+    # the daemon re-polls its own failures on its schedule; replaying them here would race it
+    left = dlq.count(["daemon"])
+    if left:
+        print(f"[DLQ] Leaving {left} daemon failures for the daemon to retry.")
+    failed = {}
+    for phase in phases:
+        ids = dlq.bill_ids(phase)
+        for gone in [bid for bid in ids if bid not in db]:
+            dlq.resolve(phase, gone)
+        failed[phase] = [bid for bid in ids if bid in db]
+        if not failed[phase]:
+            print(f"[{PHASES[phase].label}] No failed bills to retry.")
+    if any(failed.values()):
+        run_enrichment(db, types, phases, limit=args.limit, workers=args.workers, qps=args.qps,
+                       failed=failed, dlq=dlq, budget=budget)
+    dlq.save()
+    print(f"Retry complete. Still failing: {dlq.count(phases)}")
+
+def write_run_report(args):
+    METRICS.print_summary()
+    if args.metrics_json:
+        METRICS.write_json_report(args.metrics_json)
+        print(f"[Metrics] JSON report: {args.metrics_json}")
+    if args.prom_file:
+        METRICS.write_prometheus(args.prom_file)
+        print(f"[Metrics] Prometheus file: {args.prom_file}")
+
 def main():
     parser = argparse.ArgumentParser(description="HillWatch 2 — phased Congress.gov updater")
-    parser.add_argument("--phase", choices=["list", "detail", "committees"], required=True,
-                        help="Which phase to run: list | detail | committees")
+    parser.add_argument("--phase", default=None,
+                        help="Phase(s) to run, comma-separated: list | detail | committees "
+                             "(e.g. 'detail,committees' enriches both in one pass)")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Replay only the bills in data/failed_bills.json (detail/committees; "
+                             "limit to one with --phase)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Run continuously: poll lists for new bills and re-poll bills by recent activity")
+    parser.add_argument("--daemon-minutes", type=float, default=0.0,
+                        help="Stop the daemon after this many minutes (default 0 = run until Ctrl+C/SIGTERM)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print bills/requests/time per phase for this run and exit (no fetches, no writes)")
     parser.add_argument("--types", default=None,
                         help="Comma-separated bill types (default: all 6). e.g. 's,hr,hjres'")
     parser.add_argument("--limit", type=int, default=None,
                         help="Limit number of bills to process (detail/committees). Ignored for list.")
+    parser.add_argument("--budget", type=int, default=None,
+                        help="Stop detail/committees after this many requests, retries included; the rest waits for the next run")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="Stop starting new detail/committees requests after this many minutes")
     parser.add_argument("--workers", type=int, default=6,
                         help="Parallel workers for detail/committees (default 6)")
     parser.add_argument("--qps", type=float, default=2.0,
                         help="Max requests per second across all threads (default 2.0)")
+    parser.add_argument("--metrics-json", default=str(DATA_DIR / "logs" / "updater_report.json"),
+                        help="Where to write the JSON run report ('' to disable)")
+    parser.add_argument("--prom-file", default=None,
+                        help="Optional Prometheus text-format metrics file (e.g. data/logs/updater.prom)")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="Capture every request/response (+ starting DB) to a gzip cassette")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="Serve responses from a cassette instead of the API; never writes the real DB")
+    parser.add_argument("--replay-timing", choices=["fast", "original"], default="fast",
+                        help="fast = no waits at all; original = recorded latency, configured qps and backoff")
+    parser.add_argument("--replay-out", metavar="PATH", default=None,
+                        help="DB written by a replay (default: <cassette>.replay.json)")
     args = parser.parse_args()
+    if not args.phase and not args.retry_failed and not args.daemon and not args.dry_run:
+        parser.error("--phase is required (or use --retry-failed / --daemon)")
+    if args.daemon and (args.phase or args.retry_failed):
+        parser.error("--daemon runs every phase itself; drop --phase/--retry-failed")
+    if args.dry_run and args.daemon:
+        parser.error("--dry-run plans --phase / --retry-failed runs, not --daemon")
+    args.phases = [p.strip().lower() for p in args.phase.split(",") if p.strip()] if args.phase else []
+    unknown = [p for p in args.phases if p != "list" and p not in PHASES]
+    if unknown:
+        parser.error(f"unknown phase(s): {', '.join(unknown)} (choose from list, {', '.join(PHASES)})")
+    if args.retry_failed and "list" in args.phases:
+        parser.error("--retry-failed applies to detail/committees only")
+    if args.record and args.replay:
+        parser.error("--record and --replay are mutually exclusive")
 
     types = [t.strip().lower() for t in (args.types.split(",") if args.types else BILL_TYPES)]
+    METRICS.meta.update({"phase": args.phase, "retryFailed": args.retry_failed,
+                         "daemon": args.daemon, "types": types, "workers": args.workers,
+                         "qps": args.qps, "limit": args.limit,
+                         "budget": args.budget, "deadline": args.deadline})
 
     db = load_db()
-
-    if args.phase == "list":
-        print("=== HillWatch 2 — Phase: LIST ===")
-        run_phase_list(db, types, qps=args.qps)
-        print("Phase LIST complete.\nNext: run --phase detail, then --phase committees.")
-        return
-
-    if not db:
-        print("Database is empty. Run: python updater.py --phase list")
-        return
-
-    if args.phase == "detail":
-        print("=== HillWatch 2 — Phase: DETAIL (sponsor + introducedDate) ===")
-        run_phase_detail(db, types, limit=args.limit, workers=args.workers, qps=args.qps)
-        print("Phase DETAIL complete.")
+    if args.dry_run:
+        from updater_plan import run_dry
+        run_dry(args, db, types)
         return
 
-    if args.phase == "committees":
-        print("=== HillWatch 2 — Phase: COMMITTEES ===")
-        run_phase_committees(db, types, limit=args.limit, workers=args.workers, qps=args.qps)
-        print("Phase COMMITTEES complete.")
-        return
+    recorder = replayer = None
+    if args.record:
+        recorder = RecordingSession(updater_http.session, args.record, api_base=API_BASE, db_snapshot=db)
+        install_session(recorder)
+        print(f"[Record] Capturing run to {args.record}")
+    elif args.replay:
+        replayer = ReplaySession(args.replay, timing=args.replay_timing)
+        if replayer.snapshot is not None:
+            db = replayer.snapshot
+        out = Path(args.replay_out or f"{args.replay}.replay.json")
+        redirect_outputs(out, out.with_name(out.stem + ".failed.json"))
+        if args.replay_timing == "fast":
+            args.qps = float("inf")
+            install_session(replayer, sleep_scale=0.0)
+        else:
+            install_session(replayer)
+        METRICS.meta["replay"] = {"cassette": args.replay, "timing": args.replay_timing}
+        print(f"[Replay] {replayer.total} recorded responses from {args.replay} "
+              f"(recorded {replayer.header.get('recordedAt')}, timing={args.replay_timing}) → {out}")
+
+    try:
+        run_selected_phase(args, db, types)
+    finally:
+        if recorder:
+            recorder.close()
+            print(f"[Record] {recorder.count} responses saved to {args.record}")
+        if replayer:
+            print(f"[Replay] served={replayer.served} misses={replayer.misses} unused={replayer.remaining()}")
+        # Report even when a phase dies so the slow/failed run can be diagnosed
+        write_run_report(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,339 @@
+# updater_daemon.py
+# Long-running `updater.py --daemon` mode.
+#
+# Replaces three cron'd phase runs with one process that keeps the DB in memory and
+# works off a min-heap of next-due times:
+#   - ("list", type): poll the newest-first list endpoint every DAEMON_LIST_POLL_MINUTES,
+#     paging only until it reaches bills older than the last poll (watermark)
+#   - ("bill", id):   re-fetch detail (+ committees when the latest action moved);
+#     the next due time decays with how long ago latestActionDate was
+# The schedule is saved next to the DB and picked up again after a restart.
+
+import hashlib
+import heapq
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+
+from config import (
+    API_BASE,
+    CONGRESS_NUMBER,
+    DAEMON_LIST_POLL_MINUTES,
+    DAEMON_MIN_INTERVAL_HOURS,
+    DAEMON_DOUBLING_DAYS,
+    DAEMON_MAX_INTERVAL_DAYS,
+    DAEMON_SAVE_MINUTES,
+    DAEMON_SCHEDULE_PATH,
+)
+from bill_utils import compute_content_hash, merge_bill_data, create_new_bill_entry
+import json_codec
+from updater_http import METRICS, RateLimiter, FetchError, session_get_json
+import updater
+
+LIST_PAGE = 250
+FAILED_RETRY_SECONDS = 3600.0
+SCHEDULE_VERSION = 1
+
+
+# =========================
+# Polling interval
+# =========================
+
+def _parse_day(s: str | None) -> date | None:
+    if not s:
+        return None
+    try:
+        return date.fromisoformat(str(s)[:10])
+    except ValueError:
+        return None
+
+def poll_interval_seconds(cg: dict, today: date | None = None) -> float:
+    """
+    min_interval * 2^(days_since_latest_action / doubling_days), capped at max.
+    With defaults: today → 2h, 2 weeks → 4h, 1 month → ~9h, 3 months → ~7 days, older → 14 days.
+    """
+    today = today or date.today()
+    lad = _parse_day(cg.get("latestActionDate"))
+    age_days = max(0, (today - lad).days) if lad else DAEMON_DOUBLING_DAYS * 10
+    base = DAEMON_MIN_INTERVAL_HOURS * 3600.0
+    interval = base * (2.0 ** (age_days / DAEMON_DOUBLING_DAYS))
+    return min(interval, DAEMON_MAX_INTERVAL_DAYS * 86400.0)
+
+def _stagger(bill_id: str, interval: float) -> float:
+    """Stable 0..interval offset so a cold start doesn't fire every bill at once."""
+    h = int(hashlib.sha1(bill_id.encode("utf-8")).hexdigest()[:8], 16)
+    return (h / 0xFFFFFFFF) * interval
+
+
+# =========================
+# Schedule (min-heap with lazy deletion)
+# =========================
+
+class Schedule:
+    def __init__(self):
+        self.heap: list[tuple[float, int, str, str]] = []
+        self.due: dict[tuple[str, str], float] = {}
+        self.watermarks: dict[str, str] = {}     # bill type -> newest updateDate seen on the list
+        self._seq = 0
+
+    def set(self, kind: str, key: str, when: float):
+        self.due[(kind, key)] = when
+        self._seq += 1
+        heapq.heappush(self.heap, (when, self._seq, kind, key))
+
+    def peek_time(self) -> float | None:
+        while self.heap:
+            when, _, kind, key = self.heap[0]
+            if self.due.get((kind, key)) == when:
+                return when
+            heapq.heappop(self.heap)      # stale entry superseded by a later set()
+        return None
+
+    def pop_due(self, now: float, max_items: int) -> list[tuple[str, str]]:
+        out = []
+        while len(out) < max_items:
+            when = self.peek_time()
+            if when is None or when > now:
+                break
+            _, _, kind, key = heapq.heappop(self.heap)
+            del self.due[(kind, key)]
+            out.append((kind, key))
+        return out
+
+    def to_dict(self) -> dict:
+        lists, bills = {}, {}
+        for (kind, key), when in self.due.items():
+            (lists if kind == "list" else bills)[key] = round(when, 1)
+        return {
+            "version": SCHEDULE_VERSION,
+            "savedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "list": lists,
+            "bills": bills,
+            "watermarks": dict(self.watermarks),
+        }
+
+    @classmethod
+    def load(cls, path, db: dict, types: list[str], now: float) -> "Schedule":
+        sched = cls()
+        saved = {}
+        if path.exists():
+            try:
+                saved = json_codec.load_file(path) or {}
+            except ValueError:
+                print(f"[Daemon] Ignoring unreadable schedule {path}")
+        if saved.get("version") != SCHEDULE_VERSION:
+            saved = {}
+        saved_lists = saved.get("list") or {}
+        saved_bills = saved.get("bills") or {}
+        sched.watermarks = dict(saved.get("watermarks") or {})
+
+        for bt in types:
+            sched.set("list", bt, float(saved_lists.get(bt, now)))
+            if bt not in sched.watermarks:
+                # first run: everything already in the DB counts as seen
+                newest = max((e["congressGovData"].get("updateDate") or "" for bid, e in db.items()
+                              if bid.split("_", 1)[0].lower() == bt), default="")
+                if newest:
+                    sched.watermarks[bt] = newest
+
+        today = date.today()
+        for bill_id, entry in db.items():
+            if bill_id.split("_", 1)[0].lower() not in types:
+                continue
+            if bill_id in saved_bills:
+                sched.set("bill", bill_id, float(saved_bills[bill_id]))
+            elif updater._needs_detail(entry) or updater._needs_committees(entry):
+                sched.set("bill", bill_id, now)
+            else:
+                interval = poll_interval_seconds(entry["congressGovData"], today)
+                sched.set("bill", bill_id, now + _stagger(bill_id, interval))
+        return sched
+
+
+# =========================
+# Work items
+# =========================
+
+def apply_detail_activity(existing: dict, detail_json: dict) -> dict:
+    """apply_detail plus the activity fields the detail payload also carries."""
+    introduced, sponsor = updater.parse_detail(detail_json)
+    cg = updater.apply_detail(existing, introduced, sponsor)
+    node = detail_json.get("bill", detail_json) if isinstance(detail_json, dict) else {}
+    latest = node.get("latestAction") or {}
+    changed = False
+    for key, val in (("latestActionDate", latest.get("actionDate")),
+                     ("latestActionText", latest.get("text")),
+                     ("title", node.get("title")),
+                     ("updateDate", node.get("updateDate")),
+                     ("updateDateIncludingText", node.get("updateDateIncludingText"))):
+        if val is not None and cg.get(key) != val:
+            cg[key] = val
+            changed = True
+    if changed:
+        cg["contentHash"] = compute_content_hash(cg)
+    return cg
+
+
+class Daemon:
+    def __init__(self, db: dict, types: list[str], workers: int, qps: float, persist, dlq,
+                 schedule_path=DAEMON_SCHEDULE_PATH):
+        self.db = db
+        self.types = types
+        self.workers = workers
+        self.limiter = RateLimiter(qps)
+        self.persist = persist          # updater.persist_db of the running CLI (honours replay redirects)
+        self.dlq = dlq
+        self.schedule_path = schedule_path
+        self.stop = threading.Event()
+        self.dirty = False
+        self.last_save = time.time()
+        self.stats = {"list_polls": 0, "new": 0, "changed": 0, "bills_polled": 0, "failed": 0}
+        self.schedule = Schedule.load(schedule_path, db, types, time.time())
+
+    # ---- list polling ----
+    def poll_list(self, bt: str):
+        watermark = self.schedule.watermarks.get(bt, "")
+        newest = watermark
+        offset = 0
+        new = changed = 0
+        while not self.stop.is_set():
+            url = f"{API_BASE}/bill/{CONGRESS_NUMBER}/{bt}"
+            params = {"limit": LIST_PAGE, "offset": offset, "sort": "updateDate desc"}
+            payload = session_get_json(url, params, self.limiter, endpoint="list")
+            items = updater.parse_list_items(payload)
+            if not items:
+                break
+            oldest_on_page = None
+            for item in items:
+                upd = item.get("updateDate") or ""
+                newest = max(newest, upd)
+                oldest_on_page = upd if oldest_on_page is None else min(oldest_on_page, upd)
+                bill_id = f"{item['type'].upper()}_{item['number']}"
+                existing = self.db.get(bill_id)
+                cg = updater.build_from_list_item(item, existing)
+                if existing is None:
+                    self.db[bill_id] = create_new_bill_entry(cg)
+                    new += 1
+                elif existing["congressGovData"].get("contentHash") != cg["contentHash"]:
+                    self.db[bill_id] = merge_bill_data(existing, cg)
+                    changed += 1
+                else:
+                    continue
+                # new or moved: enrich right away, then it falls into the normal decay
+                self.schedule.set("bill", bill_id, time.time())
+            # newest-first: once a page reaches bills older than the watermark we're caught up
+            if watermark and oldest_on_page is not None and oldest_on_page < watermark:
+                break
+            if len(items) < LIST_PAGE:
+                break
+            offset += LIST_PAGE
+        self.schedule.watermarks[bt] = newest
+        self.stats["list_polls"] += 1
+        self.stats["new"] += new
+        self.stats["changed"] += changed
+        if new or changed:
+            self.dirty = True
+            print(f"[Daemon] List {bt.upper()}: {new} new, {changed} changed")
+
+    # ---- per-bill refresh ----
+    def refresh_bill(self, bill_id: str):
+        tprefix, number = bill_id.split("_", 1)
+        base = f"{API_BASE}/bill/{CONGRESS_NUMBER}/{tprefix.lower()}/{number}"
+        entry = self.db[bill_id]
+        detail_json = session_get_json(base, None, self.limiter, endpoint="detail")
+        cg = apply_detail_activity(entry, detail_json)
+        entry = merge_bill_data(entry, cg)
+        if updater._needs_committees(entry):
+            latest_text = cg.get("latestActionText")
+            committees_json = session_get_json(f"{base}/committees", None, self.limiter, endpoint="committees")
+            cg = updater.apply_committees(entry, updater.parse_committees(committees_json, latest_text))
+            entry = merge_bill_data(entry, cg)
+        self.db[bill_id] = entry
+        return entry
+
+    def _run_bill(self, bill_id: str) -> tuple[str, float | None, bool]:
+        """Returns (bill_id, next due time or None if the bill is gone, failed?)."""
+        if bill_id not in self.db:
+            return bill_id, None, False
+        try:
+            entry = self.refresh_bill(bill_id)
+        except FetchError as e:
+            self.dlq.add("daemon", bill_id, e)
+            return bill_id, time.time() + FAILED_RETRY_SECONDS, True
+        self.dlq.resolve("daemon", bill_id)
+        return bill_id, time.time() + poll_interval_seconds(entry["congressGovData"]), False
+
+    # ---- persistence ----
+    def save(self, force: bool = False):
+        if not force and (not self.dirty or time.time() - self.last_save < DAEMON_SAVE_MINUTES * 60):
+            return
+        if self.dirty:
+            self.persist(self.db)
+        self.schedule_path.parent.mkdir(parents=True, exist_ok=True)
+        json_codec.write_file_atomic(self.schedule.to_dict(), self.schedule_path)
+        self.dlq.save()
+        self.dirty = False
+        self.last_save = time.time()
+        s = self.stats
+        print(f"[Daemon] Saved. polled={s['bills_polled']} new={s['new']} changed={s['changed']} "
+              f"failed={s['failed']} scheduled={len(self.schedule.due)}")
+
+    # ---- main loop ----
+    def run(self, duration_minutes: float = 0.0):
+        started = time.time()
+        deadline = started + duration_minutes * 60 if duration_minutes else None
+        batch_max = max(1, self.workers * 4)
+        print(f"[Daemon] Started: {len(self.db)} bills, {len(self.schedule.due)} scheduled items, "
+              f"types={','.join(self.types)}")
+        with ThreadPoolExecutor(max_workers=self.workers) as ex:
+            while not self.stop.is_set():
+                now = time.time()
+                if deadline and now >= deadline:
+                    break
+                due = self.schedule.pop_due(now, batch_max)
+                if not due:
+                    self.save()
+                    nxt = self.schedule.peek_time()
+                    wait = 30.0 if nxt is None else min(max(nxt - now, 0.05), 30.0)
+                    if deadline:
+                        wait = min(wait, max(deadline - now, 0.0))
+                    self.stop.wait(wait)
+                    continue
+
+                for kind, key in due:
+                    if kind == "list":
+                        try:
+                            self.poll_list(key)
+                        except FetchError as e:
+                            print(f"[Daemon] List {key.upper()} poll failed: {e}")
+                        self.schedule.set("list", key, time.time() + DAEMON_LIST_POLL_MINUTES * 60)
+
+                bill_ids = [key for kind, key in due if kind == "bill"]
+                for bill_id, next_due, failed in ex.map(self._run_bill, bill_ids):
+                    if next_due is None:
+                        continue
+                    self.stats["bills_polled"] += 1
+                    self.stats["failed"] += int(failed)
+                    self.schedule.set("bill", bill_id, next_due)
+                if bill_ids:
+                    self.dirty = True
+                self.save()
+        self.save(force=True)
+        METRICS.record_phase("daemon", self.stats["bills_polled"], time.time() - started, **self.stats)
+
+
+def run_daemon(db: dict, types: list[str], workers: int, qps: float, persist, dlq, duration_minutes: float = 0.0):
+    daemon = Daemon(db, types, workers, qps, persist, dlq)
+
+    def _graceful(signum, _frame):
+        print(f"\n[Daemon] Signal {signum}: finishing current batch and saving…")
+        daemon.stop.set()
+
+    signal.signal(signal.SIGTERM, _graceful)
+    try:
+        daemon.run(duration_minutes)
+    except KeyboardInterrupt:
+        print("\n[Daemon] Interrupted; saving…")
+        daemon.save(force=True)
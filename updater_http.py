@@ -0,0 +1,274 @@
+# updater_http.py
+# HTTP layer for updater.py: rate limiter, error classification, full-jitter
+# retries under a run-wide retry budget, and a circuit breaker shared by all workers.
+
+import random
+import threading
+import time
+
+import requests
+
+from config import (
+    CONGRESS_API_KEY,
+    HTTP_RETRIES,
+    RETRY_BASE_SECONDS,
+    RETRY_CAP_SECONDS,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_MIN,
+    BREAKER_THRESHOLD,
+    BREAKER_COOLDOWN_SECONDS,
+)
+import json_codec
+from updater_metrics import Metrics, endpoint_of
+
+# One collector per process; every limiter and request reports into it.
+METRICS = Metrics()
+
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+# =========================
+# Errors
+# =========================
+
+class FetchError(Exception):
+    """A request that did not yield a usable payload. `retryable` says whether trying later may help."""
+    def __init__(self, message: str, url: str, status: int | None = None, retryable: bool = True,
+                 retry_after: float | None = None):
+        super().__init__(message)
+        self.url = url
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+class PermanentError(FetchError):
+    def __init__(self, message, url, status=None):
+        super().__init__(message, url, status=status, retryable=False)
+
+class RetryableError(FetchError):
+    pass
+
+def _retry_after_seconds(resp) -> float | None:
+    val = resp.headers.get("Retry-After") if resp is not None else None
+    try:
+        return max(0.0, float(val)) if val is not None else None
+    except ValueError:
+        return None
+
+def classify_response(url: str, resp) -> FetchError | None:
+    """None for 2xx; otherwise a RetryableError/PermanentError describing the status."""
+    code = resp.status_code
+    if 200 <= code < 300:
+        return None
+    if code in RETRYABLE_STATUS:
+        return RetryableError(f"Transient HTTP {code}", url, status=code, retry_after=_retry_after_seconds(resp))
+    if code >= 500:
+        return RetryableError(f"HTTP {code}", url, status=code)
+    return PermanentError(f"HTTP {code}", url, status=code)
+
+def classify_exception(url: str, exc: Exception) -> FetchError:
+    if isinstance(exc, FetchError):
+        return exc
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return RetryableError(f"{type(exc).__name__}: {exc}", url)
+    if isinstance(exc, (requests.exceptions.InvalidURL, requests.exceptions.MissingSchema)):
+        return PermanentError(f"{type(exc).__name__}: {exc}", url)
+    return RetryableError(f"{type(exc).__name__}: {exc}", url)
+
+# =========================
+# Rate Limiter
+# =========================
+
+class RateLimiter:
+    def __init__(self, qps: float):
+        self.qps = max(qps, 0.1)
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+    def wait(self):
+        entered = time.perf_counter()
+        slept = 0.0
+        with self.lock:
+            now = time.perf_counter()
+            if now < self.next_time:
+                slept = self.next_time - now
+                time.sleep(slept)
+                now = time.perf_counter()
+            self.next_time = now + 1.0 / self.qps
+        METRICS.record_limiter_wait(time.perf_counter() - entered, slept)
+
+# =========================
+# Retry budget + circuit breaker
+# =========================
+
+class RetryBudget:
+    """
+    Run-wide cap on retries: allowed while retries <= min_retries + ratio * first_attempts.
+    Keeps total load bounded at ~(1 + ratio)x during an outage instead of `retries`x.
+    """
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_retries: int = RETRY_BUDGET_MIN):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.lock = threading.Lock()
+        self.first_attempts = 0
+        self.retries = 0
+
+    def record_first_attempt(self):
+        with self.lock:
+            self.first_attempts += 1
+
+    def try_spend(self) -> bool:
+        with self.lock:
+            if self.retries + 1 > self.min_retries + self.ratio * self.first_attempts:
+                return False
+            self.retries += 1
+            return True
+
+class CircuitBreaker:
+    """
+    Trips after `threshold` consecutive failures from any worker. While open every
+    caller of before_request() blocks until the cooldown ends; then a single probe
+    request goes out (half-open). Success closes the breaker, failure re-opens it
+    with a doubled cooldown (capped at 8x).
+    """
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.threshold = max(1, threshold)
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.cond = threading.Condition()
+        self.failures = 0
+        self.state = "closed"        # closed | open | half_open
+        self.open_until = 0.0
+        self.probe_out = False
+
+    def before_request(self):
+        with self.cond:
+            while True:
+                if self.state == "closed":
+                    return
+                now = time.monotonic()
+                if self.state == "open":
+                    if now < self.open_until:
+                        self.cond.wait(self.open_until - now)
+                        continue
+                    self.state = "half_open"
+                if self.state == "half_open" and not self.probe_out:
+                    self.probe_out = True
+                    return
+                self.cond.wait(1.0)
+
+    def record_success(self):
+        with self.cond:
+            self.failures = 0
+            if self.state != "closed":
+                print("[HTTP] Circuit closed; resuming all workers.")
+            self.state = "closed"
+            self.cooldown = self.base_cooldown
+            self.probe_out = False
+            self.cond.notify_all()
+
+    def record_failure(self):
+        with self.cond:
+            self.failures += 1
+            if self.state == "half_open" or (self.state == "closed" and self.failures >= self.threshold):
+                if self.state == "half_open":
+                    self.cooldown = min(self.cooldown * 2.0, self.base_cooldown * 8.0)
+                self.state = "open"
+                self.probe_out = False
+                # scaled like every other voluntary wait: fast replay goes straight to the probe
+                wait = self.cooldown * SLEEP_SCALE
+                self.open_until = time.monotonic() + wait
+                METRICS.record_event("breaker_open")
+                print(f"[HTTP] Circuit open after {self.failures} consecutive failures; "
+                      f"pausing all workers for {wait:.0f}s.")
+                self.cond.notify_all()
+
+RETRY_BUDGET = RetryBudget()
+BREAKER = CircuitBreaker()
+
+def reset_resilience(budget: RetryBudget | None = None, breaker: CircuitBreaker | None = None):
+    """Swap in fresh budget/breaker (new run in the same process, benchmarks)."""
+    global RETRY_BUDGET, BREAKER
+    RETRY_BUDGET = budget or RetryBudget()
+    BREAKER = breaker or CircuitBreaker()
+
+def full_jitter(attempt: int, base: float = RETRY_BASE_SECONDS, cap: float = RETRY_CAP_SECONDS) -> float:
+    """AWS-style full jitter: U(0, min(cap, base * 2^(attempt-1)))."""
+    return random.uniform(0.0, min(cap, base * (2 ** (attempt - 1))))
+
+# =========================
+# GET JSON
+# =========================
+
+session = requests.Session()
+SLEEP_SCALE = 1.0   # 0 in fast replay: skip backoff, page pauses and breaker cooldowns
+
+def install_session(new_session, sleep_scale: float = 1.0):
+    """Swap the transport (recording/replay sessions from cassette.py) and scale voluntary sleeps."""
+    global session, SLEEP_SCALE
+    session = new_session
+    SLEEP_SCALE = sleep_scale
+
+def pause(seconds: float):
+    """Voluntary delay (between list pages etc.), skipped in fast replay."""
+    if SLEEP_SCALE > 0:
+        time.sleep(seconds * SLEEP_SCALE)
+
+def session_get_json(url: str, params: dict | None, limiter: RateLimiter, retries: int = HTTP_RETRIES,
+                     timeout: int = 30, endpoint: str | None = None, charge=None):
+    """
+    GET url and decode JSON. Permanent errors (4xx, bad JSON) raise PermanentError at once;
+    transient ones are retried with full jitter while the run-wide budget allows, then
+    raise RetryableError. charge() -> bool is called before each retry (the caller's
+    request cap, e.g. --budget); False stops retrying.
+    """
+    if params is None:
+        params = {}
+    params = dict(params)
+    params["format"] = "json"
+    params["api_key"] = CONGRESS_API_KEY
+    endpoint = endpoint or endpoint_of(url)
+
+    RETRY_BUDGET.record_first_attempt()
+    breaker = BREAKER
+    for attempt in range(1, retries + 1):
+        breaker.before_request()
+        limiter.wait()
+        t0 = time.perf_counter()
+        try:
+            resp = session.get(url, params=params, timeout=timeout)
+        except Exception as e:
+            METRICS.record_request(endpoint, time.perf_counter() - t0, error=type(e).__name__, attempt=attempt)
+            err = classify_exception(url, e)
+        else:
+            METRICS.record_request(endpoint, time.perf_counter() - t0, status=resp.status_code, attempt=attempt)
+            err = classify_response(url, resp)
+            if err is None:
+                try:
+                    payload = json_codec.loads(resp.content)
+                except ValueError as e:
+                    err = PermanentError(f"Bad JSON: {e}", url, status=resp.status_code)
+                else:
+                    breaker.record_success()
+                    return payload
+
+        if not err.retryable:
+            # The server answered; the connection is healthy even if this bill isn't
+            breaker.record_success()
+            raise err
+        breaker.record_failure()
+        if attempt == retries:
+            raise err
+        # the request cap first: a retry it denies mustn't spend a run-wide retry token
+        if charge is not None and not charge():
+            METRICS.record_event("request_cap_denied")
+            raise RetryableError(f"{err} (run request cap reached)", url, status=err.status)
+        if not RETRY_BUDGET.try_spend():
+            METRICS.record_event("retry_budget_denied")
+            raise RetryableError(f"{err} (retry budget exhausted)", url, status=err.status)
+
+        delay = full_jitter(attempt)
+        if err.retry_after is not None:
+            delay = max(delay, min(err.retry_after, RETRY_CAP_SECONDS * 4))
+        delay *= SLEEP_SCALE
+        time.sleep(delay)
+        METRICS.record_backoff(delay)
+    raise RetryableError("Exhausted retries", url)
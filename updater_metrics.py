@@ -0,0 +1,250 @@
+# updater_metrics.py
+# Run telemetry for updater.py: per-endpoint request counts, latency histograms,
+# status codes, retries, and rate-limiter wait accounting.
+# Emits a JSON run report and (optionally) a Prometheus text-format file.
+
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+import json_codec
+
+# Latency bucket upper bounds in seconds (Prometheus-style, +Inf implied)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def endpoint_of(url: str) -> str:
+    """Map a Congress.gov API URL to list | detail | committees | other."""
+    path = url.split("?", 1)[0].rstrip("/")
+    parts = path.split("/bill/", 1)
+    if len(parts) != 2:
+        return "other"
+    segs = parts[1].split("/")   # congress / type [/ number [/ sub]]
+    if len(segs) == 2:
+        return "list"
+    if len(segs) == 3:
+        return "detail"
+    if len(segs) == 4 and segs[3] == "committees":
+        return "committees"
+    return "other"
+
+
+def quantile(sorted_vals: list[float], q: float) -> float | None:
+    """Nearest-rank quantile of an already-sorted list."""
+    if not sorted_vals:
+        return None
+    idx = min(len(sorted_vals) - 1, max(0, int(round(q * (len(sorted_vals) - 1)))))
+    return sorted_vals[idx]
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram that also keeps raw samples for quantiles."""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.samples: list[float] = []
+
+    def observe(self, value: float):
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+        self.samples.append(value)
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        out, running = [], 0
+        for le, c in zip(list(self.buckets) + ["+Inf"], self.counts):
+            running += c
+            out.append((str(le), running))
+        return out
+
+    def summary(self) -> dict:
+        vals = sorted(self.samples)
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.sum, 6),
+            "mean_seconds": round(self.sum / self.count, 6) if self.count else None,
+            "p50_seconds": quantile(vals, 0.50),
+            "p90_seconds": quantile(vals, 0.90),
+            "p99_seconds": quantile(vals, 0.99),
+            "max_seconds": vals[-1] if vals else None,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0          # HTTP attempts (including retries)
+        self.retries = 0           # attempts beyond the first
+        self.errors = Counter()    # exception class name -> count (no response)
+        self.status = Counter()    # HTTP status code -> count
+        self.latency = Histogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "status_codes": {str(k): v for k, v in sorted(self.status.items())},
+            "errors": dict(self.errors),
+            "latency": self.latency.summary(),
+        }
+
+
+class Metrics:
+    """Thread-safe collector shared by every worker in a run."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = datetime.now(timezone.utc)
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.limiter_waits = 0
+        self.limiter_wait_seconds = 0.0    # total time inside RateLimiter.wait (lock + sleep)
+        self.limiter_sleep_seconds = 0.0   # time actually spent sleeping for the QPS cap
+        self.backoff_sleep_seconds = 0.0   # time spent sleeping between retries
+        self.events = Counter()            # retry_budget_denied, breaker_open, dead_lettered, ...
+        self.phases: list[dict] = []
+        self.meta: dict = {}
+
+    def _ep(self, endpoint: str) -> EndpointStats:
+        st = self.endpoints.get(endpoint)
+        if st is None:
+            st = self.endpoints[endpoint] = EndpointStats()
+        return st
+
+    # ---- recording ----
+    def record_limiter_wait(self, waited: float, slept: float):
+        with self.lock:
+            self.limiter_waits += 1
+            self.limiter_wait_seconds += waited
+            self.limiter_sleep_seconds += slept
+
+    def record_request(self, endpoint: str, latency: float, status: int | None = None,
+                       error: str | None = None, attempt: int = 1):
+        with self.lock:
+            st = self._ep(endpoint)
+            st.requests += 1
+            if attempt > 1:
+                st.retries += 1
+            st.latency.observe(latency)
+            if status is not None:
+                st.status[status] += 1
+            if error:
+                st.errors[error] += 1
+
+    def record_backoff(self, seconds: float):
+        with self.lock:
+            self.backoff_sleep_seconds += seconds
+
+    def record_event(self, name: str, n: int = 1):
+        with self.lock:
+            self.events[name] += n
+
+    def record_phase(self, name: str, bills: int, seconds: float, **extra):
+        with self.lock:
+            self.phases.append({"phase": name, "bills": bills,
+                                "seconds": round(seconds, 3), **extra})
+
+    # ---- reporting ----
+    def to_dict(self) -> dict:
+        with self.lock:
+            finished = datetime.now(timezone.utc)
+            total_requests = sum(s.requests for s in self.endpoints.values())
+            total_retries = sum(s.retries for s in self.endpoints.values())
+            status = Counter()
+            for s in self.endpoints.values():
+                status.update(s.status)
+            return {
+                "startedAt": self.started_at.isoformat(timespec="seconds"),
+                "finishedAt": finished.isoformat(timespec="seconds"),
+                "wallSeconds": round((finished - self.started_at).total_seconds(), 3),
+                "meta": dict(self.meta),
+                "phases": list(self.phases),
+                "totals": {
+                    "requests": total_requests,
+                    "retries": total_retries,
+                    "status_codes": {str(k): v for k, v in sorted(status.items())},
+                    "limiter_waits": self.limiter_waits,
+                    "limiter_wait_seconds": round(self.limiter_wait_seconds, 3),
+                    "limiter_sleep_seconds": round(self.limiter_sleep_seconds, 3),
+                    "backoff_sleep_seconds": round(self.backoff_sleep_seconds, 3),
+                    "events": dict(self.events),
+                },
+                "endpoints": {k: v.to_dict() for k, v in sorted(self.endpoints.items())},
+            }
+
+    def to_prometheus(self) -> str:
+        with self.lock:
+            lines = []
+
+            def metric(name, mtype, help_text):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {mtype}")
+
+            eps = sorted(self.endpoints.items())
+
+            metric("hillwatch_http_requests_total", "counter", "HTTP attempts by endpoint and status.")
+            for ep, st in eps:
+                for code, n in sorted(st.status.items()):
+                    lines.append(f'hillwatch_http_requests_total{{endpoint="{ep}",status="{code}"}} {n}')
+                for err, n in sorted(st.errors.items()):
+                    lines.append(f'hillwatch_http_requests_total{{endpoint="{ep}",status="error",error="{err}"}} {n}')
+
+            metric("hillwatch_http_retries_total", "counter", "Retry attempts by endpoint.")
+            for ep, st in eps:
+                lines.append(f'hillwatch_http_retries_total{{endpoint="{ep}"}} {st.retries}')
+
+            metric("hillwatch_http_request_duration_seconds", "histogram", "Request latency by endpoint.")
+            for ep, st in eps:
+                for le, n in st.latency.cumulative():
+                    lines.append(f'hillwatch_http_request_duration_seconds_bucket{{endpoint="{ep}",le="{le}"}} {n}')
+                lines.append(f'hillwatch_http_request_duration_seconds_sum{{endpoint="{ep}"}} {st.latency.sum:.6f}')
+                lines.append(f'hillwatch_http_request_duration_seconds_count{{endpoint="{ep}"}} {st.latency.count}')
+
+            metric("hillwatch_limiter_waits_total", "counter", "Calls to RateLimiter.wait.")
+            lines.append(f"hillwatch_limiter_waits_total {self.limiter_waits}")
+            metric("hillwatch_limiter_wait_seconds_total", "counter", "Time spent in RateLimiter.wait (lock + sleep).")
+            lines.append(f"hillwatch_limiter_wait_seconds_total {self.limiter_wait_seconds:.6f}")
+            metric("hillwatch_limiter_sleep_seconds_total", "counter", "Time slept to honour the QPS cap.")
+            lines.append(f"hillwatch_limiter_sleep_seconds_total {self.limiter_sleep_seconds:.6f}")
+            metric("hillwatch_backoff_sleep_seconds_total", "counter", "Time slept between retries.")
+            lines.append(f"hillwatch_backoff_sleep_seconds_total {self.backoff_sleep_seconds:.6f}")
+
+            metric("hillwatch_events_total", "counter", "Resilience events (budget denials, breaker trips, dead letters).")
+            for name, n in sorted(self.events.items()):
+                lines.append(f'hillwatch_events_total{{event="{name}"}} {n}')
+
+            metric("hillwatch_run_start_timestamp_seconds", "gauge", "Unix time the run started.")
+            lines.append(f"hillwatch_run_start_timestamp_seconds {self.started_at.timestamp():.0f}")
+            return "\n".join(lines) + "\n"
+
+    def write_json_report(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        json_codec.write_file_atomic(self.to_dict(), path)
+
+    def write_prometheus(self, path):
+        # temp + replace so a textfile collector never scrapes a half-written file
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def print_summary(self):
+        d = self.to_dict()
+        t = d["totals"]
+        print(f"\n[Metrics] requests={t['requests']} retries={t['retries']} "
+              f"status={t['status_codes']} limiter_wait={t['limiter_wait_seconds']:.1f}s "
+              f"(sleep {t['limiter_sleep_seconds']:.1f}s) backoff={t['backoff_sleep_seconds']:.1f}s"
+              + (f" events={t['events']}" if t["events"] else ""))
+        for ep, st in d["endpoints"].items():
+            lat = st["latency"]
+            p50 = lat["p50_seconds"] or 0.0
+            p99 = lat["p99_seconds"] or 0.0
+            print(f"[Metrics] {ep:10} n={st['requests']:6} retries={st['retries']:4} "
+                  f"p50={p50 * 1000:7.1f}ms p99={p99 * 1000:7.1f}ms status={st['status_codes']}")
@@ -0,0 +1,135 @@
+# updater_plan.py
+# `updater.py --dry-run`: what a run would do, without touching the network or the DB.
+#
+# Work per enrichment phase comes from the same staleness predicates the engine uses
+# (updater.plan_work), so the plan matches what a real run would pick. List pages are
+# estimated from the bills per type already in the DB. Wall time uses the mean latency
+# of the last run report when there is one.
+
+import math
+import time
+
+from config import API_HOURLY_QUOTA
+import json_codec
+import updater
+
+LIST_PAGE = 250
+LIST_PAUSE_SECONDS = 0.2          # run_phase_list sleeps this between pages
+DEFAULT_LATENCY_SECONDS = 0.4     # used when no previous run report has the endpoint
+
+
+def _latencies(report_path) -> dict[str, float]:
+    """Mean request latency per endpoint from a previous JSON run report."""
+    if not report_path:
+        return {}
+    try:
+        report = json_codec.load_file(report_path)
+    except (OSError, ValueError):
+        return {}
+    out = {}
+    for name, ep in (report.get("endpoints") or {}).items():
+        mean = (ep.get("latency") or {}).get("mean_seconds")
+        if mean:
+            out[name] = mean
+    return out
+
+
+def plan_run(db: dict, types: list[str], phases: list[str], workers: int, qps: float,
+             limit: int | None = None, budget: int | None = None, deadline: float | None = None,
+             failed: dict[str, list[str]] | None = None, report_path=None) -> dict:
+    """Returns {"phases": [...], "requests", "seconds", ...}; no I/O besides reading report_path."""
+    lat = _latencies(report_path)
+    rows = []
+
+    if "list" in phases:
+        per_type = {bt: 0 for bt in types}
+        for bill_id in db:
+            bt = bill_id.split("_", 1)[0].lower()
+            if bt in per_type:
+                per_type[bt] += 1
+        # every full or partial page, then the empty page that ends the loop
+        pages = sum(math.ceil(n / LIST_PAGE) + 1 for n in per_type.values())
+        latency = lat.get("list", DEFAULT_LATENCY_SECONDS)
+        # list pages are fetched one at a time
+        per_page = max(latency + LIST_PAUSE_SECONDS, 1.0 / qps if qps > 0 else 0.0)
+        rows.append({"phase": "list", "bills": sum(per_type.values()), "requests": pages,
+                     "seconds": pages * per_page, "latency": latency})
+
+    enrich = [name for name in updater.PHASES if name in phases]
+    if enrich:
+        work = updater.plan_work(db, types, enrich, failed)
+        bill_ids = list(work)
+        if limit:
+            bill_ids = updater.prioritize(db, bill_ids)[:limit]
+        for name in enrich:
+            n = sum(1 for bid in bill_ids if name in work[bid])
+            latency = lat.get(name, DEFAULT_LATENCY_SECONDS)
+            # workers in flight vs. the shared limiter, whichever binds first
+            rate = min(qps, workers / latency) if qps > 0 else workers / latency
+            rows.append({"phase": name, "bills": n, "requests": n,
+                         "seconds": n / rate if n else 0.0, "latency": latency})
+
+    requests = sum(r["requests"] for r in rows)
+    seconds = sum(r["seconds"] for r in rows)
+    capped_by = None
+    enrich_reqs = sum(r["requests"] for r in rows if r["phase"] != "list")
+    if budget is not None and enrich_reqs > budget:
+        scale = budget / enrich_reqs
+        for r in rows:
+            if r["phase"] != "list":
+                r["requests"] = math.floor(r["requests"] * scale)
+                r["seconds"] *= scale
+        requests = sum(r["requests"] for r in rows)
+        seconds = sum(r["seconds"] for r in rows)
+        capped_by = "budget"
+    if deadline and seconds > deadline * 60:
+        capped_by = "deadline"
+    return {
+        "phases": rows,
+        "requests": requests,
+        "seconds": min(seconds, deadline * 60) if deadline else seconds,
+        "uncapped_seconds": seconds,
+        "capped_by": capped_by,
+        "quota": API_HOURLY_QUOTA,
+    }
+
+
+def print_plan(plan: dict, workers: int, qps: float, elapsed: float):
+    from updater import _fmt_hhmmss
+    print(f"=== HillWatch 2 — Dry run (workers={workers}, qps={qps}) ===")
+    print(f"{'phase':12} {'bills':>7} {'requests':>9} {'latency':>8} {'est. time':>10}")
+    for r in plan["phases"]:
+        print(f"{r['phase']:12} {r['bills']:7} {r['requests']:9} {r['latency'] * 1000:6.0f}ms "
+              f"{_fmt_hhmmss(r['seconds']):>10}")
+    print(f"{'total':12} {'':7} {plan['requests']:9} {'':8} {_fmt_hhmmss(plan['seconds']):>10}")
+    if plan["capped_by"] == "deadline":
+        print(f"  (stops at the deadline; the full run would take {_fmt_hhmmss(plan['uncapped_seconds'])})")
+    elif plan["capped_by"] == "budget":
+        print("  (stops when the request budget is spent; the rest waits for the next run)")
+
+    quota = plan["quota"]
+    share = plan["requests"] / quota if quota else 0.0
+    print(f"\nHourly API quota: {quota} requests → this run uses {share:.0%} of one hour's quota.")
+    if quota and qps * 3600 > quota and plan["seconds"] > 3600:
+        safe = quota / 3600
+        print(f"  ! --qps {qps} sustained for over an hour exceeds the quota; expect 429s. "
+              f"Use --qps {safe:.2f} or split the run with --budget {quota}.")
+    elif plan["requests"] > quota:
+        print(f"  ! More requests than one hour allows; needs ≥{math.ceil(plan['requests'] / quota)} "
+              f"quota windows (e.g. --budget {quota} per hourly run).")
+    print(f"\nPlanned in {elapsed * 1000:.0f} ms. Nothing was fetched or written.")
+
+
+def run_dry(args, db: dict, types: list[str]):
+    started = time.perf_counter()
+    failed = None
+    if args.retry_failed:
+        dlq = updater.DeadLetterQueue()
+        phases = [n for n in updater.PHASES if not args.phases or n in args.phases]
+        failed = {n: dlq.bill_ids(n) for n in phases}
+    else:
+        phases = args.phases or ["list", *updater.PHASES]
+    plan = plan_run(db, types, phases, args.workers, args.qps, limit=args.limit, budget=args.budget,
+                    deadline=args.deadline, failed=failed, report_path=args.metrics_json)
+    print_plan(plan, args.workers, args.qps, time.perf_counter() - started)
+    return plan